@@ -1,9 +1,17 @@
 """Sample client to interact with the Workflow Orchestration System."""
+import json
 import requests
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from shared.models import Worker, Workflow
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from shared.enums import WorkflowStatus
+from shared.models import (Worker, Workflow, WorkerListAdapter,
+                           WorkflowAdapter, WorkflowListAdapter)
+
+# Upper bound on concurrent keep-alive connections to the coordinator. The
+# client only ever talks to one host, so a single pool is enough.
+_POOL_MAXSIZE = 32
 
 
 class WorkflowClient:
@@ -12,12 +20,63 @@ class WorkflowClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         """Initialize the client."""
         self.base_url = base_url
+        # One pooled session so repeated and concurrent calls reuse
+        # keep-alive connections instead of opening a socket per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1,
+                              pool_maxsize=_POOL_MAXSIZE,
+                              pool_block=False)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self) -> "WorkflowClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get_health(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Get the coordinator's health status.
+        
+        Args:
+            timeout: Seconds to wait for a response, or None to wait forever
+            
+        Returns:
+            Dict with the health status and workflow/worker counts
+            
+        Raises:
+            requests.HTTPError: If the API request fails
+        """
+        response = self._session.get(f"{self.base_url}/health",
+                                     timeout=timeout)
+        response.raise_for_status()
+        return response.json()
 
     def get_workers(self) -> List[Worker]:
         """Get list of connected workers."""
-        response = requests.get(f"{self.base_url}/workers")
+        response = self._session.get(f"{self.base_url}/workers")
+        response.raise_for_status()
+        return WorkerListAdapter.validate_json(response.content)
+
+    def get_workers_etag(self) -> str:
+        """Get the ETag of the worker list without fetching it.
+        
+        The ETag changes only when workers join or leave. It is a weak
+        validator, since the statuses in the list can change without it.
+        
+        Returns:
+            The worker list's weak ETag
+            
+        Raises:
+            requests.HTTPError: If the API request fails
+        """
+        response = self._session.head(f"{self.base_url}/workers")
         response.raise_for_status()
-        return [Worker.model_validate(worker) for worker in response.json()]
+        return response.headers["ETag"]
 
     def submit_workflow_from_yaml(self, yaml_path: str) -> Workflow:
         """Submit a workflow from a YAML file.
@@ -36,13 +95,66 @@ class WorkflowClient:
         if not path.exists():
             raise FileNotFoundError(f"YAML file not found: {yaml_path}")
 
-        yaml_content = path.read_text()
+        return self.submit_workflow_yaml(path.read_text())
 
-        response = requests.post(f"{self.base_url}/workflows/from-yaml",
-                                 data=yaml_content,
-                                 headers={"Content-Type": "text/plain"})
+    def submit_workflow_yaml(self, yaml_content: str) -> Workflow:
+        """Submit a workflow from an in-memory YAML definition.
+        
+        Args:
+            yaml_content: YAML workflow definition text
+            
+        Returns:
+            Workflow: The created workflow
+            
+        Raises:
+            requests.HTTPError: If the API request fails
+        """
+        response = self._session.post(f"{self.base_url}/workflows/from-yaml",
+                                      data=yaml_content,
+                                      headers={"Content-Type": "text/plain"})
         response.raise_for_status()
-        return Workflow.model_validate(response.json())
+        return WorkflowAdapter.validate_json(response.content)
+
+    def submit_workflows_yaml(self, yaml_contents: List[str]) -> List[str]:
+        """Submit several in-memory YAML workflow definitions in one request.
+        
+        Args:
+            yaml_contents: YAML workflow definition texts
+            
+        Returns:
+            IDs of the created workflows, in submission order
+            
+        Raises:
+            requests.HTTPError: If the API request fails; an invalid
+                definition rejects the whole batch
+        """
+        response = self._session.post(f"{self.base_url}/workflows/batch",
+                                      json={"workflows": yaml_contents})
+        response.raise_for_status()
+        return response.json()["workflow_ids"]
+
+    def submit_and_start_workflows_yaml(self,
+                                        yaml_contents: List[str]) -> List[str]:
+        """Submit and start several YAML workflow definitions in one request.
+        
+        Args:
+            yaml_contents: YAML workflow definition texts
+            
+        Returns:
+            IDs of the created and started workflows, in submission order
+            
+        Raises:
+            requests.HTTPError: If the API request fails. An invalid or
+                unstartable definition rejects the whole batch; a start that
+                fails later leaves the batch created and partly started.
+        """
+        response = self._session.post(f"{self.base_url}/workflows/batch",
+                                      json={
+                                          "workflows": yaml_contents,
+                                          "start": True
+                                      })
+        response.raise_for_status()
+        return response.json()["workflow_ids"]
 
     def start_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Start a workflow execution.
@@ -56,7 +168,7 @@ class WorkflowClient:
         Raises:
             requests.HTTPError: If the API request fails
         """
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/workflows/{workflow_id}/start")
         response.raise_for_status()
         return response.json()
@@ -78,6 +190,22 @@ class WorkflowClient:
         self.start_workflow(workflow.id)
         return workflow
 
+    def submit_and_start_workflow_yaml(self, yaml_content: str) -> Workflow:
+        """Submit an in-memory YAML workflow definition and start it.
+        
+        Args:
+            yaml_content: YAML workflow definition text
+            
+        Returns:
+            Workflow: The created and started workflow
+            
+        Raises:
+            requests.HTTPError: If the API request fails
+        """
+        workflow = self.submit_workflow_yaml(yaml_content)
+        self.start_workflow(workflow.id)
+        return workflow
+
     def get_workflow(self, workflow_id: str) -> Workflow:
         """Get a workflow by ID.
         
@@ -90,9 +218,73 @@ class WorkflowClient:
         Raises:
             requests.HTTPError: If the API request fails (e.g., 404 if not found)
         """
-        response = requests.get(f"{self.base_url}/workflows/{workflow_id}")
+        response = self._session.get(
+            f"{self.base_url}/workflows/{workflow_id}")
         response.raise_for_status()
-        return Workflow.model_validate(response.json())
+        return WorkflowAdapter.validate_json(response.content)
+
+    def get_workflow_status(self, workflow_id: str) -> WorkflowStatus:
+        """Get just the status of a workflow.
+        
+        Cheaper than get_workflow() when polling, since the jobs aren't
+        sent.
+        
+        Args:
+            workflow_id: ID of the workflow to check
+            
+        Returns:
+            WorkflowStatus: The workflow's current status
+            
+        Raises:
+            requests.HTTPError: If the API request fails (e.g., 404 if not found)
+        """
+        response = self._session.get(
+            f"{self.base_url}/workflows/{workflow_id}/status")
+        response.raise_for_status()
+        return WorkflowStatus(response.json()["status"])
+
+    def stream_workflow_events(
+            self,
+            workflow_ids: List[str],
+            timeout: Optional[float] = None
+    ) -> Iterator[Tuple[str, WorkflowStatus]]:
+        """Stream status changes for several workflows.
+        
+        Yields each workflow's current status first, then every change. The
+        stream ends once all the workflows have reached a terminal status.
+        
+        Args:
+            workflow_ids: IDs of the workflows to follow
+            timeout: Seconds to keep streaming before giving up, or None
+            
+        Yields:
+            (workflow_id, status) tuples
+            
+        Raises:
+            TimeoutError: If the stream is still open when timeout expires
+            requests.HTTPError: If the API request fails (e.g., 404 if a
+                workflow is not found)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            with self._session.get(f"{self.base_url}/workflows/events",
+                                   params={"ids": ",".join(workflow_ids)},
+                                   stream=True,
+                                   timeout=timeout) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line.startswith(b"data:"):
+                        event = json.loads(line[5:])
+                        yield event["workflow_id"], WorkflowStatus(
+                            event["status"])
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise TimeoutError
+        except (requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError):
+            # A read timeout mid-stream surfaces as a ConnectionError
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError from None
+            raise
 
     def list_workflows(self) -> List[Workflow]:
         """Get list of all workflows.
@@ -103,9 +295,27 @@ class WorkflowClient:
         Raises:
             requests.HTTPError: If the API request fails
         """
-        response = requests.get(f"{self.base_url}/workflows")
+        response = self._session.get(f"{self.base_url}/workflows")
+        response.raise_for_status()
+        return WorkflowListAdapter.validate_json(response.content)
+
+    def get_workflows_many(self, workflow_ids: List[str]) -> List[Workflow]:
+        """Get several workflows in a single request.
+        
+        Args:
+            workflow_ids: IDs of the workflows to retrieve
+            
+        Returns:
+            The workflows, in the order their IDs were given
+            
+        Raises:
+            requests.HTTPError: If the API request fails or any workflow
+                doesn't exist
+        """
+        response = self._session.get(f"{self.base_url}/workflows",
+                                     params={"ids": ",".join(workflow_ids)})
         response.raise_for_status()
-        return [Workflow.model_validate(wf) for wf in response.json()]
+        return WorkflowListAdapter.validate_json(response.content)
 
     def cancel_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Cancel a running workflow.
@@ -119,7 +329,7 @@ class WorkflowClient:
         Raises:
             requests.HTTPError: If the API request fails
         """
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/workflows/{workflow_id}/cancel")
         response.raise_for_status()
         return response.json()
@@ -136,6 +346,7 @@ class WorkflowClient:
         Raises:
             requests.HTTPError: If the API request fails
         """
-        response = requests.delete(f"{self.base_url}/workflows/{workflow_id}")
+        response = self._session.delete(
+            f"{self.base_url}/workflows/{workflow_id}")
         response.raise_for_status()
         return response.json()
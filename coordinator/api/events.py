@@ -0,0 +1,33 @@
+"""Push event streams for clients watching coordinator state"""
+import asyncio
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from coordinator.core.state_manager import state_manager
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# Resend the current snapshot this often while nothing changes, so dead
+# subscribers are noticed
+_KEEPALIVE = 15.0
+
+
+@router.websocket("/workers")
+async def worker_events(websocket: WebSocket):
+    """Push the registered worker IDs whenever a worker joins or leaves"""
+    # Note: WebSocket endpoints can't use Depends(), so we get dependencies directly
+    state = state_manager()
+
+    await websocket.accept()
+    try:
+        while True:
+            # Take the event before the snapshot so no change slips between
+            changed = state.workers_changed()
+            await websocket.send_json({"workers": list(state.workers)})
+
+            try:
+                await asyncio.wait_for(changed.wait(), _KEEPALIVE)
+            except TimeoutError:
+                pass
+    except WebSocketDisconnect:
+        pass
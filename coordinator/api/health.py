@@ -1,14 +1,45 @@
 """Health check and status endpoints"""
 from fastapi import APIRouter, Depends
 from datetime import datetime, UTC
+from time import monotonic
+from typing import Dict, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from coordinator.core.state_manager import StateManager, state_manager
 from shared.enums import WorkerStatus
 
 router = APIRouter(tags=["health"])
 
+# Health probes can arrive in tight loops, and counting active workers walks
+# every worker, so the counts are reused for this many seconds
+_COUNTS_TTL = 0.1
+# StateManager -> (monotonic expiry time, counts); weak so a replaced
+# StateManager isn't kept alive by its last counts
+_counts_cache: WeakKeyDictionary[StateManager, Tuple[float, Dict[
+    str, int]]] = WeakKeyDictionary()
 
-@router.get("/")
+
+def _health_counts(state: StateManager) -> Dict[str, int]:
+    """Workflow and worker counts, at most _COUNTS_TTL seconds old"""
+    expires_at, counts = _counts_cache.get(state, (0.0, {}))
+    now = monotonic()
+    if now < expires_at:
+        return counts
+
+    counts = {
+        "workflows":
+        len(state.workflows),
+        "workers":
+        len(state.workers),
+        "active_workers":
+        sum(1 for w in state.workers.values()
+            if w.status != WorkerStatus.OFFLINE)
+    }
+    _counts_cache[state] = (now + _COUNTS_TTL, counts)
+    return counts
+
+
+@router.get("/", response_model=Dict[str, str])
 async def root():
     """Health check endpoint"""
     return {
@@ -18,19 +49,12 @@ async def root():
     }
 
 
-@router.get("/health")
+@router.api_route("/health",
+                  methods=["GET", "HEAD"],
+                  response_model=Dict[str, Union[str, int]])
 async def health(state: StateManager = Depends(state_manager)):
-    """Detailed health status"""
-    return {
-        "status":
-        "healthy",
-        "workflows":
-        len(state.workflows),
-        "workers":
-        len(state.workers),
-        "active_workers":
-        len([
-            w for w in state.workers.values()
-            if w.status != WorkerStatus.OFFLINE
-        ])
-    }
+    """Detailed health status
+    
+    The counts may lag changes by up to _COUNTS_TTL seconds.
+    """
+    return {"status": "healthy", **_health_counts(state)}
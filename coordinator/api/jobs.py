@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Optional, Tuple
 from datetime import UTC, datetime
 
-from shared.models import Job, Workflow
+from shared.models import Job, JobBatchUpdate, JobUpdate, Workflow
 from coordinator.core.state_manager import StateManager, state_manager
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -22,8 +22,7 @@ async def _get_workflow_and_job(workflow_id: str, job_id: str,
     if workflow is None:
         raise HTTPException(status_code=404, detail="Workflow not found")
 
-    job_index = next(
-        (i for i, j in enumerate(workflow.jobs) if j.id == job_id), None)
+    job_index = workflow.get_job_index(job_id)
     if job_index is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -31,6 +30,19 @@ async def _get_workflow_and_job(workflow_id: str, job_id: str,
     return workflow, job, job_index
 
 
+def _apply_job_update(workflow: Workflow, job_index: int,
+                      job_update: JobUpdate, now: datetime,
+                      state: StateManager) -> Job:
+    """Replace a workflow's job with a copy carrying the update's fields"""
+    updated_job = workflow.jobs[job_index].model_copy(update={
+        **job_update.model_dump(exclude_unset=True, exclude={"id"}),
+        "updated_at": now
+    })
+    workflow.jobs[job_index] = updated_job
+    state.jobs[updated_job.id] = updated_job
+    return updated_job
+
+
 @router.get("", response_model=List[Job])
 async def list_jobs(workflow_id: Optional[str] = None,
                     state: StateManager = Depends(state_manager)):
@@ -51,15 +63,56 @@ async def get_job(workflow_id: str,
     return job
 
 
+@router.patch("/{workflow_id}", response_model=List[Job])
+async def update_jobs(workflow_id: str,
+                      job_updates: List[JobBatchUpdate],
+                      state: StateManager = Depends(state_manager)):
+    """Update several of a workflow's jobs in one request
+    
+    Each update names a job by ID and changes only the fields it sets, as
+    the single-job PATCH does. If any job is not found or is named twice,
+    none of the updates are applied.
+    """
+    workflow = await state.get_workflow(workflow_id)
+    if workflow is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+
+    job_indexes = []
+    seen = set()
+    for job_update in job_updates:
+        if job_update.id in seen:
+            raise HTTPException(status_code=400,
+                                detail=f"Job {job_update.id} updated twice")
+        seen.add(job_update.id)
+
+        job_index = workflow.get_job_index(job_update.id)
+        if job_index is None:
+            raise HTTPException(status_code=404,
+                                detail=f"Job {job_update.id} not found")
+        job_indexes.append(job_index)
+
+    now = datetime.now(UTC)
+    updated_jobs = [
+        _apply_job_update(workflow, job_index, job_update, now, state)
+        for job_index, job_update in zip(job_indexes, job_updates)
+    ]
+    workflow.updated_at = now
+    return updated_jobs
+
+
 @router.patch("/{workflow_id}/{job_id}", response_model=Job)
 async def update_job(workflow_id: str,
                      job_id: str,
-                     job_update: Job,
+                     job_update: JobUpdate,
                      state: StateManager = Depends(state_manager)):
-    """Update a job's details"""
+    """Update a job's details
+    
+    Only the fields present in the body are changed, so callers don't need
+    to fetch the job first.
+    """
     workflow, _, job_index = await _get_workflow_and_job(workflow_id, job_id, state)
 
-    job_update.updated_at = datetime.now(UTC)
-    workflow.jobs[job_index] = job_update
-    workflow.updated_at = datetime.now(UTC)
-    return job_update
+    now = datetime.now(UTC)
+    updated_job = _apply_job_update(workflow, job_index, job_update, now, state)
+    workflow.updated_at = now
+    return updated_job
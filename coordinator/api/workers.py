@@ -1,6 +1,7 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Response
 from typing import List
 from datetime import datetime, UTC
+import hashlib
 import logging
 
 from shared.models import Worker
@@ -21,10 +22,37 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/workers", tags=["workers"])
 
 
+def _workers_etag(workers: List[Worker]) -> str:
+    """Weak ETag identifying the set of registered workers
+    
+    Worker statuses and heartbeats in the list body can change while the
+    set stays the same, so the validator is weak: equal ETags mean the same
+    workers, not byte-identical responses.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for worker_id in sorted(worker.id for worker in workers):
+        digest.update(worker_id.encode())
+        digest.update(b"\0")
+    return f'W/"{digest.hexdigest()}"'
+
+
 @router.get("", response_model=List[Worker])
-async def list_workers(state: StateManager = Depends(state_manager)):
+async def list_workers(response: Response,
+                       state: StateManager = Depends(state_manager)):
     """List all workers"""
-    return state.list_workers()
+    workers = state.list_workers()
+    response.headers["ETag"] = _workers_etag(workers)
+    return workers
+
+
+@router.head("")
+async def get_workers_etag(state: StateManager = Depends(state_manager)):
+    """Get the worker list's ETag without the list itself
+    
+    The ETag only changes when workers join or leave, so clients can check
+    membership without fetching and comparing the full list.
+    """
+    return Response(headers={"ETag": _workers_etag(state.list_workers())})
 
 
 @router.websocket("/{worker_id}")
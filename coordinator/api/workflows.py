@@ -1,7 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends, Body
-from typing import List
+import asyncio
+import json
+from fastapi import (APIRouter, HTTPException, Depends, Body, Query,
+                     WebSocket, WebSocketDisconnect, status)
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import UTC, datetime
 
+from shared.enums import TERMINAL_WORKFLOW_STATUSES, WorkflowStatus
 from shared.models import Workflow
 from coordinator.utils.workflow_parser import parse_yaml_workflow, WorkflowDefinitionError
 from coordinator.core.state_manager import StateManager, state_manager
@@ -10,6 +15,10 @@ from coordinator.core.workflow_engine import WorkflowEngine
 
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 
+# Resend the current status this often while nothing changes, so dead
+# subscribers are noticed even for workflows that stall
+_STATUS_KEEPALIVE = 15.0
+
 
 async def _get_workflow_or_404(workflow_id: str, state: StateManager) -> Workflow:
     """Get a workflow by ID or raise 404 if not found"""
@@ -34,6 +43,15 @@ async def _add_workflow_to_state(workflow: Workflow,
     return workflow
 
 
+async def _add_parsed_workflow(workflow: Workflow,
+                               state: StateManager) -> Workflow:
+    """Add a workflow parsed from YAML and all its jobs to state"""
+    await _add_workflow_to_state(workflow, state)
+    for job in workflow.jobs:
+        await state.add_job(job)
+    return workflow
+
+
 @router.post("", response_model=Workflow)
 async def create_workflow(workflow: Workflow,
                           state: StateManager = Depends(state_manager)):
@@ -73,16 +91,67 @@ async def create_workflow_from_yaml(
                             detail=f"Invalid workflow definition: {e}")
 
     await _ensure_workflow_not_exists(workflow.id, state)
+    return await _add_parsed_workflow(workflow, state)
 
-    # Add workflow and all its jobs to state
-    await _add_workflow_to_state(workflow, state)
-    for job in workflow.jobs:
-        await state.add_job(job)
 
-    return workflow
+@router.post("/batch", response_model=Dict[str, List[str]])
+async def create_workflows_batch(
+    workflows: List[str] = Body(..., embed=True),
+    start: bool = Body(False, embed=True),
+    state: StateManager = Depends(state_manager),
+    engine: WorkflowEngine = Depends(get_workflow_engine)):
+    """Create several workflows from YAML definitions in one request
+    
+    Every definition is validated before any workflow is created, so an
+    invalid entry or a workflow ID used twice rejects the whole batch. With
+    ``start`` set, each job graph is also checked up front, then each
+    workflow is started once the whole batch has been created.
+    
+    A start can still fail after that check, e.g. if scheduling a job
+    errors. The response is then a 400 naming that workflow, but the batch
+    stays created and the workflows before it stay started; list them with
+    GET /workflows to clean up.
+    """
+    parsed = []
+    for index, yaml_content in enumerate(workflows):
+        try:
+            parsed.append(parse_yaml_workflow(yaml_content))
+        except WorkflowDefinitionError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid workflow definition at index {index}: {e}")
 
+    first_index: Dict[str, int] = {}
+    for index, workflow in enumerate(parsed):
+        first = first_index.setdefault(workflow.id, index)
+        if first != index:
+            raise HTTPException(
+                status_code=400,
+                detail=(f"Duplicate workflow ID '{workflow.id}' "
+                        f"(indices {first}, {index})"))
+        await _ensure_workflow_not_exists(workflow.id, state)
+        if start:
+            try:
+                engine.validate_workflow(workflow)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Workflow at index {index} cannot start: {e}")
 
-@router.post("/{workflow_id}/start")
+    for workflow in parsed:
+        await _add_parsed_workflow(workflow, state)
+
+    if start:
+        for workflow in parsed:
+            if not await engine.start_workflow(workflow.id):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Failed to start workflow {workflow.id}")
+
+    return {"workflow_ids": [workflow.id for workflow in parsed]}
+
+
+@router.post("/{workflow_id}/start", response_model=Dict[str, str])
 async def start_workflow(
     workflow_id: str,
     state: StateManager = Depends(state_manager),
@@ -97,7 +166,7 @@ async def start_workflow(
     return {"message": "Workflow started", "workflow_id": workflow_id}
 
 
-@router.post("/{workflow_id}/cancel")
+@router.post("/{workflow_id}/cancel", response_model=Dict[str, str])
 async def cancel_workflow(
     workflow_id: str,
     state: StateManager = Depends(state_manager),
@@ -114,9 +183,81 @@ async def cancel_workflow(
 
 
 @router.get("", response_model=List[Workflow])
-async def list_workflows(state: StateManager = Depends(state_manager)):
-    """List all workflows"""
-    return state.list_workflows()
+async def list_workflows(
+        ids: Optional[str] = Query(
+            None, description="Comma-separated workflow IDs to fetch"),
+        state: StateManager = Depends(state_manager)):
+    """List all workflows, or only the requested ones in the given order"""
+    if ids is None:
+        return state.list_workflows()
+
+    workflow_ids = dict.fromkeys(wid for wid in ids.split(",") if wid)
+    return [
+        await _get_workflow_or_404(workflow_id, state)
+        for workflow_id in workflow_ids
+    ]
+
+
+async def _workflow_status_events(workflow_ids: List[str],
+                                  state: StateManager) -> AsyncIterator[str]:
+    """Yield server-sent events for status changes until all are terminal"""
+    last_sent: Dict[str, WorkflowStatus] = {}
+    pending = list(workflow_ids)
+
+    # Drop the events taken below once the stream ends, however it ends
+    with state.watching_workflows(workflow_ids):
+        while pending:
+            # Take the events before reading statuses so no change is missed
+            changed = [state.workflow_changed(wid) for wid in pending]
+
+            still_pending = []
+            for workflow_id in pending:
+                workflow = await state.get_workflow(workflow_id)
+                if workflow is None:
+                    continue
+                if last_sent.get(workflow_id) != workflow.status:
+                    last_sent[workflow_id] = workflow.status
+                    event = {
+                        "workflow_id": workflow_id,
+                        "status": workflow.status
+                    }
+                    yield f"data: {json.dumps(event)}\n\n"
+                if workflow.status not in TERMINAL_WORKFLOW_STATUSES:
+                    still_pending.append(workflow_id)
+            if not still_pending:
+                return
+
+            waiters = [
+                asyncio.ensure_future(event.wait()) for event in changed
+            ]
+            try:
+                done, _ = await asyncio.wait(
+                    waiters,
+                    timeout=_STATUS_KEEPALIVE,
+                    return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+            if not done:
+                yield ": keepalive\n\n"
+            pending = still_pending
+
+
+@router.get("/events")
+async def stream_workflow_events(
+        ids: str = Query(..., description="Comma-separated workflow IDs"),
+        state: StateManager = Depends(state_manager)):
+    """Stream workflow status changes as server-sent events
+    
+    Sends each workflow's current status, then every change after it. The
+    stream ends once all requested workflows have reached a terminal status.
+    """
+    workflow_ids = list(dict.fromkeys(wid for wid in ids.split(",") if wid))
+    for workflow_id in workflow_ids:
+        await _get_workflow_or_404(workflow_id, state)
+
+    return StreamingResponse(_workflow_status_events(workflow_ids, state),
+                             media_type="text/event-stream")
 
 
 @router.get("/{workflow_id}", response_model=Workflow)
@@ -126,10 +267,56 @@ async def get_workflow(workflow_id: str,
     return await _get_workflow_or_404(workflow_id, state)
 
 
-@router.delete("/{workflow_id}")
+@router.get("/{workflow_id}/status", response_model=Dict[str, str])
+async def get_workflow_status(workflow_id: str,
+                              state: StateManager = Depends(state_manager)):
+    """Get only a workflow's status, for cheap polling"""
+    workflow = await _get_workflow_or_404(workflow_id, state)
+    return {"workflow_id": workflow_id, "status": workflow.status}
+
+
+@router.delete("/{workflow_id}", response_model=Dict[str, str])
 async def delete_workflow(workflow_id: str,
                           state: StateManager = Depends(state_manager)):
     """Delete a workflow"""
     await _get_workflow_or_404(workflow_id, state)
     await state.remove_workflow(workflow_id)
-    return {"message": "Workflow deleted"}
+    return {"message": "Workflow deleted", "workflow_id": workflow_id}
+
+
+@router.websocket("/{workflow_id}/ws")
+async def workflow_status_websocket(websocket: WebSocket, workflow_id: str):
+    """Push workflow status updates until the workflow finishes"""
+    # Note: WebSocket endpoints can't use Depends(), so we get dependencies directly
+    state = state_manager()
+    if await state.get_workflow(workflow_id) is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION,
+                              reason="Workflow not found")
+        return
+
+    await websocket.accept()
+    try:
+        with state.watching_workflows([workflow_id]):
+            while True:
+                # Take the event before reading the status so a change that
+                # lands while we are sending is not missed
+                changed = state.workflow_changed(workflow_id)
+                workflow = await state.get_workflow(workflow_id)
+                if workflow is None:
+                    break
+
+                await websocket.send_json({
+                    "workflow_id": workflow_id,
+                    "status": workflow.status
+                })
+                if workflow.status in TERMINAL_WORKFLOW_STATUSES:
+                    break
+
+                try:
+                    await asyncio.wait_for(changed.wait(), _STATUS_KEEPALIVE)
+                except TimeoutError:
+                    pass
+
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
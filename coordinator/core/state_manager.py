@@ -1,11 +1,66 @@
 """Hybrid state management with PostgreSQL persistence and Redis caching"""
-from typing import Dict, Optional
-from shared.models import Workflow, Worker, Job
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+from shared.enums import JobType
+from shared.models import (Workflow, Worker, Job, JobAdapter,
+                           WorkflowAdapter)
 import asyncio
 from fastapi import WebSocket
+from coordinator.db.models import JobModel, WorkflowModel, WorkerModel
 from coordinator.db.postgres import PostgresDB
 from coordinator.db.redis import RedisCache
 
+# Rows coming back from PostgreSQL already carry enum-typed columns and were
+# validated when first saved, so they are rebuilt with model_construct()
+# instead of paying for a second round of Pydantic validation.
+
+
+def _job_from_model(model: JobModel) -> Job:
+    """Rebuild a Job from its persisted row without re-validating"""
+    return Job.model_construct(
+        id=model.id,
+        type=model.type,
+        parameters=model.parameters,
+        status=model.status,
+        worker_id=model.worker_id,
+        result=model.result,
+        error=model.error,
+        retry_count=model.retry_count,
+        max_retries=model.max_retries,
+        on_success=model.on_success,
+        on_failure=model.on_failure,
+        always_run=model.always_run,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def _workflow_from_model(model: WorkflowModel, jobs: List[Job]) -> Workflow:
+    """Rebuild a Workflow from its persisted row without re-validating"""
+    return Workflow.model_construct(
+        id=model.id,
+        name=model.name,
+        status=model.status,
+        jobs=jobs,
+        current_jobs=set(model.current_jobs or ()),
+        completed_jobs=set(model.completed_jobs or ()),
+        failed_jobs=set(model.failed_jobs or ()),
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def _worker_from_model(model: WorkerModel) -> Worker:
+    """Rebuild a Worker from its persisted row without re-validating"""
+    return Worker.model_construct(
+        id=model.id,
+        status=model.status,
+        capabilities=[JobType(cap) for cap in model.capabilities],
+        current_job_id=model.current_job_id,
+        last_heartbeat=model.last_heartbeat,
+        registered_at=model.registered_at,
+    )
+
 
 class StateManager:
     """Centralized state with optional PostgreSQL + Redis backends"""
@@ -20,6 +75,12 @@ class StateManager:
         self.job_assignments: Dict[str, str] = {}  # job_id -> worker_id
         self.active_connections: Dict[str, WebSocket] = {}
         self.pending_jobs: asyncio.Queue = asyncio.Queue()
+        # workflow_id -> event set on the next status change, for push waiters
+        self._workflow_events: Dict[str, asyncio.Event] = {}
+        # workflow_id -> number of watching_workflows blocks waiting on it
+        self._workflow_watchers: Dict[str, int] = {}
+        # Event set the next time a worker registers or goes away
+        self._workers_event: Optional[asyncio.Event] = None
 
         # Database backends (optional)
         self.postgres = postgres
@@ -37,7 +98,7 @@ class StateManager:
         if self.redis:
             cached = await self.redis.get_cached_workflow(workflow_id)
             if cached:
-                workflow = Workflow(**cached)
+                workflow = WorkflowAdapter.validate_python(cached)
                 self.workflows[workflow_id] = workflow
                 return workflow
 
@@ -48,35 +109,8 @@ class StateManager:
                 # Reconstruct Workflow with jobs
                 job_models = await self.postgres.list_jobs_by_workflow(
                     workflow_id)
-                jobs = [
-                    Job(
-                        id=j.id,
-                        type=j.type,
-                        parameters=j.parameters,
-                        status=j.status,
-                        worker_id=j.worker_id,
-                        result=j.result,
-                        error=j.error,
-                        retry_count=j.retry_count,
-                        max_retries=j.max_retries,
-                        on_success=j.on_success,
-                        on_failure=j.on_failure,
-                        always_run=j.always_run,
-                        created_at=j.created_at,
-                        updated_at=j.updated_at,
-                    ) for j in job_models
-                ]
-                workflow = Workflow(
-                    id=model.id,
-                    name=model.name,
-                    status=model.status,
-                    jobs=jobs,
-                    current_jobs=model.current_jobs,
-                    completed_jobs=model.completed_jobs,
-                    failed_jobs=model.failed_jobs,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at,
-                )
+                jobs = [_job_from_model(j) for j in job_models]
+                workflow = _workflow_from_model(model, jobs)
                 # Cache it
                 self.workflows[workflow_id] = workflow
                 for job in jobs:
@@ -95,9 +129,11 @@ class StateManager:
 
         # Persist to DB
         if self.postgres:
-            await self.postgres.save_workflow(workflow)
-            for job in workflow.jobs:
-                await self.postgres.save_job(job, workflow.id)
+            # One commit for the workflow and its jobs
+            async with self.postgres.transaction() as session:
+                await self.postgres.save_workflow(workflow, session)
+                await self.postgres.save_jobs(workflow.jobs, workflow.id,
+                                              session)
 
         # Cache in Redis
         if self.redis:
@@ -107,7 +143,13 @@ class StateManager:
 
     async def remove_workflow(self, workflow_id: str) -> None:
         """Remove workflow from memory and DB"""
-        self.workflows.pop(workflow_id, None)
+        workflow = self.workflows.pop(workflow_id, None)
+
+        # Drop the workflow's jobs too so deleted workflows don't pin them
+        if workflow is not None:
+            for job in workflow.jobs:
+                self.jobs.pop(job.id, None)
+        self.notify_workflow_changed(workflow_id)
 
         if self.postgres:
             await self.postgres.delete_workflow(workflow_id)
@@ -119,6 +161,42 @@ class StateManager:
         """List workflows from memory"""
         return list(self.workflows.values())
 
+    def workflow_changed(self, workflow_id: str) -> asyncio.Event:
+        """Get an event that fires on the workflow's next status change"""
+        event = self._workflow_events.get(workflow_id)
+        if event is None:
+            event = self._workflow_events[workflow_id] = asyncio.Event()
+        return event
+
+    @contextmanager
+    def watching_workflows(self, workflow_ids: Iterable[str]) -> Iterator[None]:
+        """Wait on workflow_changed for these workflows within the block
+        
+        An event nobody fires would otherwise stay behind once its waiters
+        leave, e.g. for a workflow that had already finished. The last
+        watcher of a workflow to leave drops its event.
+        """
+        workflow_ids = list(workflow_ids)
+        for workflow_id in workflow_ids:
+            self._workflow_watchers[workflow_id] = (
+                self._workflow_watchers.get(workflow_id, 0) + 1)
+        try:
+            yield
+        finally:
+            for workflow_id in workflow_ids:
+                remaining = self._workflow_watchers.pop(workflow_id) - 1
+                if remaining:
+                    self._workflow_watchers[workflow_id] = remaining
+                else:
+                    self._workflow_events.pop(workflow_id, None)
+
+    def notify_workflow_changed(self, workflow_id: str) -> None:
+        """Wake everyone waiting on a workflow status change"""
+        # Each event fires once; waiters fetch a fresh one for the next change
+        event = self._workflow_events.pop(workflow_id, None)
+        if event is not None:
+            event.set()
+
     # Worker methods
     async def get_worker(self, worker_id: str) -> Optional[Worker]:
         """Get worker from cache or DB"""
@@ -128,15 +206,7 @@ class StateManager:
         if self.postgres:
             model = await self.postgres.get_worker(worker_id)
             if model:
-                from shared.enums import JobType
-                worker = Worker(
-                    id=model.id,
-                    status=model.status,
-                    capabilities=[JobType(cap) for cap in model.capabilities],
-                    current_job_id=model.current_job_id,
-                    last_heartbeat=model.last_heartbeat,
-                    registered_at=model.registered_at,
-                )
+                worker = _worker_from_model(model)
                 self.workers[worker_id] = worker
                 return worker
 
@@ -145,6 +215,7 @@ class StateManager:
     async def add_worker(self, worker: Worker) -> None:
         """Add worker to memory and persist"""
         self.workers[worker.id] = worker
+        self.notify_workers_changed()
 
         if self.postgres:
             await self.postgres.save_worker(worker)
@@ -154,7 +225,8 @@ class StateManager:
 
     async def remove_worker(self, worker_id: str) -> None:
         """Remove worker from memory and DB"""
-        self.workers.pop(worker_id, None)
+        if self.workers.pop(worker_id, None) is not None:
+            self.notify_workers_changed()
 
         if self.postgres:
             await self.postgres.delete_worker(worker_id)
@@ -166,6 +238,18 @@ class StateManager:
         """List workers from memory"""
         return list(self.workers.values())
 
+    def workers_changed(self) -> asyncio.Event:
+        """Get an event that fires when the next worker joins or leaves"""
+        if self._workers_event is None:
+            self._workers_event = asyncio.Event()
+        return self._workers_event
+
+    def notify_workers_changed(self) -> None:
+        """Wake everyone waiting on a worker join or leave"""
+        event, self._workers_event = self._workers_event, None
+        if event is not None:
+            event.set()
+
     # Job methods
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get job from cache or DB"""
@@ -175,29 +259,14 @@ class StateManager:
         if self.redis:
             cached = await self.redis.get_cached_job(job_id)
             if cached:
-                job = Job(**cached)
+                job = JobAdapter.validate_python(cached)
                 self.jobs[job_id] = job
                 return job
 
         if self.postgres:
             model = await self.postgres.get_job(job_id)
             if model:
-                job = Job(
-                    id=model.id,
-                    type=model.type,
-                    parameters=model.parameters,
-                    status=model.status,
-                    worker_id=model.worker_id,
-                    result=model.result,
-                    error=model.error,
-                    retry_count=model.retry_count,
-                    max_retries=model.max_retries,
-                    on_success=model.on_success,
-                    on_failure=model.on_failure,
-                    always_run=model.always_run,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at,
-                )
+                job = _job_from_model(model)
                 self.jobs[job_id] = job
                 return job
 
@@ -210,7 +279,7 @@ class StateManager:
         # Find workflow for this job
         workflow_id = None
         for wf in self.workflows.values():
-            if any(j.id == job.id for j in wf.jobs):
+            if wf.get_job(job.id) is not None:
                 workflow_id = wf.id
                 break
 
@@ -285,44 +354,15 @@ class StateManager:
         if not self.postgres:
             return
 
-        from shared.enums import JobType
-
         # Load all workflows with their jobs
         workflow_models = await self.postgres.list_workflows()
         for wf_model in workflow_models:
             # Get all jobs for this workflow
             job_models = await self.postgres.list_jobs_by_workflow(wf_model.id)
-            jobs = [
-                Job(
-                    id=j.id,
-                    type=j.type,
-                    parameters=j.parameters,
-                    status=j.status,
-                    worker_id=j.worker_id,
-                    result=j.result,
-                    error=j.error,
-                    retry_count=j.retry_count,
-                    max_retries=j.max_retries,
-                    on_success=j.on_success,
-                    on_failure=j.on_failure,
-                    always_run=j.always_run,
-                    created_at=j.created_at,
-                    updated_at=j.updated_at,
-                ) for j in job_models
-            ]
+            jobs = [_job_from_model(j) for j in job_models]
 
             # Reconstruct workflow
-            workflow = Workflow(
-                id=wf_model.id,
-                name=wf_model.name,
-                status=wf_model.status,
-                jobs=jobs,
-                current_jobs=wf_model.current_jobs,
-                completed_jobs=wf_model.completed_jobs,
-                failed_jobs=wf_model.failed_jobs,
-                created_at=wf_model.created_at,
-                updated_at=wf_model.updated_at,
-            )
+            workflow = _workflow_from_model(wf_model, jobs)
 
             # Add to memory
             self.workflows[workflow.id] = workflow
@@ -332,14 +372,7 @@ class StateManager:
         # Load all workers
         worker_models = await self.postgres.list_workers()
         for w_model in worker_models:
-            worker = Worker(
-                id=w_model.id,
-                status=w_model.status,
-                capabilities=[JobType(cap) for cap in w_model.capabilities],
-                current_job_id=w_model.current_job_id,
-                last_heartbeat=w_model.last_heartbeat,
-                registered_at=w_model.registered_at,
-            )
+            worker = _worker_from_model(w_model)
             self.workers[worker.id] = worker
 
         # Load all job assignments
@@ -358,7 +391,7 @@ class StateManager:
         if self.redis:
             cached = await self.redis.get_cached_workflow(workflow_id)
             if cached:
-                workflow = Workflow(**cached)
+                workflow = WorkflowAdapter.validate_python(cached)
                 self.workflows[workflow_id] = workflow
                 return workflow
 
@@ -369,35 +402,8 @@ class StateManager:
                 # Reconstruct Workflow with jobs
                 job_models = await self.postgres.list_jobs_by_workflow(
                     workflow_id)
-                jobs = [
-                    Job(
-                        id=j.id,
-                        type=j.type,
-                        parameters=j.parameters,
-                        status=j.status,
-                        worker_id=j.worker_id,
-                        result=j.result,
-                        error=j.error,
-                        retry_count=j.retry_count,
-                        max_retries=j.max_retries,
-                        on_success=j.on_success,
-                        on_failure=j.on_failure,
-                        always_run=j.always_run,
-                        created_at=j.created_at,
-                        updated_at=j.updated_at,
-                    ) for j in job_models
-                ]
-                workflow = Workflow(
-                    id=model.id,
-                    name=model.name,
-                    status=model.status,
-                    jobs=jobs,
-                    current_jobs=model.current_jobs,
-                    completed_jobs=model.completed_jobs,
-                    failed_jobs=model.failed_jobs,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at,
-                )
+                jobs = [_job_from_model(j) for j in job_models]
+                workflow = _workflow_from_model(model, jobs)
                 # Cache it
                 self.workflows[workflow_id] = workflow
                 for job in jobs:
@@ -416,9 +422,11 @@ class StateManager:
 
         # Persist to DB
         if self.postgres:
-            await self.postgres.save_workflow(workflow)
-            for job in workflow.jobs:
-                await self.postgres.save_job(job, workflow.id)
+            # One commit for the workflow and its jobs
+            async with self.postgres.transaction() as session:
+                await self.postgres.save_workflow(workflow, session)
+                await self.postgres.save_jobs(workflow.jobs, workflow.id,
+                                              session)
 
         # Cache in Redis
         if self.redis:
@@ -52,13 +52,11 @@ class WorkflowEngine:
 
             if not entry_jobs:
                 logger.error(f"No entry jobs found for workflow {workflow_id}")
-                workflow.status = WorkflowStatus.FAILED
-                workflow.updated_at = datetime.now(UTC)
+                self._set_workflow_status(workflow, WorkflowStatus.FAILED)
                 return False
 
             # Update workflow status
-            workflow.status = WorkflowStatus.RUNNING
-            workflow.updated_at = datetime.now(UTC)
+            self._set_workflow_status(workflow, WorkflowStatus.RUNNING)
 
             # Schedule entry jobs
             for job_id in entry_jobs:
@@ -71,10 +69,22 @@ class WorkflowEngine:
 
         except Exception as e:
             logger.error(f"Error starting workflow {workflow_id}: {e}")
-            workflow.status = WorkflowStatus.FAILED
-            workflow.updated_at = datetime.now(UTC)
+            self._set_workflow_status(workflow, WorkflowStatus.FAILED)
             return False
 
+    def validate_workflow(self, workflow: Workflow) -> None:
+        """Check that start_workflow would accept a workflow's job graph.
+        
+        Args:
+            workflow: The workflow to check; it need not be in state yet
+            
+        Raises:
+            ValueError: If a job references a missing job or the jobs
+                depend on each other in a cycle
+        """
+        if not self._find_entry_jobs(self._build_dependency_graph(workflow)):
+            raise ValueError(f"No entry jobs found for workflow {workflow.id}")
+
     def _build_dependency_graph(self,
                                 workflow: Workflow) -> Dict[str, Set[str]]:
         """Build a dependency graph for the workflow.
@@ -183,13 +193,9 @@ class WorkflowEngine:
             logger.error(f"No workflow found for job {job_id}")
             return
 
-        # Add to completed jobs
-        if job_id not in workflow.completed_jobs:
-            workflow.completed_jobs.append(job_id)
-
-        # Remove from current jobs
-        if job_id in workflow.current_jobs:
-            workflow.current_jobs.remove(job_id)
+        # Move from current jobs to completed jobs
+        workflow.completed_jobs.add(job_id)
+        workflow.current_jobs.discard(job_id)
 
         workflow.updated_at = datetime.now(UTC)
 
@@ -254,13 +260,9 @@ class WorkflowEngine:
             logger.error(f"No workflow found for job {job_id}")
             return
 
-        # Add to failed jobs
-        if job_id not in workflow.failed_jobs:
-            workflow.failed_jobs.append(job_id)
-
-        # Remove from current jobs
-        if job_id in workflow.current_jobs:
-            workflow.current_jobs.remove(job_id)
+        # Move from current jobs to failed jobs
+        workflow.failed_jobs.add(job_id)
+        workflow.current_jobs.discard(job_id)
 
         workflow.updated_at = datetime.now(UTC)
 
@@ -304,23 +306,20 @@ class WorkflowEngine:
 
             # Determine final status
             if workflow.failed_jobs:
-                workflow.status = WorkflowStatus.FAILED
+                self._set_workflow_status(workflow, WorkflowStatus.FAILED)
                 logger.info(
                     f"Workflow {workflow.id} failed with {len(workflow.failed_jobs)} failed jobs"
                 )
             else:
-                workflow.status = WorkflowStatus.COMPLETED
+                self._set_workflow_status(workflow, WorkflowStatus.COMPLETED)
                 logger.info(f"Workflow {workflow.id} completed successfully")
 
-            workflow.updated_at = datetime.now(UTC)
-
             # Clean up cache
             self._dependency_cache.pop(workflow.id, None)
 
     async def _fail_workflow(self, workflow: Workflow) -> None:
         """Mark workflow as failed and run cleanup jobs."""
-        workflow.status = WorkflowStatus.FAILED
-        workflow.updated_at = datetime.now(UTC)
+        self._set_workflow_status(workflow, WorkflowStatus.FAILED)
 
         logger.error(f"Workflow {workflow.id} failed")
 
@@ -330,6 +329,13 @@ class WorkflowEngine:
         # Clean up cache
         self._dependency_cache.pop(workflow.id, None)
 
+    def _set_workflow_status(self, workflow: Workflow,
+                             status: WorkflowStatus) -> None:
+        """Update workflow status and wake any status-change waiters."""
+        workflow.status = status
+        workflow.updated_at = datetime.now(UTC)
+        self.state.notify_workflow_changed(workflow.id)
+
     async def _run_always_run_jobs(self, workflow: Workflow) -> None:
         """Execute all jobs marked as always_run."""
         always_run_jobs = [
@@ -404,8 +410,7 @@ class WorkflowEngine:
         job.updated_at = datetime.now(UTC)
 
         # Add to workflow's current jobs
-        if job_id not in workflow.current_jobs:
-            workflow.current_jobs.append(job_id)
+        workflow.current_jobs.add(job_id)
 
         # Assign to worker
         worker_id = await self.scheduler.assign_job(job_id=job_id,
@@ -419,8 +424,7 @@ class WorkflowEngine:
         else:
             # No workers available - revert status
             job.status = JobStatus.PENDING
-            if job_id in workflow.current_jobs:
-                workflow.current_jobs.remove(job_id)
+            workflow.current_jobs.discard(job_id)
             logger.warning(f"No workers available for job {job_id}")
             return False
 
@@ -442,7 +446,7 @@ class WorkflowEngine:
         Returns:
             bool: True if job can be scheduled
         """
-        job = next((j for j in workflow.jobs if j.id == job_id), None)
+        job = workflow.get_job(job_id)
         if not job:
             return False
 
@@ -510,7 +514,7 @@ class WorkflowEngine:
     def _find_workflow_for_job(self, job_id: str) -> Optional[Workflow]:
         """Find the workflow that contains a given job."""
         for workflow in self.state.list_workflows():
-            if any(job.id == job_id for job in workflow.jobs):
+            if workflow.get_job(job_id) is not None:
                 return workflow
         return None
 
@@ -539,11 +543,11 @@ class WorkflowEngine:
             return False
 
         # Update workflow status
-        workflow.status = WorkflowStatus.CANCELLED
-        workflow.updated_at = datetime.now(UTC)
+        self._set_workflow_status(workflow, WorkflowStatus.CANCELLED)
 
-        # Cancel running jobs (mark as failed)
-        for job_id in workflow.current_jobs:
+        # Cancel running jobs (mark as failed); iterate over a snapshot since
+        # lookups may await while other handlers update the set
+        for job_id in list(workflow.current_jobs):
             job = await self.state.get_job(job_id)
             if job and job.status == JobStatus.RUNNING:
                 job.status = JobStatus.FAILED
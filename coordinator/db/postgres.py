@@ -1,14 +1,37 @@
 """PostgreSQL database connection and operations"""
 import os
-from typing import Optional, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
 from sqlalchemy import update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from coordinator.db.models import Base, WorkflowModel, JobModel, WorkerModel, JobAssignmentModel
 from shared.models import Workflow, Job, Worker
 
 
+def _job_row(job: Job, workflow_id: str) -> Dict[str, Any]:
+    """Column values for a job's row"""
+    return {
+        "id": job.id,
+        "workflow_id": workflow_id,
+        "type": job.type,
+        "parameters": job.parameters,
+        "status": job.status,
+        "worker_id": job.worker_id,
+        "result": job.result,
+        "error": job.error,
+        "retry_count": job.retry_count,
+        "max_retries": job.max_retries,
+        "on_success": job.on_success,
+        "on_failure": job.on_failure,
+        "always_run": job.always_run,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
+
 class PostgresDB:
     """PostgreSQL database manager"""
 
@@ -29,22 +52,45 @@ class PostgresDB:
         """Close database connections"""
         await self.engine.dispose()
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncSession]:
+        """Open a session whose writes all commit together on exit
+        
+        Pass the session to the save_* methods to write through it; nothing
+        is committed if the block raises.
+        """
+        async with self.async_session() as session, session.begin():
+            yield session
+
+    @asynccontextmanager
+    async def _writing(
+            self, session: Optional[AsyncSession]) -> AsyncIterator[AsyncSession]:
+        """Write through the caller's session, or a new one committed on exit"""
+        if session is not None:
+            yield session
+            return
+
+        async with self.async_session() as new_session:
+            yield new_session
+            await new_session.commit()
+
     # Workflow operations
-    async def save_workflow(self, workflow: Workflow) -> None:
+    async def save_workflow(self,
+                            workflow: Workflow,
+                            session: Optional[AsyncSession] = None) -> None:
         """Save or update a workflow"""
-        async with self.async_session() as session:
+        async with self._writing(session) as writer:
             model = WorkflowModel(
                 id=workflow.id,
                 name=workflow.name,
                 status=workflow.status,
-                current_jobs=workflow.current_jobs,
-                completed_jobs=workflow.completed_jobs,
-                failed_jobs=workflow.failed_jobs,
+                current_jobs=sorted(workflow.current_jobs),
+                completed_jobs=sorted(workflow.completed_jobs),
+                failed_jobs=sorted(workflow.failed_jobs),
                 created_at=workflow.created_at,
                 updated_at=workflow.updated_at,
             )
-            await session.merge(model)
-            await session.commit()
+            await writer.merge(model)
 
     async def get_workflow(self, workflow_id: str) -> Optional[WorkflowModel]:
         """Get a workflow by ID"""
@@ -67,28 +113,32 @@ class PostgresDB:
             await session.commit()
 
     # Job operations
-    async def save_job(self, job: Job, workflow_id: str) -> None:
+    async def save_job(self,
+                       job: Job,
+                       workflow_id: str,
+                       session: Optional[AsyncSession] = None) -> None:
         """Save or update a job"""
-        async with self.async_session() as session:
-            model = JobModel(
-                id=job.id,
-                workflow_id=workflow_id,
-                type=job.type,
-                parameters=job.parameters,
-                status=job.status,
-                worker_id=job.worker_id,
-                result=job.result,
-                error=job.error,
-                retry_count=job.retry_count,
-                max_retries=job.max_retries,
-                on_success=job.on_success,
-                on_failure=job.on_failure,
-                always_run=job.always_run,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-            )
-            await session.merge(model)
-            await session.commit()
+        async with self._writing(session) as writer:
+            await writer.merge(JobModel(**_job_row(job, workflow_id)))
+
+    async def save_jobs(self,
+                        jobs: List[Job],
+                        workflow_id: str,
+                        session: Optional[AsyncSession] = None) -> None:
+        """Save or update several jobs of a workflow in one statement"""
+        if not jobs:
+            return
+
+        rows = [_job_row(job, workflow_id) for job in jobs]
+        stmt = pg_insert(JobModel)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobModel.id],
+            set_={
+                column: stmt.excluded[column]
+                for column in rows[0] if column != "id"
+            })
+        async with self._writing(session) as writer:
+            await writer.execute(stmt, rows)
 
     async def get_job(self, job_id: str) -> Optional[JobModel]:
         """Get a job by ID"""
@@ -105,9 +155,11 @@ class PostgresDB:
             return list(result.scalars().all())
 
     # Worker operations
-    async def save_worker(self, worker: Worker) -> None:
+    async def save_worker(self,
+                          worker: Worker,
+                          session: Optional[AsyncSession] = None) -> None:
         """Save or update a worker"""
-        async with self.async_session() as session:
+        async with self._writing(session) as writer:
             model = WorkerModel(
                 id=worker.id,
                 status=worker.status,
@@ -116,8 +168,7 @@ class PostgresDB:
                 last_heartbeat=worker.last_heartbeat,
                 registered_at=worker.registered_at,
             )
-            await session.merge(model)
-            await session.commit()
+            await writer.merge(model)
 
     async def get_worker(self, worker_id: str) -> Optional[WorkerModel]:
         """Get a worker by ID"""
@@ -140,12 +191,32 @@ class PostgresDB:
             await session.commit()
 
     # Job assignment operations
-    async def save_assignment(self, job_id: str, worker_id: str) -> None:
+    async def save_assignment(self,
+                              job_id: str,
+                              worker_id: str,
+                              session: Optional[AsyncSession] = None) -> None:
         """Save a job assignment"""
-        async with self.async_session() as session:
+        async with self._writing(session) as writer:
             model = JobAssignmentModel(job_id=job_id, worker_id=worker_id)
-            await session.merge(model)
-            await session.commit()
+            await writer.merge(model)
+
+    async def save_assignments(
+            self,
+            assignments: List[Tuple[str, str]],
+            session: Optional[AsyncSession] = None) -> None:
+        """Save several (job_id, worker_id) assignments in one statement"""
+        if not assignments:
+            return
+
+        stmt = pg_insert(JobAssignmentModel)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobAssignmentModel.job_id],
+            set_={"worker_id": stmt.excluded.worker_id})
+        async with self._writing(session) as writer:
+            await writer.execute(stmt, [{
+                "job_id": job_id,
+                "worker_id": worker_id
+            } for job_id, worker_id in assignments])
 
     async def get_assignment(self, job_id: str) -> Optional[str]:
         """Get worker ID for a job"""
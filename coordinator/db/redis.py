@@ -1,6 +1,6 @@
 """Redis cache and queue operations"""
 import json
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Tuple
 import redis.asyncio as redis
 from shared.models import Workflow, Job, Worker
 
@@ -25,28 +25,47 @@ class RedisCache:
     # Job queue operations
     async def push_job(self, job_id: str, priority: int = 0) -> None:
         """Push a job to the pending queue"""
-        await self.client.zadd("queue:pending_jobs", {job_id: priority})
+        await self.push_jobs([(job_id, priority)])
+
+    async def push_jobs(self, jobs: List[Tuple[str, int]]) -> None:
+        """Push several (job_id, priority) pairs to the queue in one command"""
+        if jobs:
+            await self.client.zadd("queue:pending_jobs", dict(jobs))
 
     async def pop_job(self) -> Optional[str]:
         """Pop highest priority job from queue"""
-        result = await self.client.zpopmin("queue:pending_jobs", count=1)
-        if result:
-            return result[0][0]  # Returns (job_id, score)
-        return None
+        jobs = await self.pop_jobs(1)
+        return jobs[0] if jobs else None
+
+    async def pop_jobs(self, count: int) -> List[str]:
+        """Pop up to count jobs in priority order in one command"""
+        result = await self.client.zpopmin("queue:pending_jobs", count=count)
+        return [job_id for job_id, _ in result]  # Pairs of (job_id, score)
+
+    async def clear_queue(self) -> None:
+        """Drop every pending job; Redis frees the memory in the background"""
+        await self.client.unlink("queue:pending_jobs")
 
     async def queue_length(self) -> int:
         """Get pending job queue length"""
         return await self.client.zcard("queue:pending_jobs")
 
     # Worker presence tracking
+    @staticmethod
+    def heartbeat_key(worker_id: str) -> str:
+        """Key a worker's heartbeat is stored under"""
+        return f"worker:heartbeat:{worker_id}"
+
     async def mark_worker_active(self, worker_id: str, ttl: int = 30) -> None:
         """Mark worker as active with TTL"""
-        await self.client.setex(f"worker:heartbeat:{worker_id}", ttl, "1")
-        await self.client.sadd("set:active_workers", worker_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.setex(self.heartbeat_key(worker_id), ttl, "1")
+            pipe.sadd("set:active_workers", worker_id)
+            await pipe.execute()
 
     async def is_worker_active(self, worker_id: str) -> bool:
         """Check if worker is active"""
-        return await self.client.exists(f"worker:heartbeat:{worker_id}") > 0
+        return await self.client.exists(self.heartbeat_key(worker_id)) > 0
 
     async def get_active_workers(self) -> List[str]:
         """Get all active worker IDs"""
@@ -54,8 +73,10 @@ class RedisCache:
 
     async def remove_worker(self, worker_id: str) -> None:
         """Remove worker from active set"""
-        await self.client.delete(f"worker:heartbeat:{worker_id}")
-        await self.client.srem("set:active_workers", worker_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.delete(self.heartbeat_key(worker_id))
+            pipe.srem("set:active_workers", worker_id)
+            await pipe.execute()
 
     # Caching operations
     async def cache_workflow(self, workflow: Workflow) -> None:
@@ -3,7 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from coordinator.core.dependencies import get_worker_registry, get_workflow_engine
 from coordinator.core.state_manager import init_state_manager
-from coordinator.api import workflows, workers, health, jobs
+from coordinator.api import workflows, workers, health, jobs, events
 from contextlib import asynccontextmanager
 import asyncio
 import logging
@@ -68,6 +68,7 @@ app.include_router(health.router)
 app.include_router(workflows.router)
 app.include_router(workers.router)
 app.include_router(jobs.router)
+app.include_router(events.router)
 
 if __name__ == "__main__":
     uvicorn.run("coordinator.main:app", host="0.0.0.0", port=8000, reload=True)
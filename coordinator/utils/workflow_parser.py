@@ -1,6 +1,7 @@
 """Workflow definition parser for YAML format"""
-from typing import Dict, Any, List
+from typing import AbstractSet, Dict, Any, List, NamedTuple, Optional, Tuple
 from datetime import datetime, UTC
+import functools
 import yaml
 import uuid
 
@@ -8,11 +9,22 @@ from shared.models import Workflow, Job
 from shared.enums import JobType, JobStatus, WorkflowStatus
 
 
+# Distinct YAML definitions whose parsed templates are kept in memory
+_TEMPLATE_CACHE_SIZE = 128
+
+
 class WorkflowDefinitionError(Exception):
     """Raised when workflow definition is invalid"""
     pass
 
 
+class _WorkflowTemplate(NamedTuple):
+    """A validated workflow definition, shared by every submission of it"""
+    id: Optional[str]
+    name: str
+    jobs: Tuple[Job, ...]
+
+
 def parse_yaml_workflow(yaml_content: str) -> Workflow:
     """Parse a YAML workflow definition into a Workflow model.
     
@@ -41,6 +53,42 @@ def parse_yaml_workflow(yaml_content: str) -> Workflow:
     Returns:
         Workflow: Parsed and validated workflow
         
+    Raises:
+        WorkflowDefinitionError: If YAML is invalid or missing required fields
+    """
+    template = _parse_workflow_template(yaml_content)
+
+    # Create workflow ID first (needed for unique job IDs)
+    workflow_id = (template.id
+                   if template.id is not None else str(uuid.uuid4()))
+
+    now = datetime.now(UTC)
+
+    workflow = Workflow(
+        id=workflow_id,
+        name=template.name,
+        status=WorkflowStatus.PENDING,
+        jobs=[_instantiate_job(job, workflow_id, now) for job in template.jobs],
+        created_at=now,
+        updated_at=now)
+
+    return workflow
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _parse_workflow_template(yaml_content: str) -> _WorkflowTemplate:
+    """Parse and validate a YAML workflow definition into a template.
+    
+    Results are cached by YAML text, so resubmitting a definition skips
+    parsing and validation. Callers must copy the template's jobs rather
+    than hand them out.
+    
+    Args:
+        yaml_content: YAML string containing workflow definition
+        
+    Returns:
+        _WorkflowTemplate: Validated definition with job IDs as written
+        
     Raises:
         WorkflowDefinitionError: If YAML is invalid or missing required fields
     """
@@ -68,59 +116,70 @@ def parse_yaml_workflow(yaml_content: str) -> Workflow:
     if len(workflow_def["jobs"]) == 0:
         raise WorkflowDefinitionError("Workflow must have at least one job")
 
-    # Create workflow ID first (needed for unique job IDs)
-    workflow_id = workflow_def.get("id", str(uuid.uuid4()))
-
     # Parse jobs
     jobs = []
-    job_ids = set()
-    # Map from original job ID to unique job ID (workflow_id:job_id)
-    job_id_mapping = {}
+    # Map from job ID to the index it was first seen at
+    job_ids: Dict[str, int] = {}
 
     for idx, job_def in enumerate(workflow_def["jobs"]):
         try:
-            original_job_id = job_def["id"]
-            # Make job ID unique by prefixing with workflow ID
-            unique_job_id = f"{workflow_id}:{original_job_id}"
-            job_id_mapping[original_job_id] = unique_job_id
-
-            job = _parse_job(job_def, idx, unique_job_id)
+            job = _parse_job(job_def, idx)
 
             # Check for duplicate job IDs
-            if job.id in job_ids:
-                raise WorkflowDefinitionError(f"Duplicate job ID: {job.id}")
-            job_ids.add(job.id)
+            first_idx = job_ids.setdefault(job.id, idx)
+            if first_idx != idx:
+                raise WorkflowDefinitionError(
+                    f"Duplicate job ID '{job.id}' (indices {first_idx}, {idx})")
 
             jobs.append(job)
         except (KeyError, ValueError, TypeError) as e:
             raise WorkflowDefinitionError(
                 f"Error parsing job at index {idx}: {e}")
 
-    # Update job references with unique IDs
-    _update_job_references(jobs, job_id_mapping)
-
     # Validate job references (on_success, on_failure)
-    _validate_job_references(jobs, job_ids)
+    _validate_job_references(jobs, job_ids.keys())
 
-    now = datetime.now(UTC)
+    return _WorkflowTemplate(id=workflow_def.get("id"),
+                             name=workflow_def["name"],
+                             jobs=tuple(jobs))
 
-    workflow = Workflow(id=workflow_id,
-                        name=workflow_def["name"],
-                        status=WorkflowStatus.PENDING,
-                        jobs=jobs,
-                        created_at=now,
-                        updated_at=now)
 
-    return workflow
+def _instantiate_job(job: Job, workflow_id: str, now: datetime) -> Job:
+    """Copy a template job, making its ID and references unique.
+    
+    Job IDs are prefixed with the workflow ID (workflow_id:job_id) so the
+    same definition can be submitted any number of times.
+    
+    Args:
+        job: Job from a cached workflow template
+        workflow_id: ID of the workflow being created
+        now: Creation timestamp for the job
+        
+    Returns:
+        Job: Independent copy of the job for this workflow
+    """
 
+    def _unique(job_ids: Optional[List[str]]) -> Optional[List[str]]:
+        if not job_ids:
+            return job_ids
+        return [f"{workflow_id}:{job_id}" for job_id in job_ids]
 
-def _parse_job(job_def: Dict[str, Any], index: int, unique_job_id: str) -> Job:
+    return job.model_copy(deep=True,
+                          update={
+                              "id": f"{workflow_id}:{job.id}",
+                              "on_success": _unique(job.on_success),
+                              "on_failure": _unique(job.on_failure),
+                              "created_at": now,
+                              "updated_at": now
+                          })
+
+
+def _parse_job(job_def: Dict[str, Any], index: int) -> Job:
     """Parse a single job definition.
     
     Args:
         job_def: Dictionary containing job definition
         index: Index of job in the workflow (for error reporting)
-        unique_job_id: Unique job ID (prefixed with workflow ID)
         
     Returns:
         Job: Parsed job
@@ -201,7 +260,7 @@ def _parse_job(job_def: Dict[str, Any], index: int, unique_job_id: str) -> Job:
     now = datetime.now(UTC)
 
     return Job(
-        id=unique_job_id,  # Use the unique job ID
+        id=job_def["id"],
         type=job_type,
         parameters=parameters,
         status=JobStatus.PENDING,
@@ -213,53 +272,42 @@ def _parse_job(job_def: Dict[str, Any], index: int, unique_job_id: str) -> Job:
         updated_at=now)
 
 
-def _update_job_references(jobs: List[Job], job_id_mapping: Dict[str, str]):
-    """Update job references (on_success, on_failure) with unique job IDs.
-    
-    Args:
-        jobs: List of parsed jobs with temporary references
-        job_id_mapping: Mapping from original job ID to unique job ID
-    """
-    for job in jobs:
-        # Update on_success references
-        if job.on_success:
-            job.on_success = [
-                job_id_mapping.get(ref, ref) for ref in job.on_success
-            ]
-
-        # Update on_failure references
-        if job.on_failure:
-            job.on_failure = [
-                job_id_mapping.get(ref, ref) for ref in job.on_failure
-            ]
-
-
-def _validate_job_references(jobs: List[Job], job_ids: set):
+def _validate_job_references(jobs: List[Job], job_ids: AbstractSet[str]):
     """Validate that on_success and on_failure references point to valid jobs.
     
     Args:
         jobs: List of parsed jobs
-        job_ids: Set of all job IDs in the workflow
+        job_ids: Set-like collection of all job IDs in the workflow
         
     Raises:
         WorkflowDefinitionError: If a job references a non-existent job
     """
+    # Built once per workflow so each difference below only walks the refs
+    all_ids = frozenset(job_ids)
+
     for job in jobs:
-        # Validate on_success references (always a list)
-        if job.on_success:
-            for ref in job.on_success:
-                if ref not in job_ids:
-                    raise WorkflowDefinitionError(
-                        f"Job '{job.id}' references non-existent job in on_success: '{ref}'"
-                    )
+        # Terminal jobs have nothing to validate
+        if not (job.on_success or job.on_failure):
+            continue
+
+        # Check both routing lists (always lists) in a single set operation
+        missing = set(job.on_success or ()).union(
+            job.on_failure or ()).difference(all_ids)
+        if not missing:
+            continue
+
+        # Only on the error path: attribute the missing refs to their field
+        bad_success = missing.intersection(job.on_success or ())
+        field, refs = (("on_success", bad_success) if bad_success else
+                       ("on_failure", missing))
+        raise WorkflowDefinitionError(
+            f"Job '{job.id}' references non-existent job in {field}: "
+            f"{_format_refs(refs)}")
 
-        # Validate on_failure references (always a list)
-        if job.on_failure:
-            for ref in job.on_failure:
-                if ref not in job_ids:
-                    raise WorkflowDefinitionError(
-                        f"Job '{job.id}' references non-existent job in on_failure: '{ref}'"
-                    )
+
+def _format_refs(refs: AbstractSet[str]) -> str:
+    """Format job references for error messages in a stable order"""
+    return ", ".join(f"'{ref}'" for ref in sorted(refs))
 
 
 def workflow_to_yaml(workflow: Workflow) -> str:
@@ -7,7 +7,7 @@ import time
 from pathlib import Path
 
 from client.workflow_client import WorkflowClient
-from shared.enums import WorkflowStatus
+from shared.enums import TERMINAL_WORKFLOW_STATUSES
 
 
 def main():
@@ -46,17 +46,18 @@ def main():
         print("\nMonitoring workflow execution...")
         workflow_id = workflow.id
 
+        # Poll quickly at first, backing off so long workflows aren't hammered
+        delay = 0.1
         while True:
-            time.sleep(2)
+            time.sleep(delay)
             workflow = client.get_workflow(workflow_id)
             print(f"  Status: {workflow.status}")
 
-            if workflow.status in [
-                    WorkflowStatus.COMPLETED, WorkflowStatus.FAILED,
-                    WorkflowStatus.CANCELLED
-            ]:
+            if workflow.status in TERMINAL_WORKFLOW_STATUSES:
                 break
 
+            delay = min(delay * 1.5, 2.0)
+
         print(f"\n✓ Workflow finished with status: {workflow.status}")
 
         # Print job details
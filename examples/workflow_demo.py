@@ -3,27 +3,37 @@
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from client.workflow_client import WorkflowClient
+from shared.enums import TERMINAL_WORKFLOW_STATUSES
 
 
 def submit_all_workflows(client: WorkflowClient):
     """Submit all workflow definitions in the workflow_definitions directory."""
     workflow_dir = Path(__file__).parent / "workflow_definitions"
-    yaml_files = list(workflow_dir.glob("*.yaml"))
+    yaml_files = sorted(workflow_dir.glob("*.yaml"))
 
     print(f"Found {len(yaml_files)} workflow definitions")
     submitted_workflows = []
 
-    for yaml_file in yaml_files:
-        print(f"\nSubmitting: {yaml_file.name}")
-        try:
-            workflow = client.submit_workflow_from_yaml(str(yaml_file))
-            print(f"  ✓ Submitted: {workflow.name} (ID: {workflow.id})")
-            submitted_workflows.append(workflow)
-        except Exception as e:
-            print(f"  ✗ Failed: {e}")
+    # Submissions are independent HTTP calls, so overlap them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(client.submit_workflow_from_yaml, str(yaml_file)):
+            yaml_file
+            for yaml_file in yaml_files
+        }
+        for future in as_completed(futures):
+            yaml_file = futures[future]
+            print(f"\n{yaml_file.name}")
+            try:
+                workflow = future.result()
+                print(f"  ✓ Submitted: {workflow.name} (ID: {workflow.id})")
+                submitted_workflows.append(workflow)
+            except Exception as e:
+                print(f"  ✗ Failed: {e}")
 
     return submitted_workflows
 
@@ -99,13 +109,20 @@ def main():
         workflow_id = start_workflow_by_name(client, "simple-workflow")
 
         if workflow_id:
-            # Monitor for a few seconds
+            # Monitor for a few seconds, backing off between polls
             print("\nMonitoring for 10 seconds...")
-            for i in range(5):
-                time.sleep(2)
+            deadline = time.monotonic() + 10
+            delay = 0.1
+            while time.monotonic() < deadline:
+                time.sleep(delay)
                 workflow = client.get_workflow(workflow_id)
                 print(f"  Status: {workflow.status}")
 
+                if workflow.status in TERMINAL_WORKFLOW_STATUSES:
+                    break
+
+                delay = min(delay * 1.5, 2.0)
+
     print("\n" + "=" * 60)
     print("Demo Complete")
     print("=" * 60)
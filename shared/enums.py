@@ -1,8 +1,8 @@
 """Enum definitions for the workflow orchestrator"""
-from enum import Enum
+from enum import StrEnum
 
 
-class JobStatus(str, Enum):
+class JobStatus(StrEnum):
     """Status values for job execution"""
     PENDING = "pending"
     RUNNING = "running"
@@ -12,7 +12,7 @@ class JobStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-class JobType(str, Enum):
+class JobType(StrEnum):
     """Types of jobs that can be executed"""
     VALIDATION = "validation"
     PROCESSING = "processing"
@@ -20,7 +20,7 @@ class JobType(str, Enum):
     CLEANUP = "cleanup"
 
 
-class WorkflowStatus(str, Enum):
+class WorkflowStatus(StrEnum):
     """Status values for workflow execution"""
     PENDING = "pending"
     RUNNING = "running"
@@ -29,14 +29,20 @@ class WorkflowStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class WorkerStatus(str, Enum):
+# Statuses a workflow never leaves once it reaches them
+TERMINAL_WORKFLOW_STATUSES = frozenset({
+    WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED
+})
+
+
+class WorkerStatus(StrEnum):
     """Status values for worker availability"""
     IDLE = "idle"
     BUSY = "busy"
     OFFLINE = "offline"
 
 
-class MessageType(str, Enum):
+class MessageType(StrEnum):
     """Types of messages exchanged between coordinator and workers"""
     # Worker -> Coordinator
     REGISTER = "register"
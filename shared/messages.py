@@ -11,9 +11,12 @@ class WebSocketMessage(BaseModel):
     type: MessageType
     timestamp: Optional[datetime] = None
 
+    # Inherited by every message: unknown fields are rejected up front and
+    # assignment is left unvalidated, keeping construction on the fast path
     model_config = ConfigDict(
         use_enum_values=True,
-        json_encoders={datetime: lambda v: v.isoformat()})
+        extra='forbid',
+        validate_assignment=False)
 
 
 # ============================================================================
@@ -1,14 +1,27 @@
 """Domain model definitions for workflows, jobs, and workers"""
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any, Union
+import sys
+from functools import cached_property
+from pydantic import (BaseModel, BeforeValidator, ConfigDict, Field,
+                      TypeAdapter, field_serializer, field_validator)
+from typing import Annotated, Optional, List, Dict, Any, Set, Union
 from datetime import datetime
 
 from .enums import JobStatus, JobType, WorkflowStatus, WorkerStatus
 
 
+def _intern(value: Any) -> Any:
+    """Intern a string ID, passing anything else through for validation"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# IDs are used as dict keys throughout the coordinator; interning keeps one
+# copy of each and lets equality checks short-circuit on identity.
+InternedId = Annotated[str, BeforeValidator(_intern)]
+
+
 class Job(BaseModel):
     """A unit of work to be executed by a worker"""
-    id: str
+    id: InternedId
     type: JobType
     parameters: Dict[str, Any]
     status: JobStatus = JobStatus.PENDING
@@ -24,24 +37,97 @@ class Job(BaseModel):
     updated_at: datetime
 
 
+class JobUpdate(BaseModel):
+    """Changes to a job; fields left out keep their current value"""
+    type: Optional[JobType] = None
+    parameters: Optional[Dict[str, Any]] = None
+    status: Optional[JobStatus] = None
+    worker_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    retry_count: Optional[int] = None
+    max_retries: Optional[int] = None
+    on_success: Optional[List[str]] = None
+    on_failure: Optional[List[str]] = None
+    always_run: Optional[bool] = None
+
+    @field_validator("type", "parameters", "status", "retry_count",
+                     "max_retries", "always_run")
+    @classmethod
+    def _not_null(cls, value: Any) -> Any:
+        """Reject an explicit null for fields a Job requires"""
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class JobBatchUpdate(JobUpdate):
+    """Changes to one job in a bulk update, naming the job they apply to"""
+    id: InternedId
+
+
 class Workflow(BaseModel):
     """A collection of jobs with dependencies"""
-    id: str
+    id: InternedId
     name: str
     status: WorkflowStatus = WorkflowStatus.PENDING
     jobs: List[Job]
-    current_jobs: List[str] = []  # Currently executing job IDs
-    completed_jobs: List[str] = []
-    failed_jobs: List[str] = []
+    # Currently executing job IDs
+    current_jobs: Set[str] = Field(default_factory=set)
+    completed_jobs: Set[str] = Field(default_factory=set)
+    failed_jobs: Set[str] = Field(default_factory=set)
     created_at: datetime
     updated_at: datetime
 
+    @field_serializer("current_jobs", "completed_jobs", "failed_jobs")
+    def _serialize_job_ids(self, job_ids: Set[str]) -> List[str]:
+        """Emit job ID sets as sorted lists so JSON output is deterministic"""
+        return sorted(job_ids)
+
+    @cached_property
+    def _job_positions(self) -> Dict[str, int]:
+        """Map of job ID to its index in jobs (not serialized)"""
+        return {job.id: i for i, job in enumerate(self.jobs)}
+
+    def get_job_index(self, job_id: str) -> Optional[int]:
+        """Get the index of a job in jobs, or None if it isn't in the workflow"""
+        pos = self._job_positions.get(job_id)
+        if (pos is not None and pos < len(self.jobs)
+                and self.jobs[pos].id == job_id):
+            return pos
+        if pos is None and all(job.id != job_id for job in self.jobs):
+            # A plain miss; callers probe many workflows for a job's owner,
+            # so scan rather than rebuild the index for each of them
+            return None
+        # jobs changed since the index was built, so rebuild it
+        del self.__dict__["_job_positions"]
+        return self._job_positions.get(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a job in this workflow by ID"""
+        pos = self.get_job_index(job_id)
+        return None if pos is None else self.jobs[pos]
+
 
 class Worker(BaseModel):
     """A worker node that can execute jobs"""
-    id: str
+    id: InternedId
     status: WorkerStatus = WorkerStatus.IDLE
     capabilities: List[JobType]  # Which job types this worker can handle
     current_job_id: Optional[str] = None
     last_heartbeat: datetime
     registered_at: datetime
+
+
+# Validators are created once and reused, so list payloads (e.g. GET
+# /workflows responses) don't rebuild a core schema per call. The single-model
+# adapters reuse each model's own schema; the list adapters are only needed by
+# the client, so their schemas are built on first use rather than at import.
+JobAdapter = TypeAdapter(Job)
+WorkflowAdapter = TypeAdapter(Workflow)
+WorkerAdapter = TypeAdapter(Worker)
+JobListAdapter = TypeAdapter(List[Job], config=ConfigDict(defer_build=True))
+WorkflowListAdapter = TypeAdapter(List[Workflow],
+                                  config=ConfigDict(defer_build=True))
+WorkerListAdapter = TypeAdapter(List[Worker],
+                                config=ConfigDict(defer_build=True))
@@ -1,14 +1,52 @@
 """Root conftest.py - Shared fixtures for all tests"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
 import pytest
+import pytest_asyncio
 import os
+import time
 from datetime import datetime, UTC
-from typing import Callable, Any, AsyncGenerator
-from unittest.mock import MagicMock, AsyncMock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Any, AsyncGenerator, Mapping, TypeVar
 
-from coordinator.core.state_manager import StateManager
 from shared.enums import JobType, JobStatus, WorkflowStatus, WorkerStatus
 from shared.models import Job, Workflow, Worker
 
+if TYPE_CHECKING:
+    # Importing the state manager pulls in SQLAlchemy, redis and FastAPI;
+    # fixtures that need it import it on first use instead.
+    from coordinator.core.state_manager import StateManager
+
+# Fixed timestamp for request payloads whose timestamps tests don't inspect
+_NOW_ISO = datetime.now(UTC).isoformat()
+_WORKFLOW_ID_PLACEHOLDER = "__WORKFLOW_ID__"
+_PID = os.getpid()
+_workflow_counter = itertools.count()
+_T = TypeVar("_T")
+
+# Read-only reference data shared by every test. The inner dicts stay plain
+# dicts because tests embed them directly in JSON request bodies.
+_SAMPLE_JOB_PARAMETERS: Mapping[JobType, dict[str, Any]] = MappingProxyType({
+    JobType.VALIDATION: {
+        "schema": "user_data",
+        "strict": True
+    },
+    JobType.PROCESSING: {
+        "batch_size": 100,
+        "timeout": 300
+    },
+    JobType.INTEGRATION: {
+        "endpoint": "https://api.example.com",
+        "method": "POST"
+    },
+    JobType.CLEANUP: {
+        "older_than_days": 30
+    }
+})
+
 # ============================================================================
 # Pytest Configuration
 # ============================================================================
@@ -16,18 +54,48 @@ from shared.models import Job, Workflow, Worker
 # Note: pytest-asyncio handles event loop creation automatically
 # The custom event_loop fixture has been removed to avoid deprecation warnings
 
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--run-slow",
+                     action="store_true",
+                     default=False,
+                     help="Also run tests marked slow")
+
+
+def pytest_collection_modifyitems(config: pytest.Config,
+                                  items: list[pytest.Item]) -> None:
+    """Skip tests marked slow unless --run-slow is given"""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 # ============================================================================
 # Database Fixtures (for integration tests)
 # ============================================================================
 
 
-@pytest.fixture
+def _require_backends(*env_vars: str) -> list[str]:
+    """Return the given backend URLs, skipping the test if any is unset"""
+    urls = [os.getenv(name) for name in env_vars]
+    missing = [name for name, url in zip(env_vars, urls) if not url]
+    if missing:
+        pytest.skip(f"{' and '.join(missing)} not set - skipping database tests")
+    if "DATABASE_URL" in env_vars:
+        # SQLAlchemy only loads the async driver on first connect
+        pytest.importorskip("psycopg")
+    return urls
+
+
+# One engine (and so one connection pool) and one schema check per module;
+# tests in the module must run on the same module-scoped event loop
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def postgres_db() -> AsyncGenerator:
-    """Create a test database connection"""
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        pytest.skip("DATABASE_URL not set - skipping PostgreSQL tests")
-    
+    """Create a test database connection shared by a test module"""
+    database_url, = _require_backends("DATABASE_URL")
+
     from coordinator.db.postgres import PostgresDB
     db = PostgresDB(database_url)
     await db.init_db()
@@ -38,31 +106,33 @@ async def postgres_db() -> AsyncGenerator:
 @pytest.fixture
 async def redis_cache() -> AsyncGenerator:
     """Create a test Redis connection"""
-    redis_url = os.getenv("REDIS_URL")
-    if not redis_url:
-        pytest.skip("REDIS_URL not set - skipping Redis tests")
-    
+    redis_url, = _require_backends("REDIS_URL")
+
     from coordinator.db.redis import RedisCache
     cache = RedisCache(redis_url)
     await cache.connect()
     yield cache
+    # Don't leave queued jobs behind for the next test to pop
+    await cache.clear_queue()
     await cache.close()
 
 
 @pytest.fixture
 async def full_state_manager() -> AsyncGenerator:
     """Create StateManager with full database stack"""
-    database_url = os.getenv("DATABASE_URL")
-    redis_url = os.getenv("REDIS_URL")
-    
-    if not (database_url and redis_url):
-        pytest.skip("DATABASE_URL or REDIS_URL not set - skipping full stack tests")
-    
-    from coordinator.core.state_manager import init_state_manager
-    state = await init_state_manager(database_url, redis_url)
+    database_url, redis_url = _require_backends("DATABASE_URL", "REDIS_URL")
+
+    from coordinator.core import state_manager as state_module
+
+    # init_state_manager replaces the app-wide state manager; put the
+    # in-memory one back afterwards so later API tests don't reach the
+    # databases through it
+    previous_state = state_module._state
+    state = await state_module.init_state_manager(database_url, redis_url)
     yield state
-    
+
     # Cleanup
+    state_module._state = previous_state
     if state.postgres:
         await state.postgres.close()
     if state.redis:
@@ -73,8 +143,12 @@ async def full_state_manager() -> AsyncGenerator:
 # Data Factories
 # ============================================================================
 
+# Factories and sample data are stateless, so they are built once per session.
+# The factories build models with model_construct(): their inputs are already
+# well-typed, so Pydantic validation would only add overhead.
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def job_factory() -> Callable:
     """Factory for creating test Job instances"""
 
@@ -83,18 +157,19 @@ def job_factory() -> Callable:
                     parameters: dict | None = None,
                     status: JobStatus = JobStatus.PENDING,
                     **kwargs) -> Job:
-        return Job(id=job_id,
-                   type=job_type,
-                   parameters=parameters or {"test": "data"},
-                   status=status,
-                   created_at=datetime.now(UTC),
-                   updated_at=datetime.now(UTC),
-                   **kwargs)
+        now = datetime.now(UTC)
+        kwargs.setdefault("created_at", now)
+        kwargs.setdefault("updated_at", now)
+        return Job.model_construct(id=job_id,
+                                   type=job_type,
+                                   parameters=parameters or {"test": "data"},
+                                   status=status,
+                                   **kwargs)
 
     return _create_job
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def workflow_factory(job_factory: Callable) -> Callable:
     """Factory for creating test Workflow instances"""
 
@@ -103,25 +178,30 @@ def workflow_factory(job_factory: Callable) -> Callable:
                          jobs: list[Job] | None = None,
                          status: WorkflowStatus = WorkflowStatus.PENDING,
                          **kwargs) -> Workflow:
+        now = datetime.now(UTC)
         if jobs is None:
             jobs = [
-                job_factory(job_id=f"{workflow_id}-job-1"),
+                job_factory(job_id=f"{workflow_id}-job-1",
+                            created_at=now,
+                            updated_at=now),
                 job_factory(job_id=f"{workflow_id}-job-2",
-                            job_type=JobType.PROCESSING)
+                            job_type=JobType.PROCESSING,
+                            created_at=now,
+                            updated_at=now)
             ]
 
-        return Workflow(id=workflow_id,
-                        name=name,
-                        jobs=jobs,
-                        status=status,
-                        created_at=datetime.now(UTC),
-                        updated_at=datetime.now(UTC),
-                        **kwargs)
+        return Workflow.model_construct(id=workflow_id,
+                                        name=name,
+                                        jobs=jobs,
+                                        status=status,
+                                        created_at=now,
+                                        updated_at=now,
+                                        **kwargs)
 
     return _create_workflow
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def worker_factory() -> Callable:
     """Factory for creating test Worker instances"""
 
@@ -134,14 +214,15 @@ def worker_factory() -> Callable:
         if capabilities is None:
             capabilities = [JobType.VALIDATION, JobType.PROCESSING]
 
-        return Worker(id=worker_id,
-                      host=host,
-                      port=port,
-                      capabilities=capabilities,
-                      status=status,
-                      last_heartbeat=datetime.now(UTC),
-                      registered_at=datetime.now(UTC),
-                      **kwargs)
+        now = datetime.now(UTC)
+        # host/port are accepted for readability at call sites only; Worker
+        # has no such fields
+        return Worker.model_construct(id=worker_id,
+                                      capabilities=capabilities,
+                                      status=status,
+                                      last_heartbeat=now,
+                                      registered_at=now,
+                                      **kwargs)
 
     return _create_worker
 
@@ -154,6 +235,7 @@ def worker_factory() -> Callable:
 @pytest.fixture
 def state_manager() -> StateManager:
     """Create a fresh StateManager instance for testing"""
+    from coordinator.core.state_manager import StateManager
     return StateManager()
 
 
@@ -236,9 +318,8 @@ def branching_workflow() -> Workflow:
 
 
 @pytest.fixture
-def mock_worker(state_manager: StateManager) -> Worker:
+async def mock_worker(state_manager: StateManager) -> Worker:
     """Create a mock worker"""
-    import asyncio
     now = datetime.now(UTC)
     worker = Worker(
         id="worker1",
@@ -246,45 +327,26 @@ def mock_worker(state_manager: StateManager) -> Worker:
         capabilities=[JobType.VALIDATION, JobType.PROCESSING, JobType.CLEANUP],
         last_heartbeat=now,
         registered_at=now)
-    
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    loop.run_until_complete(state_manager.add_worker(worker))
+
+    await state_manager.add_worker(worker)
     return worker
 
 
 @pytest.fixture
-def populated_state(state_manager: StateManager, workflow_factory: Callable,
-                    worker_factory: Callable) -> StateManager:
+async def populated_state(state_manager: StateManager,
+                          workflow_factory: Callable,
+                          worker_factory: Callable) -> StateManager:
     """StateManager with pre-populated test data"""
-    # We need to run this asynchronously, but fixtures can't be async in this context
-    # So we'll use asyncio.get_event_loop().run_until_complete
-    import asyncio
-    
-    async def populate():
-        # Add workflows
-        workflow1 = workflow_factory(workflow_id="wf-1", name="Workflow 1")
-        workflow2 = workflow_factory(workflow_id="wf-2", name="Workflow 2")
-        await state_manager.add_workflow(workflow1)
-        await state_manager.add_workflow(workflow2)
-
-        # Add workers
-        worker1 = worker_factory(worker_id="worker-1", port=9001)
-        worker2 = worker_factory(worker_id="worker-2", port=9002)
-        await state_manager.add_worker(worker1)
-        await state_manager.add_worker(worker2)
-    
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    loop.run_until_complete(populate())
+    await asyncio.gather(
+        state_manager.add_workflow(
+            workflow_factory(workflow_id="wf-1", name="Workflow 1")),
+        state_manager.add_workflow(
+            workflow_factory(workflow_id="wf-2", name="Workflow 2")),
+        state_manager.add_worker(
+            worker_factory(worker_id="worker-1", port=9001)),
+        state_manager.add_worker(
+            worker_factory(worker_id="worker-2", port=9002)),
+    )
     return state_manager
 
 
@@ -293,15 +355,34 @@ def populated_state(state_manager: StateManager, workflow_factory: Callable,
 # ============================================================================
 
 
+class _FakeWS:
+    """Lightweight stand-in for a worker WebSocket that records traffic"""
+
+    def __init__(self) -> None:
+        self.accepted = 0
+        self.sent: list[dict[str, Any]] = []
+        self.closed = False
+
+    async def accept(self) -> None:
+        self.accepted += 1
+
+    async def send_json(self, data: dict[str, Any]) -> None:
+        self.sent.append(data)
+
+    async def receive_json(self) -> dict[str, Any]:
+        return {"type": "heartbeat"}
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
 @pytest.fixture
-def mock_websocket() -> MagicMock:
-    """Mock WebSocket connection"""
-    ws = MagicMock()
-    ws.accept = AsyncMock()
-    ws.send_json = AsyncMock()
-    ws.receive_json = AsyncMock(return_value={"type": "heartbeat"})
-    ws.close = AsyncMock()
-    return ws
+def mock_websocket() -> _FakeWS:
+    """Mock WebSocket connection
+
+    Function-scoped on purpose: tests assert on the traffic it records.
+    """
+    return _FakeWS()
 
 
 @pytest.fixture
@@ -317,32 +398,15 @@ def mock_worker_registry(state_manager: StateManager):
 # ============================================================================
 
 
-@pytest.fixture
-def sample_job_parameters() -> dict[JobType, dict[str, Any]]:
+@pytest.fixture(scope="session")
+def sample_job_parameters() -> Mapping[JobType, dict[str, Any]]:
     """Sample job parameters for different job types"""
-    return {
-        JobType.VALIDATION: {
-            "schema": "user_data",
-            "strict": True
-        },
-        JobType.PROCESSING: {
-            "batch_size": 100,
-            "timeout": 300
-        },
-        JobType.INTEGRATION: {
-            "endpoint": "https://api.example.com",
-            "method": "POST"
-        },
-        JobType.CLEANUP: {
-            "older_than_days": 30
-        }
-    }
+    return _SAMPLE_JOB_PARAMETERS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_workflow_config() -> dict[str, Any]:
     """Sample workflow configuration"""
-    now = datetime.now(UTC).isoformat()
     return {
         "name":
         "data-pipeline",
@@ -352,8 +416,8 @@ def sample_workflow_config() -> dict[str, Any]:
             "parameters": {
                 "schema": "input"
             },
-            "created_at": now,
-            "updated_at": now
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO
         }, {
             "id": "process-1",
             "type": JobType.PROCESSING.value,
@@ -361,69 +425,106 @@ def sample_workflow_config() -> dict[str, Any]:
                 "batch_size": 50
             },
             "on_success": ["integrate-1"],
-            "created_at": now,
-            "updated_at": now
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO
         }, {
             "id": "integrate-1",
             "type": JobType.INTEGRATION.value,
             "parameters": {
                 "endpoint": "/api/data"
             },
-            "created_at": now,
-            "updated_at": now
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO
         }]
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def workflow_with_jobs(
-        sample_job_parameters: dict[JobType, dict[str, Any]]) -> Callable:
+        sample_job_parameters: Mapping[JobType, dict[str, Any]]) -> Callable:
     """Create a workflow with jobs for testing
     
     Returns a function that accepts a TestClient and creates a workflow.
     This allows the fixture to work with the client fixture from individual test files.
     """
+    # The request body only differs by workflow ID, so serialize it once
+    workflow_template = json.dumps({
+        "id":
+        _WORKFLOW_ID_PLACEHOLDER,
+        "name":
+        "Test Pipeline",
+        "jobs": [{
+            "id": "job-1",
+            "type": JobType.VALIDATION.value,
+            "parameters": sample_job_parameters[JobType.VALIDATION],
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO
+        }, {
+            "id": "job-2",
+            "type": JobType.PROCESSING.value,
+            "parameters": sample_job_parameters[JobType.PROCESSING],
+            "on_success": ["job-3"],
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO
+        }, {
+            "id": "job-3",
+            "type": JobType.INTEGRATION.value,
+            "parameters": sample_job_parameters[JobType.INTEGRATION],
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO
+        }],
+        "created_at":
+        _NOW_ISO,
+        "updated_at":
+        _NOW_ISO
+    })
 
     def _create_workflow(client) -> dict[str, Any]:
-        from fastapi.testclient import TestClient
-        import uuid
-
-        # Use unique ID for each workflow to avoid conflicts between tests
-        workflow_id = f"wf-test-{uuid.uuid4().hex[:8]}"
-
-        workflow_data = {
-            "id":
-            workflow_id,
-            "name":
-            "Test Pipeline",
-            "jobs": [{
-                "id": "job-1",
-                "type": JobType.VALIDATION.value,
-                "parameters": sample_job_parameters[JobType.VALIDATION],
-                "created_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat()
-            }, {
-                "id": "job-2",
-                "type": JobType.PROCESSING.value,
-                "parameters": sample_job_parameters[JobType.PROCESSING],
-                "on_success": ["job-3"],
-                "created_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat()
-            }, {
-                "id": "job-3",
-                "type": JobType.INTEGRATION.value,
-                "parameters": sample_job_parameters[JobType.INTEGRATION],
-                "created_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat()
-            }],
-            "created_at":
-            datetime.now(UTC).isoformat(),
-            "updated_at":
-            datetime.now(UTC).isoformat()
-        }
-
-        response = client.post("/workflows", json=workflow_data)
+        # Use unique ID for each workflow to avoid conflicts between tests;
+        # the pid keeps IDs distinct across parallel test processes
+        workflow_id = f"wf-test-{_PID:x}-{next(_workflow_counter):x}"
+
+        response = client.post(
+            "/workflows",
+            content=workflow_template.replace(_WORKFLOW_ID_PLACEHOLDER,
+                                              workflow_id),
+            headers={"Content-Type": "application/json"})
         assert response.status_code == 200
         return response.json()
 
     return _create_workflow
+
+
+# ============================================================================
+# Polling Helpers
+# ============================================================================
+
+
+def _poll_until(predicate: Callable[[], _T],
+                timeout: float,
+                initial: float = 0.05,
+                cap: float = 1.0,
+                factor: float = 2.0) -> _T:
+    """Call predicate until it returns a truthy value, backing off between calls
+
+    Starts at `initial` seconds and multiplies the delay by `factor` up to
+    `cap`, so fast completions are seen quickly while long waits stay cheap.
+    Raises TimeoutError if the predicate is still falsy after `timeout`.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        result = predicate()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Condition not met within {timeout} seconds")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, cap)
+
+
+@pytest.fixture(scope="session")
+def poll_until() -> Callable[..., Any]:
+    """Deadline-bounded polling with exponential backoff"""
+    return _poll_until
@@ -1,101 +1,360 @@
 """Pytest fixtures for E2E tests."""
+import asyncio
+import json
+import os
 import time
 import subprocess
-import requests
+import tempfile
+import threading
 import pytest
+import websockets
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+from websockets.sync.client import connect as ws_connect
 from pathlib import Path
-from typing import Generator, Dict, Any
+from typing import (IO, Callable, Generator, Dict, Any, List, NoReturn,
+                    Optional, Tuple)
 
 from client.workflow_client import WorkflowClient
-from shared.enums import WorkflowStatus, JobStatus
+from shared.enums import (TERMINAL_WORKFLOW_STATUSES, JobStatus,
+                          WorkflowStatus)
 
 # Path to the E2E docker-compose file
 E2E_COMPOSE_FILE = Path(__file__).parent / "docker-compose.e2e.yml"
-COORDINATOR_URL = "http://localhost:8001"
 MAX_STARTUP_WAIT = 60  # seconds
+BUILD_TIMEOUT = 300  # seconds
+
+# Under pytest-xdist each worker (gw0, gw1, ...) gets its own compose project
+# and coordinator port, so the stacks run side by side without sharing state
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+COORDINATOR_PORT = 8001 + (int(_XDIST_WORKER[2:]) if _XDIST_WORKER else 0)
+COORDINATOR_URL = f"http://localhost:{COORDINATOR_PORT}"
+
+# Environment for compose calls: BuildKit lets independent build stages run
+# concurrently instead of one after another
+_COMPOSE_ENV = {
+    **os.environ,
+    "DOCKER_BUILDKIT": "1",
+    "COMPOSE_DOCKER_CLI_BUILD": "1",
+    "COORDINATOR_PORT": str(COORDINATOR_PORT),
+}
+if _XDIST_WORKER:
+    _COMPOSE_ENV["COMPOSE_PROJECT_NAME"] = f"wo_e2e_{_XDIST_WORKER}"
+
+
+def _compose_command(*args: str) -> List[str]:
+    """Build a docker-compose command line for the E2E compose file."""
+    return ["docker-compose", "-f", str(E2E_COMPOSE_FILE), *args]
+
+
+def _raise_with_stderr(error: subprocess.CalledProcessError) -> NoReturn:
+    """Re-raise a failed compose call with its stderr in the report."""
+    if error.stderr:
+        error.add_note(error.stderr)
+    raise error
+
+
+def _compose(*args: str,
+             check: bool = True,
+             **kwargs: Any) -> subprocess.CompletedProcess:
+    """Run a docker-compose command against the E2E compose file.
+
+    Output is discarded unless the caller asks for it, so build and
+    startup chatter never reaches pytest's capture buffers; stderr is kept
+    for the error report when the command fails.
+    """
+    if "capture_output" not in kwargs:
+        kwargs.setdefault("stdout", subprocess.DEVNULL)
+        kwargs.setdefault("stderr", subprocess.PIPE)
+        kwargs.setdefault("text", True)
+    try:
+        return subprocess.run(
+            _compose_command(*args),
+            check=check,
+            cwd=E2E_COMPOSE_FILE.parent,
+            env=_COMPOSE_ENV,
+            **kwargs)
+    except subprocess.CalledProcessError as e:
+        _raise_with_stderr(e)
+
+
+# Background image build started in pytest_sessionstart, with the file its
+# stderr goes to (a pipe could fill up and stall the build)
+_COMPOSE_BUILD = pytest.StashKey[Tuple[subprocess.Popen, IO[str]]]()
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Start building the E2E images while pytest collects tests."""
+    # Only runs when pytest is pointed at tests/e2e, so unit runs never build
+    if _XDIST_WORKER:
+        # The controller built the images before starting this worker
+        return
+    if getattr(session.config.option, "numprocesses", None):
+        # xdist controller: build once, before xdist starts the workers (its
+        # own sessionstart runs last). The images have fixed names, so every
+        # worker's stack uses them instead of building its own copy.
+        try:
+            _compose("build", "--parallel", timeout=BUILD_TIMEOUT)
+        except OSError:
+            pass  # docker-compose missing; each worker's fixture reports it
+        return
+
+    build_log = tempfile.TemporaryFile(mode="w+")
+    try:
+        build = subprocess.Popen(_compose_command("build", "--parallel"),
+                                 cwd=E2E_COMPOSE_FILE.parent,
+                                 env=_COMPOSE_ENV,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=build_log,
+                                 text=True)
+    except OSError:
+        # docker-compose missing; the fixture reports it when it's needed
+        build_log.close()
+        return
+    session.config.stash[_COMPOSE_BUILD] = (build, build_log)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Stop the background image build if no test waited for it."""
+    background_build = session.config.stash.get(_COMPOSE_BUILD, None)
+    if background_build is None:
+        return
+    build, build_log = background_build
+    if build.poll() is None:
+        build.terminate()
+    try:
+        build.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        build.kill()
+        build.wait()
+    build_log.close()
+
+
+class _CoordinatorWatcher:
+    """Tracks coordinator health and worker count from its event stream.
+
+    A background thread keeps one WebSocket open to /events/workers and
+    notifies a condition on every pushed update, so waiters wake as soon as
+    the state they want arrives rather than on the next poll tick.
+    """
+
+    def __init__(self, base_url: str):
+        self._url = base_url.replace("http", "ws", 1) + "/events/workers"
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._websocket = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.healthy = False
+        self.worker_count = 0
+
+    def start(self) -> None:
+        """Start following the coordinator's event stream."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop following the event stream and wait for the thread to exit."""
+        self._stopped.set()
+        websocket = self._websocket
+        if websocket is not None:
+            websocket.close()
+        self._thread.join(timeout=5)
+
+    def wait_for_health(self, timeout: float) -> bool:
+        """Wait until the coordinator accepts event subscribers."""
+        return self._wait_for(lambda: self.healthy, timeout)
+
+    def wait_for_workers(self, min_workers: int, timeout: float) -> bool:
+        """Wait until at least min_workers workers are registered."""
+        return self._wait_for(lambda: self.worker_count >= min_workers,
+                              timeout)
+
+    def wait_for_worker_count(self, expected: int, timeout: float) -> bool:
+        """Wait until exactly expected workers are registered."""
+        return self._wait_for(lambda: self.worker_count == expected, timeout)
+
+    def _wait_for(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(predicate, timeout)
+
+    def _run(self) -> None:
+        # Until the coordinator is up there is nothing to push to us, so
+        # reconnect with backoff starting at 50ms
+        delay = 0.05
+        while not self._stopped.is_set():
+            try:
+                with ws_connect(self._url, open_timeout=1) as websocket:
+                    self._websocket = websocket
+                    delay = 0.05
+                    for message in websocket:
+                        workers = json.loads(message)["workers"]
+                        with self._condition:
+                            self.healthy = True
+                            self.worker_count = len(workers)
+                            self._condition.notify_all()
+            except (OSError, InvalidHandshake, ConnectionClosed):
+                pass
+            finally:
+                self._websocket = None
+
+            with self._condition:
+                self.healthy = False
+            self._stopped.wait(delay)
+            delay = min(delay * 1.5, 1.0)
 
 
 @pytest.fixture(scope="session")
-def docker_compose_e2e() -> Generator[None, None, None]:
+def docker_compose_e2e(
+        pytestconfig: pytest.Config
+) -> Generator[_CoordinatorWatcher, None, None]:
     """Start and stop docker-compose for E2E tests."""
     print("\n🐳 Starting E2E test environment...")
 
-    # Start docker-compose
-    subprocess.run(
-        ["docker-compose", "-f",
-         str(E2E_COMPOSE_FILE), "up", "-d", "--build"],
-        check=True,
-        cwd=E2E_COMPOSE_FILE.parent)
+    # Images are normally already building in the background since session
+    # start (BuildKit builds independent stages in parallel); build here only
+    # if that didn't happen, then start the services without re-checking
+    background_build = pytestconfig.stash.get(_COMPOSE_BUILD, None)
+    if _XDIST_WORKER:
+        pass  # Built by the xdist controller
+    elif background_build is None:
+        _compose("build", "--parallel")
+    else:
+        build, build_log = background_build
+        with build_log:
+            if build.wait(timeout=BUILD_TIMEOUT) != 0:
+                build_log.seek(0)
+                _raise_with_stderr(
+                    subprocess.CalledProcessError(build.returncode,
+                                                  build.args,
+                                                  stderr=build_log.read()))
+    _compose("up", "-d", "--no-build")
 
     # Wait for services to be healthy
-    _wait_for_coordinator()
+    print(f"⏳ Waiting for coordinator at {COORDINATOR_URL}...")
+    watcher = _CoordinatorWatcher(COORDINATOR_URL)
+    watcher.start()
+    if not watcher.wait_for_health(MAX_STARTUP_WAIT):
+        watcher.stop()
+        raise TimeoutError(
+            f"Coordinator did not become healthy within {MAX_STARTUP_WAIT} seconds"
+        )
+    print(f"✓ Coordinator is healthy")
 
     print("✓ E2E test environment ready\n")
 
-    yield
+    yield watcher
 
-    # Teardown - stop and remove containers
+    watcher.stop()
+
+    # Teardown - stop and remove containers. They are thrown away anyway, so
+    # skip the 10s graceful-stop grace period (and on CI, skip it entirely)
     print("\n🧹 Cleaning up E2E test environment...")
-    subprocess.run(
-        ["docker-compose", "-f",
-         str(E2E_COMPOSE_FILE), "down", "-v"],
-        check=True,
-        cwd=E2E_COMPOSE_FILE.parent)
+    if os.getenv("CI"):
+        _compose("kill", check=False)
+    _compose("down", "-v", "-t", "1", "--remove-orphans")
     print("✓ E2E test environment cleaned up\n")
 
 
-def _wait_for_coordinator() -> None:
-    """Wait for the coordinator to be ready."""
-    print(f"⏳ Waiting for coordinator at {COORDINATOR_URL}...")
-
-    start_time = time.time()
-    while time.time() - start_time < MAX_STARTUP_WAIT:
-        try:
-            response = requests.get(f"{COORDINATOR_URL}/health", timeout=2)
-            if response.status_code == 200:
-                print(f"✓ Coordinator is healthy")
-                return
-        except requests.exceptions.RequestException:
-            pass
-        time.sleep(1)
-
-    raise TimeoutError(
-        f"Coordinator did not become healthy within {MAX_STARTUP_WAIT} seconds"
-    )
+@pytest.fixture(scope="session")
+def coordinator_watcher(
+        docker_compose_e2e: _CoordinatorWatcher) -> _CoordinatorWatcher:
+    """Get the watcher following the coordinator's event stream."""
+    return docker_compose_e2e
 
 
 @pytest.fixture(scope="session")
-def coordinator_url(docker_compose_e2e: None) -> str:
+def coordinator_url(docker_compose_e2e: _CoordinatorWatcher) -> str:
     """Get the coordinator URL."""
     return COORDINATOR_URL
 
 
-@pytest.fixture
-def e2e_client(coordinator_url: str) -> WorkflowClient:
-    """Create a workflow client for E2E tests."""
-    return WorkflowClient(base_url=coordinator_url)
+@pytest.fixture(scope="module")
+def e2e_client(coordinator_url: str) -> Generator[WorkflowClient, None, None]:
+    """Create a workflow client shared by the tests in a module."""
+    with WorkflowClient(base_url=coordinator_url) as client:
+        yield client
 
 
-@pytest.fixture
-def wait_for_workers(e2e_client: WorkflowClient, min_workers: int = 4) -> None:
-    """Wait for minimum number of workers to be connected."""
+def _wait_for_workers(coordinator_watcher: _CoordinatorWatcher,
+                      min_workers: int) -> None:
+    """Wait for min_workers workers, raising TimeoutError after 30s."""
     print(f"⏳ Waiting for at least {min_workers} workers...")
 
-    start_time = time.time()
-    while time.time() - start_time < 30:
-        workers = e2e_client.get_workers()
-        if len(workers) >= min_workers:
-            print(f"✓ {len(workers)} workers connected")
-            return
-        time.sleep(1)
+    if not coordinator_watcher.wait_for_workers(min_workers, timeout=30):
+        raise TimeoutError(
+            f"Expected at least {min_workers} workers, "
+            f"but only got {coordinator_watcher.worker_count}")
+    print(f"✓ {coordinator_watcher.worker_count} workers connected")
+
 
-    raise TimeoutError(
-        f"Expected at least {min_workers} workers, but only got {len(workers)}"
-    )
+@pytest.fixture
+def wait_for_workers(coordinator_watcher: _CoordinatorWatcher,
+                     min_workers: int = 4) -> None:
+    """Wait for minimum number of workers to be connected."""
+    _wait_for_workers(coordinator_watcher, min_workers)
 
 
 @pytest.fixture
-def workflow_waiter():
+def wait_for_worker_count(coordinator_watcher: _CoordinatorWatcher):
+    """Factory fixture for waiting on an exact number of workers."""
+
+    def _wait(expected: int, timeout: float = 10) -> None:
+        """Wait for the registered worker count to reach expected.
+        
+        Args:
+            expected: Number of workers that should be registered
+            timeout: Maximum time to wait in seconds
+            
+        Raises:
+            TimeoutError: If the count doesn't converge in time
+        """
+        if not coordinator_watcher.wait_for_worker_count(expected, timeout):
+            raise TimeoutError(
+                f"Expected {expected} workers within {timeout} seconds, "
+                f"but have {coordinator_watcher.worker_count}")
+
+    return _wait
+
+
+async def _wait_via_ws(client: WorkflowClient, workflow_id: str,
+                       timeout: float) -> WorkflowStatus:
+    """Block on the coordinator's status push stream until a terminal status."""
+    url = f"{client.base_url.replace('http', 'ws', 1)}/workflows/{workflow_id}/ws"
+    deadline = time.monotonic() + timeout
+
+    async with websockets.connect(url) as ws:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            frame = json.loads(await asyncio.wait_for(ws.recv(), remaining))
+            status = WorkflowStatus(frame["status"])
+            print(f"  Workflow {workflow_id}: {status}")
+            if status in TERMINAL_WORKFLOW_STATUSES:
+                return status
+
+
+def _wait_via_polling(client: WorkflowClient, workflow_id: str,
+                      timeout: float,
+                      poll_until: Callable[..., Any]) -> WorkflowStatus:
+    """Poll the workflow until a terminal status, backing off up to 0.5s."""
+    last_status = None
+
+    def _terminal_status() -> Optional[WorkflowStatus]:
+        nonlocal last_status
+        status = client.get_workflow_status(workflow_id)
+
+        if status != last_status:
+            print(f"  Workflow {workflow_id}: {status}")
+            last_status = status
+
+        if status in TERMINAL_WORKFLOW_STATUSES:
+            return status
+        return None
+
+    return poll_until(_terminal_status, timeout, cap=0.5)
+
+
+@pytest.fixture(scope="session")
+def workflow_waiter(poll_until):
     """Factory fixture for waiting on workflow completion."""
 
     def _wait_for_workflow(
@@ -118,47 +377,111 @@ def workflow_waiter():
         Raises:
             TimeoutError: If workflow doesn't reach expected status in time
         """
-        start_time = time.time()
-        last_status = None
-
-        while time.time() - start_time < timeout:
-            workflow = client.get_workflow(workflow_id)
-
-            if workflow.status != last_status:
-                print(f"  Workflow {workflow_id}: {workflow.status}")
-                last_status = workflow.status
-
-            # Check if we've reached a terminal state
-            if workflow.status in [
-                    WorkflowStatus.COMPLETED, WorkflowStatus.FAILED,
-                    WorkflowStatus.CANCELLED
-            ]:
-                if workflow.status == expected_status:
-                    return workflow.model_dump()
-                else:
-                    raise AssertionError(
-                        f"Workflow ended with status {workflow.status}, "
-                        f"expected {expected_status}")
-
-            time.sleep(0.5)
-
-        raise TimeoutError(
-            f"Workflow {workflow_id} did not reach {expected_status} within {timeout} seconds. "
-            f"Last status: {last_status}")
+        start_time = time.monotonic()
+        try:
+            try:
+                asyncio.run(_wait_via_ws(client, workflow_id, timeout))
+            except TimeoutError:
+                raise
+            except (OSError, InvalidHandshake, ConnectionClosed):
+                # Coordinator without the status stream, or the stream closed
+                # before a terminal status; fall back to polling
+                remaining = timeout - (time.monotonic() - start_time)
+                _wait_via_polling(client, workflow_id, remaining, poll_until)
+        except TimeoutError:
+            raise TimeoutError(
+                f"Workflow {workflow_id} did not reach {expected_status} "
+                f"within {timeout} seconds. "
+                f"Last status: {client.get_workflow_status(workflow_id)}"
+            ) from None
+
+        workflow = client.get_workflow(workflow_id)
+        if workflow.status != expected_status:
+            raise AssertionError(
+                f"Workflow ended with status {workflow.status}, "
+                f"expected {expected_status}")
+        return workflow.model_dump()
 
     return _wait_for_workflow
 
 
+@pytest.fixture(scope="class")
+def completed_data_pipeline_workflow(
+        e2e_client: WorkflowClient, coordinator_watcher: _CoordinatorWatcher,
+        workflow_waiter, workflow_definitions: Dict[str, str]
+) -> Dict[str, Any]:
+    """Run data-processing-pipeline once per test class.
+    
+    For tests that only inspect a finished workflow; tests that need to
+    watch it run should submit their own.
+    
+    Returns:
+        Final workflow data as dictionary
+    """
+    # The wait_for_workers fixture is per test, so it can't be requested here
+    _wait_for_workers(coordinator_watcher, 4)
+
+    workflow = e2e_client.submit_and_start_workflow_yaml(
+        workflow_definitions["data-processing-pipeline"])
+    print(f"\n📋 Submitted shared workflow: {workflow.id}")
+    assert workflow.status in (WorkflowStatus.PENDING, WorkflowStatus.RUNNING)
+    return workflow_waiter(e2e_client, workflow.id, timeout=30)
+
+
 @pytest.fixture
+def workflow_events_waiter():
+    """Factory fixture for waiting on several workflows over one stream."""
+
+    def _wait_for_workflows(client: WorkflowClient,
+                            workflow_ids: List[str],
+                            timeout: float = 60) -> Dict[str, WorkflowStatus]:
+        """Wait for workflows to reach a terminal status.
+        
+        Args:
+            client: WorkflowClient instance
+            workflow_ids: IDs of the workflows to monitor
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Terminal status of each workflow that finished within the
+            timeout; workflows still running are left out
+        """
+        statuses: Dict[str, WorkflowStatus] = {}
+        try:
+            for workflow_id, status in client.stream_workflow_events(
+                    workflow_ids, timeout=timeout):
+                if status in TERMINAL_WORKFLOW_STATUSES:
+                    statuses[workflow_id] = status
+                    print(f"  {workflow_id}: {status} "
+                          f"({len(statuses)}/{len(workflow_ids)})")
+        except TimeoutError:
+            pass
+        return statuses
+
+    return _wait_for_workflows
+
+
+@pytest.fixture(scope="session")
 def workflow_definitions_path() -> Path:
     """Get the path to workflow definitions directory."""
     return Path(
         __file__).parent.parent.parent / "examples" / "workflow_definitions"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def workflow_definitions(workflow_definitions_path: Path) -> Dict[str, str]:
+    """YAML text of every example workflow, keyed by file stem, read once."""
+    return {
+        path.stem: path.read_text()
+        for path in workflow_definitions_path.glob("*.yaml")
+    }
+
+
+@pytest.fixture(scope="session")
 def get_container_logs():
     """Factory fixture for getting container logs."""
+    # service name -> container ID, resolved through compose only once
+    container_ids: Dict[str, str] = {}
 
     def _get_logs(service_name: str, tail: int = 50) -> str:
         """Get logs from a docker-compose service.
@@ -170,21 +493,66 @@ def get_container_logs():
         Returns:
             Log output as string
         """
-        result = subprocess.run([
-            "docker-compose", "-f",
-            str(E2E_COMPOSE_FILE), "logs", "--tail",
-            str(tail), service_name
-        ],
-                                capture_output=True,
-                                text=True,
-                                cwd=E2E_COMPOSE_FILE.parent)
+        container_id = container_ids.get(service_name)
+        if container_id is None:
+            result = _compose("ps", "-q", service_name,
+                              check=False,
+                              capture_output=True,
+                              text=True)
+            container_id = result.stdout.strip()
+            if not container_id:
+                return ""
+            container_ids[service_name] = container_id
+
+        # Ask the daemon directly rather than re-resolving the compose project;
+        # services log to stderr, so fold it into the output
+        result = subprocess.run(["docker", "logs", "--tail", str(tail),
+                                 container_id],
+                                check=False,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT,
+                                text=True)
         return result.stdout
 
     return _get_logs
 
 
 @pytest.fixture
-def stop_worker():
+def stop_workers():
+    """Factory fixture for stopping several worker containers at once."""
+
+    def _stop(worker_ids: List[str]) -> None:
+        """Stop worker containers with a single compose call.
+        
+        Args:
+            worker_ids: Worker service names (e.g., ['worker-e2e-1'])
+        """
+        # Workers hold no state worth a graceful shutdown, so don't wait out
+        # compose's default 10s grace period before killing the containers
+        _compose("stop", "-t", "1", *worker_ids)
+        print(f"🛑 Stopped {', '.join(worker_ids)}")
+
+    return _stop
+
+
+@pytest.fixture
+def start_workers():
+    """Factory fixture for starting several worker containers at once."""
+
+    def _start(worker_ids: List[str]) -> None:
+        """Start worker containers with a single compose call.
+        
+        Args:
+            worker_ids: Worker service names (e.g., ['worker-e2e-1'])
+        """
+        _compose("start", *worker_ids)
+        print(f"🟢 Started {', '.join(worker_ids)}")
+
+    return _start
+
+
+@pytest.fixture
+def stop_worker(stop_workers):
     """Factory fixture for stopping a worker container."""
 
     def _stop(worker_id: str) -> None:
@@ -193,18 +561,13 @@ def stop_worker():
         Args:
             worker_id: Worker service name (e.g., 'worker-e2e-1')
         """
-        subprocess.run(
-            ["docker-compose", "-f",
-             str(E2E_COMPOSE_FILE), "stop", worker_id],
-            check=True,
-            cwd=E2E_COMPOSE_FILE.parent)
-        print(f"🛑 Stopped {worker_id}")
+        stop_workers([worker_id])
 
     return _stop
 
 
 @pytest.fixture
-def start_worker():
+def start_worker(start_workers):
     """Factory fixture for starting a worker container."""
 
     def _start(worker_id: str) -> None:
@@ -213,13 +576,6 @@ def start_worker():
         Args:
             worker_id: Worker service name (e.g., 'worker-e2e-1')
         """
-        subprocess.run([
-            "docker-compose", "-f",
-            str(E2E_COMPOSE_FILE), "start", worker_id
-        ],
-                       check=True,
-                       cwd=E2E_COMPOSE_FILE.parent)
-        print(f"🟢 Started {worker_id}")
-        time.sleep(2)  # Give it time to connect
+        start_workers([worker_id])
 
     return _start
@@ -1,11 +1,14 @@
 """E2E tests for failure scenarios and edge cases."""
 import pytest
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from client.workflow_client import WorkflowClient
 from shared.enums import WorkflowStatus, JobStatus
 
+_ALL_WORKERS = [f"worker-e2e-{i}" for i in range(1, 5)]
+
 
 @pytest.mark.e2e
 class TestFailureScenarios:
@@ -55,12 +58,12 @@ class TestFailureScenarios:
                                                e2e_client: WorkflowClient,
                                                wait_for_workers,
                                                workflow_waiter,
-                                               workflow_definitions_path):
+                                               workflow_definitions):
         """Test cancelling a workflow that's already completed."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(pipeline_yaml)
 
         # Wait for completion
         workflow_waiter(e2e_client, workflow.id, timeout=30)
@@ -78,12 +81,12 @@ class TestFailureScenarios:
 
     def test_start_already_running_workflow(self, e2e_client: WorkflowClient,
                                             wait_for_workers,
-                                            workflow_definitions_path):
+                                            workflow_definitions):
         """Test starting a workflow that's already running."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(pipeline_yaml)
 
         # Try to start it again immediately
         try:
@@ -98,15 +101,14 @@ class TestFailureScenarios:
     def test_workflow_with_no_workers_available(self,
                                                 e2e_client: WorkflowClient,
                                                 wait_for_workers,
-                                                workflow_definitions_path,
-                                                stop_worker, start_worker):
+                                                workflow_definitions,
+                                                stop_workers, start_workers):
         """Test workflow behavior when no workers are available."""
         wait_for_workers
 
         # Stop all workers
         print("\n🛑 Stopping all workers...")
-        for i in range(1, 5):
-            stop_worker(f"worker-e2e-{i}")
+        stop_workers(_ALL_WORKERS)
 
         time.sleep(3)
 
@@ -115,8 +117,8 @@ class TestFailureScenarios:
         print(f"  Active workers: {len(workers)}")
 
         # Submit a workflow
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(pipeline_yaml)
 
         print(f"📋 Submitted workflow with no workers: {workflow.id}")
 
@@ -133,51 +135,45 @@ class TestFailureScenarios:
 
         # Restart workers for subsequent tests
         print("\n🟢 Restarting all workers...")
-        for i in range(1, 5):
-            start_worker(f"worker-e2e-{i}")
+        start_workers(_ALL_WORKERS)
 
         time.sleep(3)  # Give them time to reconnect
 
     def test_rapid_workflow_submission(self, e2e_client: WorkflowClient,
                                        wait_for_workers,
-                                       workflow_definitions_path):
+                                       workflow_definitions):
         """Test submitting many workflows very quickly."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
 
-        # Submit many workflows as fast as possible
+        # Submit many workflows as fast as possible, in one request
         num_workflows = 10
-        workflow_ids = []
 
         print(f"\n⚡ Rapidly submitting {num_workflows} workflows...")
         start = time.time()
 
-        for i in range(num_workflows):
-            try:
-                workflow = e2e_client.submit_workflow_from_yaml(str(yaml_path))
-                workflow_ids.append(workflow.id)
-            except Exception as e:
-                print(f"  Error on submission {i}: {e}")
+        workflow_ids = e2e_client.submit_workflows_yaml([pipeline_yaml] *
+                                                        num_workflows)
 
         elapsed = time.time() - start
         print(
             f"  Submitted {len(workflow_ids)}/{num_workflows} in {elapsed:.2f}s"
         )
 
-        # At least most should succeed
-        assert len(workflow_ids) >= num_workflows * 0.9
+        # The batch is accepted or rejected as a whole
+        assert len(workflow_ids) == num_workflows
 
         print("✓ Rapid submission handled successfully")
 
     def test_workflow_timeout_scenario(self, e2e_client: WorkflowClient,
                                        wait_for_workers, workflow_waiter,
-                                       workflow_definitions_path):
+                                       workflow_definitions):
         """Test workflow with intentionally short timeout."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(pipeline_yaml)
 
         print(f"\n📋 Testing timeout with workflow: {workflow.id}")
 
@@ -242,30 +238,25 @@ workflow:
     def test_concurrent_operations_on_same_workflow(self,
                                                     e2e_client: WorkflowClient,
                                                     wait_for_workers,
-                                                    workflow_definitions_path):
+                                                    workflow_definitions):
         """Test concurrent reads/operations on the same workflow."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(pipeline_yaml)
 
         print(f"\n📋 Testing concurrent operations on: {workflow.id}")
 
         # Rapidly query the same workflow multiple times
-        import concurrent.futures
-
-        def get_workflow_status():
+        def get_workflow_status(_):
             try:
                 wf = e2e_client.get_workflow(workflow.id)
                 return wf.status
             except Exception as e:
                 return f"Error: {type(e).__name__}"
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(get_workflow_status) for _ in range(10)]
-            results = [
-                f.result() for f in concurrent.futures.as_completed(futures)
-            ]
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(get_workflow_status, range(10)))
 
         # Should get valid statuses (not errors)
         valid_results = [r for r in results if not str(r).startswith("Error")]
@@ -277,25 +268,21 @@ workflow:
 
     def test_health_check_during_load(self, e2e_client: WorkflowClient,
                                       wait_for_workers,
-                                      workflow_definitions_path):
+                                      workflow_definitions):
         """Test that health endpoint remains responsive under load."""
         wait_for_workers
 
         # Start several workflows
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
         for i in range(3):
-            e2e_client.submit_and_start_workflow(str(yaml_path))
-
-        # Check health repeatedly
-        import requests
-        health_url = e2e_client.base_url + "/health"
+            e2e_client.submit_and_start_workflow_yaml(pipeline_yaml)
 
+        # Check health repeatedly, over the client's keep-alive connections
         successes = 0
         for i in range(10):
             try:
-                response = requests.get(health_url, timeout=2)
-                if response.status_code == 200:
-                    successes += 1
+                e2e_client.get_health(timeout=2)
+                successes += 1
             except Exception:
                 pass
             time.sleep(0.5)
@@ -4,7 +4,7 @@ import time
 from typing import List
 
 from client.workflow_client import WorkflowClient
-from shared.enums import WorkflowStatus
+from shared.enums import WorkflowStatus, JobStatus
 from shared.models import Workflow
 
 
@@ -14,32 +14,30 @@ class TestParallelExecution:
 
     def test_multiple_concurrent_workflows(self, e2e_client: WorkflowClient,
                                            wait_for_workers, workflow_waiter,
-                                           workflow_definitions_path):
+                                           workflow_definitions):
         """Test executing multiple workflows concurrently."""
         wait_for_workers
 
-        # Submit multiple workflows at once
-        workflows = []
-        yaml_files = [
-            "data-processing-pipeline.yaml", "deployment-pipeline.yaml",
-            "parallel-processing.yaml"
+        # Submit multiple workflows at once, in a single request
+        names = [
+            "data-processing-pipeline", "deployment-pipeline",
+            "parallel-processing"
         ]
 
-        print(f"\n📋 Submitting {len(yaml_files)} concurrent workflows...")
-        for yaml_file in yaml_files:
-            yaml_path = workflow_definitions_path / yaml_file
-            workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
-            workflows.append(workflow)
-            print(f"  - {workflow.id} ({yaml_file})")
+        print(f"\n📋 Submitting {len(names)} concurrent workflows...")
+        workflows = e2e_client.submit_and_start_workflows_yaml(
+            [workflow_definitions[name] for name in names])
+        for workflow_id, name in zip(workflows, names):
+            print(f"  - {workflow_id} ({name})")
 
         # Wait for all to complete
         print("\n⏳ Waiting for all workflows to complete...")
-        for workflow in workflows:
+        for workflow_id in workflows:
             final_workflow = workflow_waiter(e2e_client,
-                                             workflow.id,
+                                             workflow_id,
                                              timeout=60)
             assert final_workflow["status"] == WorkflowStatus.COMPLETED
-            print(f"  ✓ {workflow.id} completed")
+            print(f"  ✓ {workflow_id} completed")
 
         print(
             f"\n✓ All {len(workflows)} concurrent workflows completed successfully"
@@ -47,42 +45,35 @@ class TestParallelExecution:
 
     def test_workflow_execution_isolation(self, e2e_client: WorkflowClient,
                                           wait_for_workers,
-                                          workflow_definitions_path):
+                                          workflow_events_waiter,
+                                          workflow_definitions):
         """Test that concurrent workflows don't interfere with each other."""
         wait_for_workers
 
-        # Submit two identical workflows
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow1 = e2e_client.submit_and_start_workflow(str(yaml_path))
-        workflow2 = e2e_client.submit_and_start_workflow(str(yaml_path))
+        # Submit two identical workflows, in a single request
+        workflow_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow_ids = e2e_client.submit_and_start_workflows_yaml(
+            [workflow_yaml] * 2)
 
         print(f"\n📋 Started two identical workflows:")
-        print(f"  - {workflow1.id}")
-        print(f"  - {workflow2.id}")
+        for workflow_id in workflow_ids:
+            print(f"  - {workflow_id}")
 
         # Monitor both
-        completed = set()
-        start_time = time.time()
-
-        while time.time() - start_time < 60:
-            for wf_id in [workflow1.id, workflow2.id]:
-                if wf_id not in completed:
-                    wf = e2e_client.get_workflow(wf_id)
-                    if wf.status == WorkflowStatus.COMPLETED:
-                        completed.add(wf_id)
-                        print(f"  ✓ {wf_id} completed")
-
-            if len(completed) == 2:
-                break
-
-            time.sleep(1)
+        final_statuses = workflow_events_waiter(e2e_client,
+                                                workflow_ids,
+                                                timeout=60)
+        completed = {
+            wf_id
+            for wf_id, status in final_statuses.items()
+            if status == WorkflowStatus.COMPLETED
+        }
 
         assert len(
             completed) == 2, f"Only {len(completed)}/2 workflows completed"
 
         # Verify both have their own job sets (no sharing)
-        wf1_final = e2e_client.get_workflow(workflow1.id)
-        wf2_final = e2e_client.get_workflow(workflow2.id)
+        wf1_final, wf2_final = e2e_client.get_workflows_many(workflow_ids)
 
         wf1_job_ids = set(job.id for job in wf1_final.jobs)
         wf2_job_ids = set(job.id for job in wf2_final.jobs)
@@ -93,60 +84,29 @@ class TestParallelExecution:
         print(f"✓ Workflows executed in isolation with separate job instances")
 
     def test_high_concurrency_stress(self, e2e_client: WorkflowClient,
-                                     wait_for_workers,
-                                     workflow_definitions_path):
+                                     wait_for_workers, workflow_events_waiter,
+                                     workflow_definitions):
         """Test system under high concurrent workflow load."""
         wait_for_workers
 
-        # Submit many workflows quickly
+        # Submit many workflows quickly, in a single request
         num_workflows = 5
-        workflows = []
 
         print(
             f"\n📋 Stress test: submitting {num_workflows} workflows rapidly..."
         )
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-
-        for i in range(num_workflows):
-            workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
-            workflows.append(workflow.id)
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
+        workflows = e2e_client.submit_and_start_workflows_yaml(
+            [pipeline_yaml] * num_workflows)
 
         print(f"  ✓ Submitted {num_workflows} workflows")
 
-        # Monitor completion
-        completed = 0
-        start_time = time.time()
-
-        while time.time() - start_time < 120:  # 2 minutes max
-            all_complete = True
-            current_completed = 0
-
-            for wf_id in workflows:
-                wf = e2e_client.get_workflow(wf_id)
-                if wf.status == WorkflowStatus.COMPLETED:
-                    current_completed += 1
-                elif wf.status not in [
-                        WorkflowStatus.FAILED, WorkflowStatus.CANCELLED
-                ]:
-                    all_complete = False
-
-            if current_completed > completed:
-                print(
-                    f"  Progress: {current_completed}/{num_workflows} completed"
-                )
-                completed = current_completed
-
-            if all_complete:
-                break
-
-            time.sleep(2)
+        # Monitor completion (2 minutes max)
+        final_statuses = workflow_events_waiter(e2e_client,
+                                                workflows,
+                                                timeout=120)
 
         # Verify all completed
-        final_statuses = {}
-        for wf_id in workflows:
-            wf = e2e_client.get_workflow(wf_id)
-            final_statuses[wf_id] = wf.status
-
         completed_count = sum(1 for s in final_statuses.values()
                               if s == WorkflowStatus.COMPLETED)
 
@@ -157,34 +117,36 @@ class TestParallelExecution:
 
     def test_parallel_jobs_within_workflow(self, e2e_client: WorkflowClient,
                                            wait_for_workers, workflow_waiter,
-                                           workflow_definitions_path):
+                                           poll_until, workflow_definitions):
         """Test that jobs within a workflow can execute in parallel."""
         wait_for_workers
 
         # Use parallel-processing workflow which has independent jobs
-        yaml_path = workflow_definitions_path / "parallel-processing.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["parallel-processing"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         print(f"\n📋 Started parallel processing workflow: {workflow.id}")
 
-        # Track job statuses over time
-        job_running_count = []
-        start_time = time.time()
+        # Track the most jobs seen running at once
+        max_parallel = 0
 
-        while time.time() - start_time < 30:
+        def _workflow_done() -> bool:
+            nonlocal max_parallel
             wf = e2e_client.get_workflow(workflow.id)
 
             if wf.status == WorkflowStatus.COMPLETED:
-                break
+                return True
 
             # Count currently running jobs
-            from shared.enums import JobStatus
-            running = sum(1 for job in wf.jobs
-                          if job.status == JobStatus.RUNNING)
-            if running > 0:
-                job_running_count.append(running)
+            running = sum(job.status == JobStatus.RUNNING for job in wf.jobs)
+            if running > max_parallel:
+                max_parallel = running
+            return False
 
-            time.sleep(0.5)
+        try:
+            poll_until(_workflow_done, timeout=30, cap=0.5)
+        except TimeoutError:
+            pass
 
         # Wait for final completion
         final_workflow = workflow_waiter(e2e_client, workflow.id, timeout=30)
@@ -192,42 +154,31 @@ class TestParallelExecution:
         assert final_workflow["status"] == WorkflowStatus.COMPLETED
 
         # If we saw multiple jobs running simultaneously, parallel execution occurred
-        max_parallel = max(job_running_count) if job_running_count else 0
         print(f"  Max parallel jobs: {max_parallel}")
         print(f"✓ Parallel job execution within workflow: {max_parallel > 1}")
 
     def test_workflow_throughput(self, e2e_client: WorkflowClient,
-                                 wait_for_workers, workflow_definitions_path):
+                                 wait_for_workers, workflow_events_waiter,
+                                 workflow_definitions):
         """Test workflow processing throughput."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
+        pipeline_yaml = workflow_definitions["data-processing-pipeline"]
 
-        # Submit workflows and track timing
+        # Submit workflows in a single request and track timing
         num_workflows = 3
-        workflows = []
 
         print(f"\n📊 Throughput test: {num_workflows} workflows...")
         start_time = time.time()
 
-        for i in range(num_workflows):
-            workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
-            workflows.append(workflow.id)
+        workflows = e2e_client.submit_and_start_workflows_yaml(
+            [pipeline_yaml] * num_workflows)
 
         # Wait for all to complete
-        all_completed = False
-        while time.time() - start_time < 90:
-            completed = 0
-            for wf_id in workflows:
-                wf = e2e_client.get_workflow(wf_id)
-                if wf.status == WorkflowStatus.COMPLETED:
-                    completed += 1
-
-            if completed == num_workflows:
-                all_completed = True
-                break
-
-            time.sleep(1)
+        final_statuses = workflow_events_waiter(
+            e2e_client, workflows, timeout=90 - (time.time() - start_time))
+        all_completed = list(final_statuses.values()).count(
+            WorkflowStatus.COMPLETED) == num_workflows
 
         end_time = time.time()
         elapsed = end_time - start_time
@@ -242,20 +193,21 @@ class TestParallelExecution:
                                                 e2e_client: WorkflowClient,
                                                 wait_for_workers,
                                                 workflow_waiter,
-                                                workflow_definitions_path):
+                                                workflow_events_waiter,
+                                                workflow_definitions):
         """Compare sequential vs parallel workflow execution."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
+        workflow_yaml = workflow_definitions["data-processing-pipeline"]
 
         # Sequential execution
         print("\n📊 Sequential execution test...")
         seq_start = time.time()
 
-        workflow1 = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow1 = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
         workflow_waiter(e2e_client, workflow1.id, timeout=30)
 
-        workflow2 = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow2 = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
         workflow_waiter(e2e_client, workflow2.id, timeout=30)
 
         seq_time = time.time() - seq_start
@@ -265,11 +217,11 @@ class TestParallelExecution:
         print("\n📊 Parallel execution test...")
         par_start = time.time()
 
-        workflow3 = e2e_client.submit_and_start_workflow(str(yaml_path))
-        workflow4 = e2e_client.submit_and_start_workflow(str(yaml_path))
+        # Submit and start both in one request so neither waits on the other
+        parallel_ids = e2e_client.submit_and_start_workflows_yaml(
+            [workflow_yaml] * 2)
 
-        workflow_waiter(e2e_client, workflow3.id, timeout=30)
-        workflow_waiter(e2e_client, workflow4.id, timeout=30)
+        workflow_events_waiter(e2e_client, parallel_ids, timeout=30)
 
         par_time = time.time() - par_start
         print(f"  Parallel time: {par_time:.2f}s")
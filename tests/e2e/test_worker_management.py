@@ -6,6 +6,10 @@ from typing import Callable
 from client.workflow_client import WorkflowClient
 from shared.enums import WorkflowStatus
 
+# Job types every E2E worker is configured to handle
+_EXPECTED_CAPS = frozenset(
+    {"validation", "processing", "integration", "cleanup"})
+
 
 @pytest.mark.e2e
 class TestWorkerManagement:
@@ -38,43 +42,40 @@ class TestWorkerManagement:
 
         workers = e2e_client.get_workers()
 
-        expected_capabilities = {
-            "validation", "processing", "integration", "cleanup"
-        }
-
         for worker in workers:
-            worker_caps = set(worker.capabilities)
-            assert worker_caps == expected_capabilities, \
+            worker_caps = frozenset(worker.capabilities)
+            assert worker_caps == _EXPECTED_CAPS, \
                 f"Worker {worker.id} has incorrect capabilities: {worker_caps}"
 
-        print(
-            f"✓ All workers have correct capabilities: {expected_capabilities}"
-        )
+        print(f"✓ All workers have correct capabilities: {set(_EXPECTED_CAPS)}")
 
     def test_workflow_execution_with_worker_failure(self,
                                                     e2e_client: WorkflowClient,
                                                     wait_for_workers,
                                                     workflow_waiter,
-                                                    workflow_definitions_path,
-                                                    stop_worker, start_worker):
+                                                    workflow_definitions,
+                                                    stop_worker, start_worker,
+                                                    wait_for_worker_count):
         """Test that workflows can continue when a worker fails."""
         wait_for_workers
 
         # Submit and start a workflow
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         print(f"\n📋 Started workflow: {workflow.id}")
 
         # Let it start executing
         time.sleep(2)
 
+        initial_count = len(e2e_client.get_workers())
+
         # Stop one worker
         print("🛑 Stopping worker-e2e-1...")
         stop_worker("worker-e2e-1")
 
         # Verify worker count decreased
-        time.sleep(2)
+        wait_for_worker_count(initial_count - 1)
         workers = e2e_client.get_workers()
         print(f"  Workers remaining: {len(workers)}")
 
@@ -94,7 +95,8 @@ class TestWorkerManagement:
         start_worker("worker-e2e-1")
 
     def test_worker_reconnection(self, e2e_client: WorkflowClient,
-                                 wait_for_workers, stop_worker, start_worker):
+                                 wait_for_workers, stop_worker, start_worker,
+                                 wait_for_worker_count):
         """Test that a worker can disconnect and reconnect."""
         wait_for_workers
 
@@ -105,7 +107,7 @@ class TestWorkerManagement:
 
         # Stop a worker
         stop_worker("worker-e2e-2")
-        time.sleep(3)
+        wait_for_worker_count(initial_count - 1)
 
         # Verify worker disconnected
         workers = e2e_client.get_workers()
@@ -114,7 +116,7 @@ class TestWorkerManagement:
 
         # Restart the worker
         start_worker("worker-e2e-2")
-        time.sleep(3)
+        wait_for_worker_count(initial_count)
 
         # Verify worker reconnected
         workers = e2e_client.get_workers()
@@ -130,13 +132,13 @@ class TestWorkerManagement:
     def test_load_distribution_across_workers(self, e2e_client: WorkflowClient,
                                               wait_for_workers,
                                               workflow_waiter,
-                                              workflow_definitions_path):
+                                              workflow_definitions):
         """Test that jobs are distributed across multiple workers."""
         wait_for_workers
 
         # Submit a workflow with multiple jobs
-        yaml_path = workflow_definitions_path / "parallel-processing.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["parallel-processing"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         print(f"\n📋 Started parallel workflow: {workflow.id}")
 
@@ -155,45 +157,38 @@ class TestWorkerManagement:
         """Test that worker list remains consistent across multiple queries."""
         wait_for_workers
 
-        # Get worker list multiple times
-        workers_1 = e2e_client.get_workers()
-        time.sleep(1)
-        workers_2 = e2e_client.get_workers()
-        time.sleep(1)
-        workers_3 = e2e_client.get_workers()
-
-        # Should have same count
-        assert len(workers_1) == len(workers_2) == len(workers_3)
-
-        # Should have same worker IDs
-        ids_1 = set(w.id for w in workers_1)
-        ids_2 = set(w.id for w in workers_2)
-        ids_3 = set(w.id for w in workers_3)
-
-        assert ids_1 == ids_2 == ids_3
+        # Get the worker list once, then check its ETag stays the same
+        workers = e2e_client.get_workers()
+        etag = e2e_client.get_workers_etag()
+        time.sleep(0.1)
+        assert e2e_client.get_workers_etag() == etag
+        time.sleep(0.1)
+        assert e2e_client.get_workers_etag() == etag
 
-        print(f"✓ Worker list consistent across queries: {ids_1}")
+        ids = set(w.id for w in workers)
+        print(f"✓ Worker list consistent across queries: {ids}")
 
     def test_multiple_worker_failures(self, e2e_client: WorkflowClient,
                                       wait_for_workers, workflow_waiter,
-                                      workflow_definitions_path, stop_worker,
-                                      start_worker):
+                                      workflow_definitions, stop_workers,
+                                      start_workers, wait_for_worker_count):
         """Test system behavior when multiple workers fail."""
         wait_for_workers
 
         # Submit workflow
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         print(f"\n📋 Started workflow: {workflow.id}")
         time.sleep(2)
 
+        initial_count = len(e2e_client.get_workers())
+
         # Stop multiple workers
         print("🛑 Stopping multiple workers...")
-        stop_worker("worker-e2e-1")
-        stop_worker("worker-e2e-2")
+        stop_workers(["worker-e2e-1", "worker-e2e-2"])
 
-        time.sleep(3)
+        wait_for_worker_count(initial_count - 2)
 
         # Check remaining workers
         workers = e2e_client.get_workers()
@@ -209,9 +204,8 @@ class TestWorkerManagement:
             print(f"✓ Workflow survived multiple worker failures")
         finally:
             # Restart workers for cleanup
-            start_worker("worker-e2e-1")
-            start_worker("worker-e2e-2")
-            time.sleep(3)
+            start_workers(["worker-e2e-1", "worker-e2e-2"])
+            wait_for_worker_count(initial_count)
 
     def test_worker_status_reporting(self, e2e_client: WorkflowClient,
                                      wait_for_workers):
@@ -1,34 +1,21 @@
 """E2E tests for complete workflow lifecycle."""
 import pytest
-from pathlib import Path
+from typing import Any, Dict
 
 from client.workflow_client import WorkflowClient
-from shared.enums import WorkflowStatus, JobStatus
+from shared.enums import (TERMINAL_WORKFLOW_STATUSES, JobStatus,
+                          WorkflowStatus)
 
 
 @pytest.mark.e2e
 class TestWorkflowLifecycle:
     """Test complete workflow execution from submission to completion."""
 
-    def test_data_processing_pipeline(self, e2e_client: WorkflowClient,
-                                      wait_for_workers, workflow_waiter,
-                                      workflow_definitions_path: Path):
+    def test_data_processing_pipeline(
+            self, completed_data_pipeline_workflow: Dict[str, Any]):
         """Test the data processing pipeline workflow end-to-end."""
-        # Ensure workers are ready
-        wait_for_workers
-
-        # Submit and start workflow
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
-
-        print(f"\n📋 Submitted workflow: {workflow.id}")
-        assert workflow.status in [
-            WorkflowStatus.PENDING, WorkflowStatus.RUNNING
-        ]
-        assert len(workflow.jobs) == 5  # Verify correct number of jobs
-
-        # Wait for completion
-        final_workflow = workflow_waiter(e2e_client, workflow.id, timeout=30)
+        final_workflow = completed_data_pipeline_workflow
+        assert len(final_workflow["jobs"]) == 5  # Verify correct number of jobs
 
         # Verify workflow completed successfully
         assert final_workflow["status"] == WorkflowStatus.COMPLETED
@@ -40,19 +27,19 @@ class TestWorkflowLifecycle:
         ]
         assert len(completed_jobs) > 0, "At least some jobs should complete"
 
-        print(f"✓ Workflow {workflow.id} completed successfully")
+        print(f"✓ Workflow {final_workflow['id']} completed successfully")
         print(
             f"  Jobs completed: {len(completed_jobs)}/{len(final_workflow['jobs'])}"
         )
 
     def test_deployment_pipeline(self, e2e_client: WorkflowClient,
                                  wait_for_workers, workflow_waiter,
-                                 workflow_definitions_path: Path):
+                                 workflow_definitions: Dict[str, str]):
         """Test the deployment pipeline workflow end-to-end."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "deployment-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["deployment-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         print(f"\n📋 Submitted deployment workflow: {workflow.id}")
 
@@ -64,12 +51,12 @@ class TestWorkflowLifecycle:
 
     def test_parallel_processing_workflow(self, e2e_client: WorkflowClient,
                                           wait_for_workers, workflow_waiter,
-                                          workflow_definitions_path: Path):
+                                          workflow_definitions: Dict[str, str]):
         """Test parallel processing workflow with concurrent jobs."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "parallel-processing.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["parallel-processing"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         print(f"\n📋 Submitted parallel workflow: {workflow.id}")
 
@@ -92,55 +79,54 @@ class TestWorkflowLifecycle:
 
     def test_workflow_status_transitions(self, e2e_client: WorkflowClient,
                                          wait_for_workers,
-                                         workflow_definitions_path: Path):
+                                         workflow_definitions: Dict[str, str]):
         """Test that workflow transitions through expected statuses."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         # Track status transitions
         statuses_seen = set()
         statuses_seen.add(workflow.status)
 
-        # Poll and collect statuses
-        import time
-        for _ in range(30):
-            workflow = e2e_client.get_workflow(workflow.id)
-            statuses_seen.add(workflow.status)
-
-            if workflow.status in [
-                    WorkflowStatus.COMPLETED, WorkflowStatus.FAILED,
-                    WorkflowStatus.CANCELLED
-            ]:
-                break
-
-            time.sleep(1)
+        # Follow the pushed status changes; the stream ends once the
+        # workflow reaches a terminal status
+        try:
+            for _, status in e2e_client.stream_workflow_events([workflow.id],
+                                                               timeout=30):
+                statuses_seen.add(status)
+        except TimeoutError:
+            pass
 
         # Should see at least PENDING/RUNNING and COMPLETED
         assert WorkflowStatus.COMPLETED in statuses_seen
         print(f"✓ Status transitions: {statuses_seen}")
 
     def test_workflow_cancellation(self, e2e_client: WorkflowClient,
-                                   wait_for_workers,
-                                   workflow_definitions_path: Path):
+                                   wait_for_workers, poll_until,
+                                   workflow_definitions: Dict[str, str]):
         """Test cancelling a running workflow."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
-        workflow = e2e_client.submit_and_start_workflow(str(yaml_path))
+        workflow_yaml = workflow_definitions["data-processing-pipeline"]
+        workflow = e2e_client.submit_and_start_workflow_yaml(workflow_yaml)
 
         print(f"\n📋 Submitted workflow for cancellation: {workflow.id}")
 
-        # Give it a moment to start running
-        import time
-        time.sleep(2)
+        # Wait until it is running (or already finished, if it was fast)
+        poll_until(lambda: e2e_client.get_workflow_status(workflow.id) in
+                   TERMINAL_WORKFLOW_STATUSES | {WorkflowStatus.RUNNING},
+                   timeout=5,
+                   initial=0.02)
 
         # Cancel the workflow
         e2e_client.cancel_workflow(workflow.id)
 
-        # Wait a bit for cancellation to process
-        time.sleep(2)
+        # Wait for cancellation to process
+        poll_until(lambda: e2e_client.get_workflow_status(workflow.id) in
+                   TERMINAL_WORKFLOW_STATUSES,
+                   timeout=5)
 
         # Check final status
         workflow = e2e_client.get_workflow(workflow.id)
@@ -154,14 +140,14 @@ class TestWorkflowLifecycle:
 
     def test_get_workflow_details(self, e2e_client: WorkflowClient,
                                   wait_for_workers, workflow_waiter,
-                                  workflow_definitions_path: Path):
+                                  workflow_definitions: Dict[str, str]):
         """Test retrieving workflow details at various stages."""
         wait_for_workers
 
-        yaml_path = workflow_definitions_path / "data-processing-pipeline.yaml"
+        workflow_yaml = workflow_definitions["data-processing-pipeline"]
 
         # Submit workflow
-        workflow = e2e_client.submit_workflow_from_yaml(str(yaml_path))
+        workflow = e2e_client.submit_workflow_yaml(workflow_yaml)
         workflow_id = workflow.id
 
         # Get details before starting
@@ -190,17 +176,15 @@ class TestWorkflowLifecycle:
 
     def test_list_all_workflows(self, e2e_client: WorkflowClient,
                                 wait_for_workers,
-                                workflow_definitions_path: Path):
+                                workflow_definitions: Dict[str, str]):
         """Test listing all workflows."""
         wait_for_workers
 
         # Submit multiple workflows
         workflow_ids = []
-        for yaml_file in [
-                "data-processing-pipeline.yaml", "deployment-pipeline.yaml"
-        ]:
-            yaml_path = workflow_definitions_path / yaml_file
-            workflow = e2e_client.submit_workflow_from_yaml(str(yaml_path))
+        for name in ["data-processing-pipeline", "deployment-pipeline"]:
+            workflow = e2e_client.submit_workflow_yaml(
+                workflow_definitions[name])
             workflow_ids.append(workflow.id)
 
         # List all workflows
@@ -1,20 +1,110 @@
 """Integration test fixtures"""
 import pytest
+from fastapi.testclient import TestClient
+from typing import Any, Generator
 from shared.models import Workflow, Job, Worker
 from shared.enums import JobStatus, JobType, WorkflowStatus, WorkerStatus
 from datetime import datetime, UTC
 
 
+@pytest.fixture(scope="module")
+def client() -> Generator[TestClient, None, None]:
+    """Create a test client for the FastAPI app, shared per module"""
+    # Imported here so the database-only integration tests don't load the app
+    from coordinator.main import app
+
+    # Not entered as a context manager: that would run the app's lifespan,
+    # which connects to whatever DATABASE_URL the test run exports
+    yield TestClient(app)
+
+
+@pytest.fixture
+def lifespan_client(
+        monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient, None, None]:
+    """Create a test client that runs the app's lifespan, without databases
+    
+    Entering the client shares one event loop across requests and sockets.
+    The lifespan connects to DATABASE_URL and REDIS_URL when they are set,
+    so they are unset to keep the coordinator in memory.
+    """
+    from coordinator.main import app
+
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_coordinator_state() -> Generator[None, None, None]:
+    """Drop whatever each test adds to the coordinator's in-memory state
+    
+    Only entries added during the test are removed, so module-scoped
+    fixtures can seed data once for every test in the module to read.
+    """
+    from coordinator.core.state_manager import state_manager
+
+    state = state_manager()
+    stores = (state.workflows, state.workers, state.jobs,
+              state.job_assignments)
+    before = [set(store) for store in stores]
+
+    yield
+
+    for store, keys in zip(stores, before):
+        for key in store.keys() - keys:
+            del store[key]
+
+
+@pytest.fixture(scope="module")
+def shared_workflow(client: TestClient,
+                    workflow_with_jobs) -> Generator[dict[str, Any], None, None]:
+    """A workflow with jobs created once per module, for read-only tests
+    
+    Tests that change the workflow or its jobs must use workflow_with_jobs
+    instead.
+    """
+    workflow = workflow_with_jobs(client)
+    yield workflow
+    client.delete(f"/workflows/{workflow['id']}")
+
+
+@pytest.fixture(scope="module")
+def seeded_workflows(
+        client: TestClient) -> Generator[list[dict[str, Any]], None, None]:
+    """Three job-less workflows created once per module, for read-only tests"""
+    now = datetime.now(UTC).isoformat()
+    workflows = []
+    for i in range(3):
+        response = client.post("/workflows",
+                               json={
+                                   "id": f"wf-seed-{i}",
+                                   "name": f"Workflow {i}",
+                                   "jobs": [],
+                                   "created_at": now,
+                                   "updated_at": now
+                               })
+        assert response.status_code == 200
+        workflows.append(response.json())
+
+    yield workflows
+
+    for workflow in workflows:
+        client.delete(f"/workflows/{workflow['id']}")
+
+
 @pytest.fixture
 def sample_workflow() -> Workflow:
     """Create a sample workflow for testing"""
+    now = datetime.now(UTC)
+
     job1 = Job(
         id="test-job-1",
         type=JobType.VALIDATION,
         parameters={"test": "data"},
         status=JobStatus.PENDING,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=now,
+        updated_at=now,
     )
     
     job2 = Job(
@@ -22,8 +112,8 @@ def sample_workflow() -> Workflow:
         type=JobType.PROCESSING,
         parameters={"process": "data"},
         status=JobStatus.PENDING,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=now,
+        updated_at=now,
     )
     
     return Workflow(
@@ -31,31 +121,33 @@ def sample_workflow() -> Workflow:
         name="Test Workflow",
         status=WorkflowStatus.PENDING,
         jobs=[job1, job2],
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=now,
+        updated_at=now,
     )
 
 
 @pytest.fixture
 def sample_worker() -> Worker:
     """Create a sample worker for testing"""
+    now = datetime.now(UTC)
     return Worker(
         id="test-worker-1",
         status=WorkerStatus.IDLE,
         capabilities=[JobType.VALIDATION, JobType.PROCESSING],
-        last_heartbeat=datetime.now(UTC),
-        registered_at=datetime.now(UTC),
+        last_heartbeat=now,
+        registered_at=now,
     )
 
 
 @pytest.fixture
 def sample_job() -> Job:
     """Create a sample job for testing"""
+    now = datetime.now(UTC)
     return Job(
         id="redis-job-1",
         type=JobType.PROCESSING,
         parameters={"process": "data"},
         status=JobStatus.PENDING,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=now,
+        updated_at=now,
     )
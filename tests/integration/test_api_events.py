@@ -0,0 +1,32 @@
+"""Integration tests for event stream endpoints"""
+import pytest
+from fastapi.testclient import TestClient
+
+from shared.enums import JobType
+
+
+@pytest.mark.integration
+class TestWorkerEvents:
+    """Test the worker event stream"""
+
+    def test_worker_events_push_registration(
+            self, lifespan_client: TestClient) -> None:
+        """Test a registering worker is pushed to event subscribers"""
+        # The entered client shares one event loop across both sockets
+        client = lifespan_client
+        with client.websocket_connect("/events/workers") as events:
+            snapshot = events.receive_json()
+            assert "test-worker-evt" not in snapshot["workers"]
+
+            with client.websocket_connect(
+                    "/workers/test-worker-evt") as websocket:
+                websocket.send_json({
+                    "type": "register",
+                    "capabilities": [JobType.VALIDATION.value]
+                })
+                websocket.receive_json()
+
+                assert "test-worker-evt" in events.receive_json()["workers"]
+
+            # Disconnecting removes the worker again
+            assert "test-worker-evt" not in events.receive_json()["workers"]
@@ -1,17 +1,14 @@
 """Integration tests for Job API endpoints"""
 import pytest
 from fastapi.testclient import TestClient
-from datetime import datetime, UTC
-from typing import Any
+from typing import Any, Mapping
 
-from coordinator.main import app
-from shared.enums import JobStatus, JobType, WorkflowStatus
+from coordinator.core.state_manager import state_manager
+from shared.enums import JobStatus, JobType
 
-
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+# Job IDs in the workflow built by the shared_workflow / workflow_with_jobs
+# fixtures
+_EXPECTED_JOB_IDS = frozenset({"job-1", "job-2", "job-3"})
 
 
 @pytest.mark.integration
@@ -19,30 +16,24 @@ class TestJobEndpoints:
     """Test job API endpoints"""
 
     def test_list_all_jobs(self, client: TestClient,
-                           workflow_with_jobs) -> None:
+                           shared_workflow) -> None:
         """Test listing all jobs across workflows"""
-        workflow = workflow_with_jobs(client)
         response = client.get("/jobs")
 
         assert response.status_code == 200
         jobs = response.json()
-        assert len(jobs) >= 3
-        job_ids = [job["id"] for job in jobs]
-        assert "job-1" in job_ids
-        assert "job-2" in job_ids
-        assert "job-3" in job_ids
+        assert {job["id"] for job in jobs} >= _EXPECTED_JOB_IDS
 
     def test_list_jobs_filtered_by_workflow(self, client: TestClient,
-                                            workflow_with_jobs) -> None:
+                                            shared_workflow) -> None:
         """Test listing jobs filtered by workflow ID"""
-        workflow = workflow_with_jobs(client)
-        workflow_id = workflow["id"]
+        workflow_id = shared_workflow["id"]
         response = client.get(f"/jobs?workflow_id={workflow_id}")
 
         assert response.status_code == 200
         jobs = response.json()
         assert len(jobs) == 3
-        assert all(job["id"] in ["job-1", "job-2", "job-3"] for job in jobs)
+        assert {job["id"] for job in jobs} == _EXPECTED_JOB_IDS
 
     def test_list_jobs_for_nonexistent_workflow(self,
                                                 client: TestClient) -> None:
@@ -53,10 +44,9 @@ class TestJobEndpoints:
         jobs = response.json()
         assert len(jobs) == 0
 
-    def test_get_job(self, client: TestClient, workflow_with_jobs) -> None:
+    def test_get_job(self, client: TestClient, shared_workflow) -> None:
         """Test getting a specific job"""
-        workflow = workflow_with_jobs(client)
-        workflow_id = workflow["id"]
+        workflow_id = shared_workflow["id"]
         response = client.get(f"/jobs/{workflow_id}/job-1")
 
         assert response.status_code == 200
@@ -66,10 +56,9 @@ class TestJobEndpoints:
         assert data["status"] == JobStatus.PENDING
 
     def test_get_job_with_dependencies(self, client: TestClient,
-                                       workflow_with_jobs) -> None:
+                                       shared_workflow) -> None:
         """Test getting job with on_success dependency"""
-        workflow = workflow_with_jobs(client)
-        workflow_id = workflow["id"]
+        workflow_id = shared_workflow["id"]
         response = client.get(f"/jobs/{workflow_id}/job-2")
 
         assert response.status_code == 200
@@ -78,10 +67,9 @@ class TestJobEndpoints:
         assert data["on_success"] == ["job-3"]
 
     def test_get_nonexistent_job(self, client: TestClient,
-                                 workflow_with_jobs) -> None:
+                                 shared_workflow) -> None:
         """Test getting job that doesn't exist"""
-        workflow = workflow_with_jobs(client)
-        workflow_id = workflow["id"]
+        workflow_id = shared_workflow["id"]
         response = client.get(f"/jobs/{workflow_id}/nonexistent-job")
 
         assert response.status_code == 404
@@ -97,25 +85,25 @@ class TestJobEndpoints:
 
     def test_update_job_status(
             self, client: TestClient, workflow_with_jobs,
-            sample_job_parameters: dict[JobType, dict[str, Any]]) -> None:
+            sample_job_parameters: Mapping[JobType, dict[str, Any]]) -> None:
         """Test updating a job's status"""
         workflow = workflow_with_jobs(client)
         workflow_id = workflow["id"]
 
-        # Get current job
-        get_response = client.get(f"/jobs/{workflow_id}/job-1")
-        job_data = get_response.json()
-
-        # Update status
-        job_data["status"] = JobStatus.RUNNING.value
-        job_data["worker_id"] = "worker-123"
-
-        response = client.patch(f"/jobs/{workflow_id}/job-1", json=job_data)
+        # Update status, sending only the changed fields
+        response = client.patch(f"/jobs/{workflow_id}/job-1",
+                                json={
+                                    "status": JobStatus.RUNNING.value,
+                                    "worker_id": "worker-123"
+                                })
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == JobStatus.RUNNING.value
         assert data["worker_id"] == "worker-123"
+        # Fields left out of the update are unchanged
+        assert data["type"] == JobType.VALIDATION.value
+        assert data["parameters"] == sample_job_parameters[JobType.VALIDATION]
 
     def test_update_job_with_result(self, client: TestClient,
                                     workflow_with_jobs) -> None:
@@ -123,15 +111,15 @@ class TestJobEndpoints:
         workflow = workflow_with_jobs(client)
         workflow_id = workflow["id"]
 
-        # Get current job
-        get_response = client.get(f"/jobs/{workflow_id}/job-1")
-        job_data = get_response.json()
-
         # Update with result
-        job_data["status"] = JobStatus.COMPLETED.value
-        job_data["result"] = {"validated": True, "record_count": 150}
-
-        response = client.patch(f"/jobs/{workflow_id}/job-1", json=job_data)
+        response = client.patch(f"/jobs/{workflow_id}/job-1",
+                                json={
+                                    "status": JobStatus.COMPLETED.value,
+                                    "result": {
+                                        "validated": True,
+                                        "record_count": 150
+                                    }
+                                })
 
         assert response.status_code == 200
         data = response.json()
@@ -145,16 +133,14 @@ class TestJobEndpoints:
         workflow = workflow_with_jobs(client)
         workflow_id = workflow["id"]
 
-        # Get current job
-        get_response = client.get(f"/jobs/{workflow_id}/job-2")
-        job_data = get_response.json()
-
         # Update with error
-        job_data["status"] = JobStatus.FAILED.value
-        job_data["error"] = "Connection timeout after 30 seconds"
-        job_data["retry_count"] = 1
-
-        response = client.patch(f"/jobs/{workflow_id}/job-2", json=job_data)
+        response = client.patch(f"/jobs/{workflow_id}/job-2",
+                                json={
+                                    "status": JobStatus.FAILED.value,
+                                    "error":
+                                    "Connection timeout after 30 seconds",
+                                    "retry_count": 1
+                                })
 
         assert response.status_code == 200
         data = response.json()
@@ -162,41 +148,33 @@ class TestJobEndpoints:
         assert data["error"] == "Connection timeout after 30 seconds"
         assert data["retry_count"] == 1
 
-    def test_update_nonexistent_job(
-            self, client: TestClient, workflow_with_jobs,
-            sample_job_parameters: dict[JobType, dict[str, Any]]) -> None:
+    def test_update_job_rejects_null_required_field(
+            self, client: TestClient, workflow_with_jobs) -> None:
+        """Test that a field a job requires can't be updated to null"""
+        workflow = workflow_with_jobs(client)
+        workflow_id = workflow["id"]
+
+        response = client.patch(f"/jobs/{workflow_id}/job-1",
+                                json={"status": None})
+
+        assert response.status_code == 422
+
+    def test_update_nonexistent_job(self, client: TestClient,
+                                    workflow_with_jobs) -> None:
         """Test updating job that doesn't exist"""
         workflow = workflow_with_jobs(client)
         workflow_id = workflow["id"]
-        job_data = {
-            "id": "nonexistent-job",
-            "type": JobType.VALIDATION.value,
-            "parameters": sample_job_parameters[JobType.VALIDATION],
-            "status": JobStatus.RUNNING.value,
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat()
-        }
 
         response = client.patch(f"/jobs/{workflow_id}/nonexistent-job",
-                                json=job_data)
+                                json={"status": JobStatus.RUNNING.value})
 
         assert response.status_code == 404
 
-    def test_update_job_in_nonexistent_workflow(
-            self, client: TestClient,
-            sample_job_parameters: dict[JobType, dict[str, Any]]) -> None:
+    def test_update_job_in_nonexistent_workflow(self,
+                                                client: TestClient) -> None:
         """Test updating job in workflow that doesn't exist"""
-        job_data = {
-            "id": "job-1",
-            "type": JobType.VALIDATION.value,
-            "parameters": sample_job_parameters[JobType.VALIDATION],
-            "status": JobStatus.RUNNING.value,
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat()
-        }
-
         response = client.patch("/jobs/nonexistent-workflow/job-1",
-                                json=job_data)
+                                json={"status": JobStatus.RUNNING.value})
 
         assert response.status_code == 404
 
@@ -210,44 +188,47 @@ class TestJobLifecycle:
         """Test job progressing through different states"""
         workflow = workflow_with_jobs(client)
         workflow_id = workflow["id"]
-        job_id = "job-1"
+        job_url = f"/jobs/{workflow_id}/job-1"
 
         # 1. Job starts as PENDING
-        response = client.get(f"/jobs/{workflow_id}/{job_id}")
-        assert response.json()["status"] == JobStatus.PENDING
+        assert workflow["jobs"][0]["status"] == JobStatus.PENDING
 
         # 2. Assign to worker and mark as RUNNING
-        job_data = response.json()
-        job_data["status"] = JobStatus.RUNNING.value
-        job_data["worker_id"] = "worker-1"
-        response = client.patch(f"/jobs/{workflow_id}/{job_id}", json=job_data)
+        response = client.patch(job_url,
+                                json={
+                                    "status": JobStatus.RUNNING.value,
+                                    "worker_id": "worker-1"
+                                })
         assert response.json()["status"] == JobStatus.RUNNING.value
 
         # 3. Complete with result
-        job_data = response.json()
-        job_data["status"] = JobStatus.COMPLETED.value
-        job_data["result"] = {"success": True}
-        response = client.patch(f"/jobs/{workflow_id}/{job_id}", json=job_data)
-        assert response.json()["status"] == JobStatus.COMPLETED.value
+        response = client.patch(job_url,
+                                json={
+                                    "status": JobStatus.COMPLETED.value,
+                                    "result": {
+                                        "success": True
+                                    }
+                                })
+        data = response.json()
+        assert data["status"] == JobStatus.COMPLETED.value
+        # Fields set by earlier updates are kept
+        assert data["worker_id"] == "worker-1"
 
     def test_job_retry_scenario(self, client: TestClient,
                                 workflow_with_jobs) -> None:
         """Test job retry behavior"""
         workflow = workflow_with_jobs(client)
         workflow_id = workflow["id"]
-        job_id = "job-2"
-
-        # Get job
-        response = client.get(f"/jobs/{workflow_id}/{job_id}")
-        job_data = response.json()
-        initial_retry_count = job_data["retry_count"]
+        job_url = f"/jobs/{workflow_id}/job-2"
+        initial_retry_count = workflow["jobs"][1]["retry_count"]
 
         # Mark as failed with retry
-        job_data["status"] = JobStatus.FAILED.value
-        job_data["error"] = "Temporary network issue"
-        job_data["retry_count"] = initial_retry_count + 1
-
-        response = client.patch(f"/jobs/{workflow_id}/{job_id}", json=job_data)
+        response = client.patch(job_url,
+                                json={
+                                    "status": JobStatus.FAILED.value,
+                                    "error": "Temporary network issue",
+                                    "retry_count": initial_retry_count + 1
+                                })
 
         assert response.status_code == 200
         data = response.json()
@@ -260,21 +241,70 @@ class TestJobLifecycle:
         workflow = workflow_with_jobs(client)
         workflow_id = workflow["id"]
 
-        # Get all jobs for the workflow
-        response = client.get(f"/jobs?workflow_id={workflow_id}")
-        jobs = response.json()
+        # Start from the jobs as created
+        jobs = workflow["jobs"]
         assert len(jobs) == 3
 
-        # Update multiple jobs
-        for i, job in enumerate(jobs):
-            job["status"] = JobStatus.RUNNING.value
-            job["worker_id"] = f"worker-{i+1}"
-            update_response = client.patch(f"/jobs/{workflow_id}/{job['id']}",
-                                           json=job)
-            assert update_response.status_code == 200
+        # Update multiple jobs in one request, sending only what changes
+        updates = [{
+            "id": job["id"],
+            "status": JobStatus.RUNNING.value,
+            "worker_id": f"worker-{i+1}"
+        } for i, job in enumerate(jobs)]
+        update_response = client.patch(f"/jobs/{workflow_id}", json=updates)
+        assert update_response.status_code == 200
+        assert [job["worker_id"] for job in update_response.json()
+                ] == ["worker-1", "worker-2", "worker-3"]
+        assert [job["type"] for job in update_response.json()
+                ] == [job["type"] for job in jobs]
+        assert state_manager().jobs[jobs[0]["id"]].worker_id == "worker-1"
 
         # Verify all updates
         response = client.get(f"/jobs?workflow_id={workflow_id}")
         updated_jobs = response.json()
-        assert all(job["status"] == JobStatus.RUNNING.value
-                   for job in updated_jobs)
+        assert {job["status"] for job in updated_jobs} == {
+            JobStatus.RUNNING.value
+        }
+
+    def test_update_multiple_jobs_with_missing_job(
+            self, client: TestClient, workflow_with_jobs) -> None:
+        """Test a bulk update naming a missing job applies nothing"""
+        workflow = workflow_with_jobs(client)
+        workflow_id = workflow["id"]
+
+        job_id = workflow["jobs"][0]["id"]
+        updates = [{
+            "id": job_id,
+            "status": JobStatus.RUNNING.value
+        }, {
+            "id": "nonexistent-job",
+            "status": JobStatus.RUNNING.value
+        }]
+
+        response = client.patch(f"/jobs/{workflow_id}", json=updates)
+
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"].lower()
+        job = client.get(f"/jobs/{workflow_id}/{job_id}").json()
+        assert job["status"] == JobStatus.PENDING
+
+    def test_update_multiple_jobs_with_duplicate_job(
+            self, client: TestClient, workflow_with_jobs) -> None:
+        """Test a bulk update naming a job twice applies nothing"""
+        workflow = workflow_with_jobs(client)
+        workflow_id = workflow["id"]
+
+        job_id = workflow["jobs"][0]["id"]
+        updates = [{
+            "id": job_id,
+            "status": JobStatus.RUNNING.value
+        }, {
+            "id": job_id,
+            "status": JobStatus.FAILED.value
+        }]
+
+        response = client.patch(f"/jobs/{workflow_id}", json=updates)
+
+        assert response.status_code == 400
+        job = client.get(f"/jobs/{workflow_id}/{job_id}").json()
+        assert job["status"] == JobStatus.PENDING
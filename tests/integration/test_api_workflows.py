@@ -1,17 +1,34 @@
 """Integration tests for Workflow API endpoints"""
+import json
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
+from starlette.websockets import WebSocketDisconnect
 from datetime import datetime, UTC
-from typing import Any
+from typing import Any, Mapping
 
-from coordinator.main import app
+from coordinator.core.state_manager import state_manager
 from shared.enums import WorkflowStatus, JobType
 
+# Timestamp for request bodies; no test here inspects exact timestamps
+_NOW = datetime.now(UTC).isoformat()
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+# The fields every job-less workflow body shares, serialized once as the
+# tail of a JSON object; only the ID and name are encoded per request
+_EMPTY_WORKFLOW_TAIL = json.dumps({
+    "jobs": [],
+    "created_at": _NOW,
+    "updated_at": _NOW
+})[1:]
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _create_empty_workflow(client: TestClient, workflow_id: str,
+                           name: str) -> Response:
+    """Create a workflow without jobs"""
+    body = (f'{{"id": {json.dumps(workflow_id)}, '
+            f'"name": {json.dumps(name)}, {_EMPTY_WORKFLOW_TAIL}')
+    return client.post("/workflows", content=body, headers=_JSON_HEADERS)
 
 
 @pytest.mark.integration
@@ -26,8 +43,8 @@ class TestWorkflowEndpoints:
                                    "id": "wf-test-1",
                                    "name": sample_workflow_config["name"],
                                    "jobs": sample_workflow_config["jobs"],
-                                   "created_at": datetime.now(UTC).isoformat(),
-                                   "updated_at": datetime.now(UTC).isoformat()
+                                   "created_at": _NOW,
+                                   "updated_at": _NOW
                                })
 
         assert response.status_code == 200
@@ -38,54 +55,44 @@ class TestWorkflowEndpoints:
 
     def test_create_duplicate_workflow(self, client: TestClient) -> None:
         """Test creating workflow with duplicate ID"""
-        workflow_data = {
-            "id": "wf-dup",
-            "name": "Duplicate Test",
-            "jobs": [],
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat()
-        }
-
         # Create first time
-        response1 = client.post("/workflows", json=workflow_data)
+        response1 = _create_empty_workflow(client, "wf-dup", "Duplicate Test")
         assert response1.status_code == 200
 
         # Try to create again
-        response2 = client.post("/workflows", json=workflow_data)
+        response2 = _create_empty_workflow(client, "wf-dup", "Duplicate Test")
         assert response2.status_code == 400
         assert "already exists" in response2.json()["detail"].lower()
 
-    def test_list_workflows(self, client: TestClient) -> None:
+    def test_list_workflows(self, client: TestClient,
+                            seeded_workflows: list[dict[str, Any]]) -> None:
         """Test listing all workflows"""
-        # Create some workflows
-        for i in range(3):
-            client.post("/workflows",
-                        json={
-                            "id": f"wf-list-{i}",
-                            "name": f"Workflow {i}",
-                            "jobs": [],
-                            "created_at": datetime.now(UTC).isoformat(),
-                            "updated_at": datetime.now(UTC).isoformat()
-                        })
-
         response = client.get("/workflows")
 
         assert response.status_code == 200
         workflows = response.json()
         assert len(workflows) >= 3
 
+    def test_list_workflows_by_ids(
+            self, client: TestClient,
+            seeded_workflows: list[dict[str, Any]]) -> None:
+        """Test fetching several workflows by ID in one request"""
+        response = client.get("/workflows",
+                              params={"ids": "wf-seed-2,wf-seed-0"})
+
+        assert response.status_code == 200
+        assert [wf["id"] for wf in response.json()
+                ] == ["wf-seed-2", "wf-seed-0"]
+
+        response = client.get("/workflows",
+                              params={"ids": "wf-seed-0,nonexistent"})
+        assert response.status_code == 404
+
     def test_get_workflow(self, client: TestClient) -> None:
         """Test getting a specific workflow"""
         # Create workflow
         workflow_id = "wf-get-test"
-        client.post("/workflows",
-                    json={
-                        "id": workflow_id,
-                        "name": "Get Test",
-                        "jobs": [],
-                        "created_at": datetime.now(UTC).isoformat(),
-                        "updated_at": datetime.now(UTC).isoformat()
-                    })
+        _create_empty_workflow(client, workflow_id, "Get Test")
 
         # Get workflow
         response = client.get(f"/workflows/{workflow_id}")
@@ -94,6 +101,21 @@ class TestWorkflowEndpoints:
         data = response.json()
         assert data["id"] == workflow_id
 
+    def test_get_workflow_status(self, client: TestClient) -> None:
+        """Test getting only a workflow's status"""
+        workflow_id = "wf-status-test"
+        _create_empty_workflow(client, workflow_id, "Status Test")
+
+        response = client.get(f"/workflows/{workflow_id}/status")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "workflow_id": workflow_id,
+            "status": WorkflowStatus.PENDING
+        }
+        assert client.get(
+            "/workflows/nonexistent/status").status_code == 404
+
     def test_get_nonexistent_workflow(self, client: TestClient) -> None:
         """Test getting workflow that doesn't exist"""
         response = client.get("/workflows/nonexistent")
@@ -104,23 +126,19 @@ class TestWorkflowEndpoints:
         """Test deleting a workflow"""
         # Create workflow
         workflow_id = "wf-delete-test"
-        client.post("/workflows",
-                    json={
-                        "id": workflow_id,
-                        "name": "Delete Test",
-                        "jobs": [],
-                        "created_at": datetime.now(UTC).isoformat(),
-                        "updated_at": datetime.now(UTC).isoformat()
-                    })
+        _create_empty_workflow(client, workflow_id, "Delete Test")
 
         # Delete workflow
         response = client.delete(f"/workflows/{workflow_id}")
 
         assert response.status_code == 200
+        assert response.json() == {
+            "message": "Workflow deleted",
+            "workflow_id": workflow_id
+        }
 
-        # Verify deleted
-        get_response = client.get(f"/workflows/{workflow_id}")
-        assert get_response.status_code == 404
+        # Verify deleted, straight from the in-process state
+        assert workflow_id not in state_manager().workflows
 
     def test_delete_nonexistent_workflow(self, client: TestClient) -> None:
         """Test deleting workflow that doesn't exist"""
@@ -128,6 +146,157 @@ class TestWorkflowEndpoints:
 
         assert response.status_code == 404
 
+    def test_status_websocket_sends_terminal_status(
+            self, client: TestClient) -> None:
+        """Test the status stream reports a finished workflow and closes"""
+        workflow_id = "wf-ws-status"
+        _create_empty_workflow(client, workflow_id, "Status Stream Test")
+        client.post(f"/workflows/{workflow_id}/cancel")
+
+        with client.websocket_connect(
+                f"/workflows/{workflow_id}/ws") as websocket:
+            frame = websocket.receive_json()
+            assert frame == {
+                "workflow_id": workflow_id,
+                "status": WorkflowStatus.CANCELLED
+            }
+            with pytest.raises(WebSocketDisconnect):
+                websocket.receive_json()
+
+    def test_status_websocket_nonexistent_workflow(
+            self, client: TestClient) -> None:
+        """Test the status stream rejects unknown workflows"""
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/workflows/nonexistent/ws"):
+                pass
+
+    def test_status_events_sends_terminal_status(self,
+                                                 client: TestClient) -> None:
+        """Test the event stream reports finished workflows and ends"""
+        workflow_ids = ["wf-sse-1", "wf-sse-2"]
+        for workflow_id in workflow_ids:
+            _create_empty_workflow(client, workflow_id, "Status Events Test")
+            client.post(f"/workflows/{workflow_id}/cancel")
+
+        response = client.get("/workflows/events",
+                              params={"ids": ",".join(workflow_ids)})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(
+            "text/event-stream")
+        events = [
+            json.loads(line[len("data: "):])
+            for line in response.text.splitlines() if line.startswith("data: ")
+        ]
+        assert sorted(e["workflow_id"] for e in events) == workflow_ids
+        assert all(e["status"] == WorkflowStatus.CANCELLED for e in events)
+
+    def test_status_events_nonexistent_workflow(self,
+                                                client: TestClient) -> None:
+        """Test the event stream rejects unknown workflows"""
+        response = client.get("/workflows/events",
+                              params={"ids": "nonexistent"})
+
+        assert response.status_code == 404
+
+
+_BATCH_YAML = """
+workflow:
+  name: "batch-pipeline"
+  jobs:
+    - id: "validate"
+      type: "validation"
+"""
+
+_CYCLIC_BATCH_YAML = """
+workflow:
+  name: "cyclic-pipeline"
+  jobs:
+    - id: "first"
+      type: "validation"
+      on_success: "second"
+    - id: "second"
+      type: "processing"
+      on_success: "first"
+"""
+
+
+@pytest.mark.integration
+class TestWorkflowBatch:
+    """Test batch workflow submission"""
+
+    def test_create_workflows_batch(self, client: TestClient) -> None:
+        """Test creating several workflows in one request"""
+        response = client.post("/workflows/batch",
+                               json={"workflows": [_BATCH_YAML] * 3})
+
+        assert response.status_code == 200
+        workflow_ids = response.json()["workflow_ids"]
+        assert len(set(workflow_ids)) == 3
+        response = client.get("/workflows",
+                              params={"ids": ",".join(workflow_ids)})
+        assert response.status_code == 200
+
+    def test_create_workflows_batch_and_start(self,
+                                              client: TestClient) -> None:
+        """Test creating and starting several workflows in one request"""
+        response = client.post("/workflows/batch",
+                               json={
+                                   "workflows": [_BATCH_YAML] * 2,
+                                   "start": True
+                               })
+
+        assert response.status_code == 200
+        workflows = client.get(
+            "/workflows",
+            params={
+                "ids": ",".join(response.json()["workflow_ids"])
+            }).json()
+        assert [wf["status"] for wf in workflows
+                ] == [WorkflowStatus.RUNNING] * 2
+
+    def test_create_workflows_batch_rejects_invalid(
+            self, client: TestClient) -> None:
+        """Test that one invalid definition rejects the whole batch"""
+        before = len(client.get("/workflows").json())
+
+        response = client.post(
+            "/workflows/batch",
+            json={"workflows": [_BATCH_YAML, "not valid yaml: ]["]})
+
+        assert response.status_code == 400
+        assert "index 1" in response.json()["detail"]
+        assert len(client.get("/workflows").json()) == before
+
+    def test_create_workflows_batch_rejects_unstartable(
+            self, client: TestClient) -> None:
+        """Test that one workflow that can't start rejects the whole batch"""
+        before = len(client.get("/workflows").json())
+
+        response = client.post("/workflows/batch",
+                               json={
+                                   "workflows":
+                                   [_BATCH_YAML, _CYCLIC_BATCH_YAML],
+                                   "start": True
+                               })
+
+        assert response.status_code == 400
+        assert "index 1" in response.json()["detail"]
+        assert len(client.get("/workflows").json()) == before
+
+    def test_create_workflows_batch_rejects_duplicate_ids(
+            self, client: TestClient) -> None:
+        """Test that two definitions with the same ID reject the whole batch"""
+        yaml_content = _BATCH_YAML.replace(
+            "workflow:\n", "workflow:\n  id: \"batch-duplicate\"\n")
+
+        response = client.post("/workflows/batch",
+                               json={"workflows": [yaml_content] * 2})
+
+        assert response.status_code == 400
+        assert "indices 0, 1" in response.json()["detail"]
+        assert client.get("/workflows/batch-duplicate").status_code == 404
+
 
 @pytest.mark.integration
 class TestWorkflowWithJobs:
@@ -135,7 +304,7 @@ class TestWorkflowWithJobs:
 
     def test_create_workflow_with_jobs(
             self, client: TestClient,
-            sample_job_parameters: dict[JobType, dict[str, Any]]) -> None:
+            sample_job_parameters: Mapping[JobType, dict[str, Any]]) -> None:
         """Test creating workflow with multiple jobs"""
         workflow_data = {
             "id":
@@ -146,20 +315,20 @@ class TestWorkflowWithJobs:
                 "id": "job-1",
                 "type": JobType.VALIDATION.value,
                 "parameters": sample_job_parameters[JobType.VALIDATION],
-                "created_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat()
+                "created_at": _NOW,
+                "updated_at": _NOW
             }, {
                 "id": "job-2",
                 "type": JobType.PROCESSING.value,
                 "parameters": sample_job_parameters[JobType.PROCESSING],
                 "on_success": ["job-3"],
-                "created_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat()
+                "created_at": _NOW,
+                "updated_at": _NOW
             }],
             "created_at":
-            datetime.now(UTC).isoformat(),
+            _NOW,
             "updated_at":
-            datetime.now(UTC).isoformat()
+            _NOW
         }
 
         response = client.post("/workflows", json=workflow_data)
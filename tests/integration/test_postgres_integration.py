@@ -5,19 +5,25 @@ from shared.models import Workflow, Job, Worker
 from shared.enums import JobStatus, JobType, WorkflowStatus, WorkerStatus
 from datetime import datetime, UTC
 
+# The database tests share one PostgreSQL/Redis instance, so under
+# pytest-xdist they all run on the same worker. They also share the
+# module-scoped postgres_db fixture, so they must run on its event loop.
+pytestmark = [
+    pytest.mark.xdist_group("database"),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_save_and_retrieve_workflow(
     postgres_db: PostgresDB, sample_workflow: Workflow
 ) -> None:
     """Test saving and retrieving a workflow from PostgreSQL"""
-    # Save workflow
-    await postgres_db.save_workflow(sample_workflow)
-    
-    # Save jobs
-    for job in sample_workflow.jobs:
-        await postgres_db.save_job(job, sample_workflow.id)
+    # Save the workflow and its jobs in one transaction
+    async with postgres_db.transaction() as session:
+        await postgres_db.save_workflow(sample_workflow, session)
+        await postgres_db.save_jobs(sample_workflow.jobs, sample_workflow.id,
+                                    session)
     
     # Retrieve workflow
     retrieved = await postgres_db.get_workflow(sample_workflow.id)
@@ -34,7 +40,6 @@ async def test_postgres_save_and_retrieve_workflow(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_update_workflow(
     postgres_db: PostgresDB, sample_workflow: Workflow
 ) -> None:
@@ -44,7 +49,7 @@ async def test_postgres_update_workflow(
     
     # Update workflow status
     sample_workflow.status = WorkflowStatus.RUNNING
-    sample_workflow.current_jobs = ["test-job-1"]
+    sample_workflow.current_jobs = {"test-job-1"}
     await postgres_db.save_workflow(sample_workflow)
     
     # Retrieve and verify
@@ -54,22 +59,22 @@ async def test_postgres_update_workflow(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_list_workflows(postgres_db: PostgresDB) -> None:
     """Test listing all workflows"""
     # Create multiple workflows
     workflows = []
-    for i in range(3):
-        wf = Workflow(
-            id=f"list-test-wf-{i}",
-            name=f"Workflow {i}",
-            status=WorkflowStatus.PENDING,
-            jobs=[],
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
-        workflows.append(wf)
-        await postgres_db.save_workflow(wf)
+    async with postgres_db.transaction() as session:
+        for i in range(3):
+            wf = Workflow(
+                id=f"list-test-wf-{i}",
+                name=f"Workflow {i}",
+                status=WorkflowStatus.PENDING,
+                jobs=[],
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+            )
+            workflows.append(wf)
+            await postgres_db.save_workflow(wf, session)
     
     # List all workflows
     all_workflows = await postgres_db.list_workflows()
@@ -82,7 +87,6 @@ async def test_postgres_list_workflows(postgres_db: PostgresDB) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_delete_workflow(
     postgres_db: PostgresDB, sample_workflow: Workflow
 ) -> None:
@@ -103,7 +107,6 @@ async def test_postgres_delete_workflow(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_save_and_retrieve_job(
     postgres_db: PostgresDB, sample_workflow: Workflow
 ) -> None:
@@ -126,7 +129,6 @@ async def test_postgres_save_and_retrieve_job(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_update_job_status(
     postgres_db: PostgresDB, sample_workflow: Workflow
 ) -> None:
@@ -134,8 +136,9 @@ async def test_postgres_update_job_status(
     job = sample_workflow.jobs[0]
     
     # Save workflow and job
-    await postgres_db.save_workflow(sample_workflow)
-    await postgres_db.save_job(job, sample_workflow.id)
+    async with postgres_db.transaction() as session:
+        await postgres_db.save_workflow(sample_workflow, session)
+        await postgres_db.save_job(job, sample_workflow.id, session)
     
     # Update job
     job.status = JobStatus.RUNNING
@@ -149,7 +152,45 @@ async def test_postgres_update_job_status(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+async def test_postgres_save_jobs_updates_existing(
+    postgres_db: PostgresDB, sample_workflow: Workflow
+) -> None:
+    """Test batch-saving jobs overwrites rows that already exist"""
+    await postgres_db.save_workflow(sample_workflow)
+    await postgres_db.save_jobs(sample_workflow.jobs, sample_workflow.id)
+
+    for job in sample_workflow.jobs:
+        job.status = JobStatus.COMPLETED
+    await postgres_db.save_jobs(sample_workflow.jobs, sample_workflow.id)
+
+    jobs = await postgres_db.list_jobs_by_workflow(sample_workflow.id)
+    assert len(jobs) == 2
+    assert {job.status for job in jobs} == {JobStatus.COMPLETED}
+
+
+@pytest.mark.integration
+async def test_postgres_transaction_rolls_back_on_error(
+    postgres_db: PostgresDB
+) -> None:
+    """Test nothing written in a failed transaction is kept"""
+    workflow = Workflow(
+        id="rollback-test-wf",
+        name="Rollback Test",
+        status=WorkflowStatus.PENDING,
+        jobs=[],
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+
+    with pytest.raises(RuntimeError):
+        async with postgres_db.transaction() as session:
+            await postgres_db.save_workflow(workflow, session)
+            raise RuntimeError("abort")
+
+    assert await postgres_db.get_workflow(workflow.id) is None
+
+
+@pytest.mark.integration
 async def test_postgres_save_and_retrieve_worker(
     postgres_db: PostgresDB, sample_worker: Worker
 ) -> None:
@@ -167,21 +208,21 @@ async def test_postgres_save_and_retrieve_worker(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_list_workers(postgres_db: PostgresDB) -> None:
     """Test listing all workers"""
     # Create multiple workers
     workers = []
-    for i in range(3):
-        worker = Worker(
-            id=f"list-test-worker-{i}",
-            status=WorkerStatus.IDLE,
-            capabilities=[JobType.VALIDATION],
-            last_heartbeat=datetime.now(UTC),
-            registered_at=datetime.now(UTC),
-        )
-        workers.append(worker)
-        await postgres_db.save_worker(worker)
+    async with postgres_db.transaction() as session:
+        for i in range(3):
+            worker = Worker(
+                id=f"list-test-worker-{i}",
+                status=WorkerStatus.IDLE,
+                capabilities=[JobType.VALIDATION],
+                last_heartbeat=datetime.now(UTC),
+                registered_at=datetime.now(UTC),
+            )
+            workers.append(worker)
+            await postgres_db.save_worker(worker, session)
     
     # List all workers
     all_workers = await postgres_db.list_workers()
@@ -194,7 +235,6 @@ async def test_postgres_list_workers(postgres_db: PostgresDB) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_delete_worker(
     postgres_db: PostgresDB, sample_worker: Worker
 ) -> None:
@@ -215,7 +255,6 @@ async def test_postgres_delete_worker(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_job_assignments(postgres_db: PostgresDB) -> None:
     """Test job assignment operations"""
     # Save assignment
@@ -241,7 +280,6 @@ async def test_postgres_job_assignments(postgres_db: PostgresDB) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_postgres_multiple_assignments(postgres_db: PostgresDB) -> None:
     """Test multiple job assignments"""
     # Create multiple assignments
@@ -251,8 +289,7 @@ async def test_postgres_multiple_assignments(postgres_db: PostgresDB) -> None:
         ("job-c", "worker-2"),
     ]
     
-    for job_id, worker_id in assignments:
-        await postgres_db.save_assignment(job_id, worker_id)
+    await postgres_db.save_assignments(assignments)
     
     # List all and verify
     all_assignments = await postgres_db.list_all_assignments()
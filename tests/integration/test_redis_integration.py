@@ -6,6 +6,10 @@ from shared.models import Workflow, Job
 from shared.enums import JobStatus, JobType, WorkflowStatus
 from datetime import datetime, UTC
 
+# The database tests share one PostgreSQL/Redis instance, so under
+# pytest-xdist they all run on the same worker
+pytestmark = pytest.mark.xdist_group("database")
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -88,23 +92,25 @@ async def test_redis_invalidate_job(redis_cache: RedisCache, sample_job: Job) ->
 async def test_redis_job_queue_push_pop(redis_cache: RedisCache) -> None:
     """Test job queue operations"""
     # Push jobs with different priorities
-    await redis_cache.push_job("job-high", priority=10)
-    await redis_cache.push_job("job-low", priority=1)
-    await redis_cache.push_job("job-medium", priority=5)
+    await redis_cache.push_jobs([("job-high", 10), ("job-low", 1),
+                                 ("job-medium", 5)])
     
     # Check queue length
     length = await redis_cache.queue_length()
     assert length >= 3
     
     # Pop jobs (should come out in priority order: lowest score first)
-    job1 = await redis_cache.pop_job()
-    assert job1 == "job-low"  # Priority 1
-    
-    job2 = await redis_cache.pop_job()
-    assert job2 == "job-medium"  # Priority 5
+    jobs = await redis_cache.pop_jobs(3)
+    assert jobs == ["job-low", "job-medium", "job-high"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_job_queue_single_push_pop(redis_cache: RedisCache) -> None:
+    """Test the one-job queue operations"""
+    await redis_cache.push_job("job-single", priority=-1)
     
-    job3 = await redis_cache.pop_job()
-    assert job3 == "job-high"  # Priority 10
+    assert await redis_cache.pop_job() == "job-single"
 
 
 @pytest.mark.integration
@@ -113,8 +119,8 @@ async def test_redis_worker_heartbeat(redis_cache: RedisCache) -> None:
     """Test worker heartbeat tracking"""
     worker_id = "redis-test-worker-1"
     
-    # Mark worker as active with short TTL
-    await redis_cache.mark_worker_active(worker_id, ttl=2)
+    # Mark worker as active
+    await redis_cache.mark_worker_active(worker_id, ttl=30)
     
     # Check worker is active
     is_active = await redis_cache.is_worker_active(worker_id)
@@ -124,6 +130,29 @@ async def test_redis_worker_heartbeat(redis_cache: RedisCache) -> None:
     active_workers = await redis_cache.get_active_workers()
     assert worker_id in active_workers
     
+    # Fast-forward the heartbeat's TTL to 1 ms instead of waiting it out
+    await redis_cache.client.pexpire(redis_cache.heartbeat_key(worker_id),
+                                     1)
+    await asyncio.sleep(0.01)
+    
+    # Check worker is no longer active
+    is_active = await redis_cache.is_worker_active(worker_id)
+    assert is_active is False
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.slow
+async def test_redis_worker_heartbeat_ttl_expires(
+    redis_cache: RedisCache
+) -> None:
+    """Test the TTL given to mark_worker_active expires the heartbeat"""
+    worker_id = "redis-test-worker-ttl"
+    
+    # Mark worker as active with short TTL
+    await redis_cache.mark_worker_active(worker_id, ttl=2)
+    assert await redis_cache.is_worker_active(worker_id) is True
+    
     # Wait for TTL to expire
     await asyncio.sleep(3)
     
@@ -190,10 +219,9 @@ async def test_redis_metrics(redis_cache: RedisCache) -> None:
     # Get initial value
     initial = await redis_cache.get_metric(metric_name)
     
-    # Increment metric
-    await redis_cache.increment_metric(metric_name)
-    await redis_cache.increment_metric(metric_name)
-    await redis_cache.increment_metric(metric_name)
+    # Increment metric; INCR is atomic, so concurrent increments all count
+    await asyncio.gather(*(redis_cache.increment_metric(metric_name)
+                           for _ in range(3)))
     
     # Check final value
     final = await redis_cache.get_metric(metric_name)
@@ -204,9 +232,11 @@ async def test_redis_metrics(redis_cache: RedisCache) -> None:
 @pytest.mark.asyncio
 async def test_redis_empty_queue(redis_cache: RedisCache) -> None:
     """Test popping from empty queue"""
-    # Clear queue first by popping everything
-    while await redis_cache.pop_job():
-        pass
+    await redis_cache.push_job("job-leftover")
+    
+    # Clear the queue
+    await redis_cache.clear_queue()
+    assert await redis_cache.queue_length() == 0
     
     # Pop from empty queue
     result = await redis_cache.pop_job()
@@ -1,4 +1,5 @@
 """Integration tests for StateManager with full database persistence"""
+import asyncio
 import pytest
 import os
 from coordinator.core.state_manager import StateManager, init_state_manager
@@ -6,6 +7,10 @@ from shared.models import Workflow, Job, Worker
 from shared.enums import JobStatus, JobType, WorkflowStatus, WorkerStatus
 from datetime import datetime, UTC
 
+# The database tests share one PostgreSQL/Redis instance, so under
+# pytest-xdist they all run on the same worker
+pytestmark = pytest.mark.xdist_group("database")
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -66,9 +71,10 @@ async def test_three_tier_read_path(
     # Clear both memory and Redis to test PostgreSQL fetch
     full_state_manager.workflows.clear()
     full_state_manager.jobs.clear()
-    await full_state_manager.redis.invalidate_workflow(sample_workflow.id)
-    for job in sample_workflow.jobs:
-        await full_state_manager.redis.invalidate_job(job.id)
+    await asyncio.gather(
+        full_state_manager.redis.invalidate_workflow(sample_workflow.id),
+        *(full_state_manager.redis.invalidate_job(job.id)
+          for job in sample_workflow.jobs))
     
     # Get workflow (should come from PostgreSQL)
     retrieved = await full_state_manager.get_workflow(sample_workflow.id)
@@ -90,8 +96,8 @@ async def test_rebuild_from_db_after_restart(
     state1 = await init_state_manager(database_url, redis_url)
     
     # Add workflow and worker
-    await state1.add_workflow(sample_workflow)
-    await state1.add_worker(sample_worker)
+    await asyncio.gather(state1.add_workflow(sample_workflow),
+                         state1.add_worker(sample_worker))
     await state1.assign_job(sample_workflow.jobs[0].id, sample_worker.id)
     
     # Verify they're in memory
@@ -154,8 +160,8 @@ async def test_job_assignment_persistence(
 ) -> None:
     """Test that job assignments are persisted"""
     # Add workflow and worker
-    await full_state_manager.add_workflow(sample_workflow)
-    await full_state_manager.add_worker(sample_worker)
+    await asyncio.gather(full_state_manager.add_workflow(sample_workflow),
+                         full_state_manager.add_worker(sample_worker))
     
     # Assign job
     job_id = sample_workflow.jobs[0].id
@@ -206,18 +212,17 @@ async def test_list_workflows_after_restart() -> None:
     # Create first instance and add multiple workflows
     state1 = await init_state_manager(database_url, redis_url)
     
-    workflows = []
-    for i in range(3):
-        wf = Workflow(
+    workflows = [
+        Workflow(
             id=f"list-restart-wf-{i}",
             name=f"Restart Test Workflow {i}",
             status=WorkflowStatus.PENDING,
             jobs=[],
             created_at=datetime.now(UTC),
             updated_at=datetime.now(UTC),
-        )
-        workflows.append(wf)
-        await state1.add_workflow(wf)
+        ) for i in range(3)
+    ]
+    await asyncio.gather(*(state1.add_workflow(wf) for wf in workflows))
     
     # Close first instance
     if state1.postgres:
@@ -0,0 +1,183 @@
+"""Unit tests for the coordinator's route functions
+
+These call the route coroutines directly rather than through TestClient,
+so they skip the ASGI stack and response-model validation. They only cover
+the handlers' own logic; the HTTP behaviour is in tests/integration.
+"""
+from typing import Any, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import Response, WebSocket, WebSocketDisconnect
+
+from coordinator.api import health as health_api
+from coordinator.api import workers as workers_api
+from coordinator.api.health import health, root
+from coordinator.api.workers import list_workers, websocket_endpoint
+from coordinator.core.state_manager import StateManager
+from coordinator.core.worker_registry import WorkerRegistry
+from coordinator.core.workflow_engine import WorkflowEngine
+from shared.enums import JobStatus, JobType, WorkerStatus
+from shared.models import Worker
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHealthRoutes:
+    """Test the health check route functions"""
+
+    async def test_root(self) -> None:
+        """Test root health check"""
+        data = await root()
+
+        assert data["service"] == "coordinator"
+        assert data["status"] == "running"
+        assert "timestamp" in data
+
+    async def test_health(self, state_manager: StateManager,
+                          worker_factory: Callable[..., Worker]) -> None:
+        """Test detailed health counts skip offline workers"""
+        await state_manager.add_worker(worker_factory(worker_id="worker-1"))
+        await state_manager.add_worker(
+            worker_factory(worker_id="worker-2", status=WorkerStatus.OFFLINE))
+
+        data = await health(state_manager)
+
+        assert data["status"] == "healthy"
+        assert data["workflows"] == 0
+        assert data["workers"] == 2
+        assert data["active_workers"] == 1
+
+    async def test_health_reuses_recent_counts(
+            self, monkeypatch: pytest.MonkeyPatch,
+            state_manager: StateManager,
+            worker_factory: Callable[..., Worker]) -> None:
+        """Test health counts are cached briefly, then recomputed"""
+        clock = [1000.0]
+        monkeypatch.setattr(health_api, "monotonic", lambda: clock[0])
+        assert (await health(state_manager))["workers"] == 0
+
+        await state_manager.add_worker(worker_factory(worker_id="worker-1"))
+        assert (await health(state_manager))["workers"] == 0
+
+        # Counts are kept per StateManager, so another one isn't served them
+        other = StateManager()
+        await other.add_worker(worker_factory(worker_id="worker-2"))
+        assert (await health(other))["workers"] == 1
+        assert (await health(state_manager))["workers"] == 0
+
+        clock[0] += health_api._COUNTS_TTL
+        assert (await health(state_manager))["workers"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWorkerRoutes:
+    """Test the worker REST route functions"""
+
+    async def test_list_workers(self, state_manager: StateManager,
+                                worker_factory: Callable[..., Worker]) -> None:
+        """Test listing workers sets the list's weak ETag"""
+        await state_manager.add_worker(worker_factory(worker_id="worker-1"))
+        response = Response()
+
+        workers = await list_workers(response, state_manager)
+
+        assert [worker.id for worker in workers] == ["worker-1"]
+        assert response.headers["ETag"].startswith('W/"')
+
+
+async def _run_worker_socket(worker_id: str,
+                             *messages: dict[str, Any]) -> AsyncMock:
+    """Feed messages to the worker WebSocket handler, then disconnect"""
+    websocket = AsyncMock(spec=WebSocket)
+    websocket.receive_json.side_effect = [*messages, WebSocketDisconnect()]
+    await websocket_endpoint(websocket, worker_id)
+    return websocket
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWorkerWebSocketHandler:
+    """Test the worker WebSocket handler's message dispatch"""
+
+    @pytest.fixture
+    def registry(self, monkeypatch: pytest.MonkeyPatch,
+                 state_manager: StateManager) -> AsyncMock:
+        """Point the handler at a fresh state and a mock registry"""
+        registry = AsyncMock(spec=WorkerRegistry)
+        monkeypatch.setattr(workers_api, "state_manager",
+                            lambda: state_manager)
+        monkeypatch.setattr(workers_api, "get_worker_registry",
+                            lambda: registry)
+        return registry
+
+    @pytest.fixture
+    def engine(self, monkeypatch: pytest.MonkeyPatch,
+               registry: AsyncMock) -> AsyncMock:
+        """Point the handler at a mock workflow engine"""
+        engine = AsyncMock(spec=WorkflowEngine)
+        monkeypatch.setattr(workers_api, "get_workflow_engine", lambda: engine)
+        return engine
+
+    async def test_registration(self, registry: AsyncMock,
+                                engine: AsyncMock) -> None:
+        """Test registering a worker is acknowledged"""
+        websocket = await _run_worker_socket(
+            "worker-1", {
+                "type": "register",
+                "capabilities": [JobType.VALIDATION.value]
+            })
+
+        registry.connect.assert_awaited_once_with(websocket, "worker-1")
+        registry.register_worker.assert_awaited_once_with(
+            "worker-1", [JobType.VALIDATION])
+        ack = websocket.send_json.await_args.args[0]
+        assert ack["type"] == "registration_ack"
+        assert ack["status"] == "registered"
+        assert ack["worker_id"] == "worker-1"
+        registry.disconnect.assert_awaited_once_with("worker-1")
+
+    async def test_heartbeat(self, registry: AsyncMock,
+                             engine: AsyncMock) -> None:
+        """Test a heartbeat is recorded and acknowledged"""
+        websocket = await _run_worker_socket("worker-1", {"type": "heartbeat"})
+
+        registry.handle_heartbeat.assert_awaited_once_with("worker-1")
+        ack = websocket.send_json.await_args.args[0]
+        assert ack["type"] == "heartbeat_ack"
+        assert "timestamp" in ack
+
+    @pytest.mark.parametrize("status, handler, result", [
+        pytest.param(JobStatus.COMPLETED, "handle_job_completion",
+                     {"success": True},
+                     id="completed"),
+        pytest.param(JobStatus.FAILED, "handle_job_failure",
+                     {"error": "Processing error"},
+                     id="failed"),
+    ])
+    async def test_job_status(self, engine: AsyncMock, status: JobStatus,
+                              handler: str, result: dict[str, Any]) -> None:
+        """Test a finished job's status is passed to the workflow engine"""
+        await _run_worker_socket(
+            "worker-1", {
+                "type": "job_status",
+                "job_id": "job-123",
+                "status": status.value,
+                "result": result
+            })
+
+        getattr(engine, handler).assert_awaited_once_with("job-123", result)
+        engine.update_job_status.assert_not_awaited()
+
+    async def test_worker_ready(self, engine: AsyncMock,
+                                state_manager: StateManager,
+                                worker_factory: Callable[..., Worker]) -> None:
+        """Test a ready worker is marked idle"""
+        await state_manager.add_worker(
+            worker_factory(worker_id="worker-1", status=WorkerStatus.BUSY))
+
+        await _run_worker_socket("worker-1", {"type": "ready"})
+
+        worker = await state_manager.get_worker("worker-1")
+        assert worker.status == WorkerStatus.IDLE
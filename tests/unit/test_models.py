@@ -0,0 +1,126 @@
+"""Unit tests for shared domain models"""
+from typing import Callable
+
+import pytest
+from pydantic import ValidationError
+
+from shared.enums import JobStatus, JobType
+from shared.models import JobUpdate, Workflow
+
+
+@pytest.mark.unit
+class TestWorkflowJobLookup:
+    """Test looking up jobs within a workflow by ID"""
+
+    def test_get_job(self, workflow_factory: Callable[..., Workflow]) -> None:
+        """Test finding jobs by ID"""
+        workflow = workflow_factory(workflow_id="wf-1")
+
+        assert workflow.get_job("wf-1-job-2") is workflow.jobs[1]
+        assert workflow.get_job_index("wf-1-job-1") == 0
+        assert workflow.get_job("missing") is None
+
+    def test_get_job_after_jobs_change(
+            self, workflow_factory: Callable[..., Workflow],
+            job_factory: Callable) -> None:
+        """Test that lookups stay correct when jobs is modified"""
+        workflow = workflow_factory(workflow_id="wf-1")
+        assert workflow.get_job("wf-1-job-1") is not None
+
+        replacement = job_factory(job_id="wf-1-job-1",
+                                  job_type=JobType.CLEANUP)
+        workflow.jobs[0] = replacement
+        workflow.jobs.insert(0, job_factory(job_id="wf-1-job-0"))
+
+        assert workflow.get_job("wf-1-job-1") is replacement
+        assert workflow.get_job_index("wf-1-job-0") == 0
+
+    def test_get_job_after_job_replaced_in_place(
+            self, workflow_factory: Callable[..., Workflow],
+            job_factory: Callable) -> None:
+        """Test finding a job that took another job's place"""
+        workflow = workflow_factory(workflow_id="wf-1")
+        assert workflow.get_job("wf-1-job-1") is not None
+
+        replacement = job_factory(job_id="wf-1-job-new")
+        workflow.jobs[0] = replacement
+
+        assert workflow.get_job("wf-1-job-new") is replacement
+        assert workflow.get_job("wf-1-job-1") is None
+
+    def test_get_job_after_jobs_reassigned(
+            self, workflow_factory: Callable[..., Workflow],
+            job_factory: Callable) -> None:
+        """Test finding jobs after jobs is replaced by a same-length list"""
+        workflow = workflow_factory(workflow_id="wf-1")
+        assert workflow.get_job("wf-1-job-1") is not None
+
+        workflow.jobs = [
+            job_factory(job_id=f"wf-2-job-{i}")
+            for i in range(len(workflow.jobs))
+        ]
+
+        assert workflow.get_job_index("wf-2-job-1") == 1
+        assert workflow.get_job("wf-1-job-1") is None
+
+    def test_missing_job_does_not_rebuild_index(
+            self, workflow_factory: Callable[..., Workflow]) -> None:
+        """Test that looking up a job from another workflow reuses the index"""
+        workflow = workflow_factory(workflow_id="wf-1")
+        workflow.get_job("wf-1-job-1")
+        positions = workflow.__dict__["_job_positions"]
+
+        for _ in range(3):
+            assert workflow.get_job("wf-2-job-1") is None
+
+        assert workflow.__dict__["_job_positions"] is positions
+
+    def test_lookup_index_is_not_serialized(
+            self, workflow_factory: Callable[..., Workflow]) -> None:
+        """Test that the cached index doesn't leak into dumps or equality"""
+        workflow = workflow_factory(workflow_id="wf-1")
+        copy = Workflow.model_validate(workflow.model_dump())
+        workflow.get_job("wf-1-job-1")
+
+        assert "_job_positions" not in workflow.model_dump()
+        assert workflow == copy
+
+
+@pytest.mark.unit
+class TestWorkflowJobSets:
+    """Test the set-typed job tracking fields"""
+
+    def test_job_sets_serialize_sorted(
+            self, workflow_factory: Callable[..., Workflow]) -> None:
+        """Test that job ID sets dump as sorted lists and load back as sets"""
+        workflow = workflow_factory(workflow_id="wf-1")
+        workflow.completed_jobs.update({"job-b", "job-a"})
+
+        data = workflow.model_dump(mode="json")
+        assert data["completed_jobs"] == ["job-a", "job-b"]
+        assert data["current_jobs"] == []
+
+        restored = Workflow.model_validate_json(workflow.model_dump_json())
+        assert restored.completed_jobs == {"job-a", "job-b"}
+
+
+@pytest.mark.unit
+class TestJobUpdate:
+    """Test partial job updates"""
+
+    def test_only_set_fields_are_dumped(self) -> None:
+        """Test that omitted fields don't appear in the changes"""
+        update = JobUpdate.model_validate({
+            "status": "running",
+            "worker_id": None
+        })
+
+        assert update.model_dump(exclude_unset=True) == {
+            "status": JobStatus.RUNNING,
+            "worker_id": None
+        }
+
+    def test_required_job_fields_reject_null(self) -> None:
+        """Test that fields a Job requires can be omitted but not nulled"""
+        with pytest.raises(ValidationError):
+            JobUpdate.model_validate({"status": None})
@@ -1,7 +1,7 @@
 """Unit tests for Scheduler"""
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from typing import Callable
+from unittest.mock import AsyncMock
+from typing import Any, Callable
 
 from coordinator.core.scheduler import Scheduler
 from coordinator.core.state_manager import StateManager
@@ -21,14 +21,14 @@ class TestScheduler:
 
     async def test_send_message_success(self, scheduler: Scheduler,
                                         state_manager: StateManager,
-                                        mock_websocket: MagicMock) -> None:
+                                        mock_websocket: Any) -> None:
         """Test sending message to connected worker"""
         state_manager.active_connections["worker-1"] = mock_websocket
 
         result = await scheduler.send_message("worker-1", {"type": "test"})
 
         assert result is True
-        mock_websocket.send_json.assert_called_once()
+        assert len(mock_websocket.sent) == 1
 
     async def test_send_message_worker_not_connected(
             self, scheduler: Scheduler) -> None:
@@ -40,7 +40,7 @@ class TestScheduler:
     async def test_assign_job_success(self, scheduler: Scheduler,
                                       state_manager: StateManager,
                                       worker_factory: Callable[..., Worker],
-                                      mock_websocket: MagicMock) -> None:
+                                      mock_websocket: Any) -> None:
         """Test successful job assignment"""
         # Setup worker
         worker = worker_factory(worker_id="worker-1",
@@ -111,7 +111,7 @@ class TestScheduler:
 
     async def test_broadcast_message(self, scheduler: Scheduler,
                                      state_manager: StateManager,
-                                     mock_websocket: MagicMock) -> None:
+                                     mock_websocket: Any) -> None:
         """Test broadcasting message to all workers"""
         # Setup multiple workers
         ws1 = AsyncMock()
@@ -41,6 +41,51 @@ class TestStateManager:
         assert await state_manager.get_workflow("wf-1") is None
         assert len(state_manager.list_workflows()) == 0
 
+    async def test_remove_workflow_drops_jobs(
+            self, state_manager: StateManager,
+            workflow_factory: Callable[..., Workflow]) -> None:
+        """Test that removing a workflow also releases its jobs"""
+        workflow = workflow_factory(workflow_id="wf-1")
+        await state_manager.add_workflow(workflow)
+
+        await state_manager.remove_workflow("wf-1")
+
+        assert state_manager.list_jobs() == []
+
+    async def test_workflow_changed_fires_once(
+            self, state_manager: StateManager) -> None:
+        """Test that a notification wakes current waiters only"""
+        event = state_manager.workflow_changed("wf-1")
+        assert state_manager.workflow_changed("wf-1") is event
+
+        state_manager.notify_workflow_changed("wf-1")
+
+        assert event.is_set()
+        assert not state_manager.workflow_changed("wf-1").is_set()
+
+    async def test_watching_workflows_drops_unused_events(
+            self, state_manager: StateManager) -> None:
+        """Test that the last watcher to leave drops the workflow's event"""
+        with state_manager.watching_workflows(["wf-1"]):
+            with state_manager.watching_workflows(["wf-1"]):
+                event = state_manager.workflow_changed("wf-1")
+            # Another watcher may still be waiting on the event
+            assert state_manager.workflow_changed("wf-1") is event
+
+        assert state_manager.workflow_changed("wf-1") is not event
+
+    async def test_workers_changed_fires_on_add_and_remove(
+            self, state_manager: StateManager,
+            worker_factory: Callable[..., Worker]) -> None:
+        """Test that worker joins and leaves wake worker watchers"""
+        joined = state_manager.workers_changed()
+        await state_manager.add_worker(worker_factory(worker_id="worker-1"))
+        assert joined.is_set()
+
+        left = state_manager.workers_changed()
+        await state_manager.remove_worker("worker-1")
+        assert left.is_set()
+
     async def test_add_worker(self, state_manager: StateManager,
                         worker_factory: Callable[..., Worker]) -> None:
         """Test adding a worker"""
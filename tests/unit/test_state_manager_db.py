@@ -1,6 +1,8 @@
 """Quick validation test for database integration"""
 import pytest
-from coordinator.core.state_manager import StateManager
+from coordinator.core.state_manager import (StateManager, _job_from_model,
+                                            _workflow_from_model)
+from coordinator.db.models import JobModel, WorkflowModel
 from shared.models import Workflow, Job
 from shared.enums import JobStatus, JobType, WorkflowStatus
 from datetime import datetime, UTC
@@ -101,5 +103,42 @@ async def test_state_manager_has_async_methods():
     assert retrieved.id == "async-workflow-1"
 
 
+@pytest.mark.unit
+def test_rebuild_workflow_from_db_rows():
+    """Test that persisted rows round-trip back into equivalent models"""
+    now = datetime.now(UTC)
+    job_row = JobModel(id="row-job-1",
+                       workflow_id="row-workflow-1",
+                       type=JobType.PROCESSING,
+                       parameters={"key": "value"},
+                       status=JobStatus.COMPLETED,
+                       worker_id="worker-1",
+                       result={"ok": True},
+                       error=None,
+                       retry_count=1,
+                       max_retries=3,
+                       on_success=[],
+                       on_failure=[],
+                       always_run=False,
+                       created_at=now,
+                       updated_at=now)
+    workflow_row = WorkflowModel(id="row-workflow-1",
+                                 name="Row Workflow",
+                                 status=WorkflowStatus.COMPLETED,
+                                 current_jobs=[],
+                                 completed_jobs=["row-job-1"],
+                                 failed_jobs=[],
+                                 created_at=now,
+                                 updated_at=now)
+
+    job = _job_from_model(job_row)
+    workflow = _workflow_from_model(workflow_row, [job])
+
+    expected_job = Job.model_validate(job.model_dump())
+    assert job == expected_job
+    assert workflow == Workflow.model_validate(workflow.model_dump())
+    assert workflow.jobs[0].status == JobStatus.COMPLETED
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -169,6 +169,29 @@ workflow:
         parse_yaml_workflow(yaml_content)
 
 
+@pytest.mark.unit
+def test_parse_workflow_invalid_on_failure_reference():
+    """Test that an invalid on_failure reference is reported against on_failure"""
+    yaml_content = """
+workflow:
+  name: "test"
+  jobs:
+    - id: "job-1"
+      type: "processing"
+      parameters: {}
+      on_success: "job-2"
+      on_failure: "non-existent-job"
+
+    - id: "job-2"
+      type: "cleanup"
+      parameters: {}
+"""
+
+    with pytest.raises(WorkflowDefinitionError,
+                       match="non-existent job in on_failure"):
+        parse_yaml_workflow(yaml_content)
+
+
 @pytest.mark.unit
 def test_parse_workflow_duplicate_job_ids():
     """Test that duplicate job IDs raise error"""
@@ -185,10 +208,45 @@ workflow:
       parameters: {}
 """
 
-    with pytest.raises(WorkflowDefinitionError, match="Duplicate job ID"):
+    with pytest.raises(WorkflowDefinitionError,
+                       match=r"Duplicate job ID .* \(indices 0, 1\)"):
         parse_yaml_workflow(yaml_content)
 
 
+@pytest.mark.unit
+def test_parse_same_yaml_twice_gives_independent_workflows():
+    """Test that repeated parses of one definition share no state"""
+    yaml_content = """
+workflow:
+  name: "repeated-workflow"
+  jobs:
+    - id: "validate"
+      type: "validation"
+      parameters:
+        key: "value"
+      on_success: "process"
+    - id: "process"
+      type: "processing"
+      parameters: {}
+"""
+
+    first = parse_yaml_workflow(yaml_content)
+    second = parse_yaml_workflow(yaml_content)
+
+    assert first.id != second.id
+    assert first.jobs[0].id == f"{first.id}:validate"
+    assert second.jobs[0].id == f"{second.id}:validate"
+    assert second.jobs[0].on_success == [f"{second.id}:process"]
+
+    first.jobs[0].parameters["key"] = "changed"
+    first.jobs[0].status = JobStatus.COMPLETED
+    assert second.jobs[0].parameters == {"key": "value"}
+    assert second.jobs[0].status == JobStatus.PENDING
+    assert parse_yaml_workflow(yaml_content).jobs[0].parameters == {
+        "key": "value"
+    }
+
+
 @pytest.mark.unit
 def test_parse_workflow_invalid_yaml():
     """Test that invalid YAML raises error"""
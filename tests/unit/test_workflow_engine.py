@@ -167,7 +167,7 @@ async def test_handle_job_completion_triggers_next(
     """Test that completing a job triggers the next job"""
     # Setup workflow in running state
     simple_workflow.status = WorkflowStatus.RUNNING
-    simple_workflow.current_jobs = ["job1"]
+    simple_workflow.current_jobs = {"job1"}
     simple_workflow.jobs[0].status = JobStatus.RUNNING
 
     await state_manager.add_workflow(simple_workflow)
@@ -201,8 +201,8 @@ async def test_handle_job_completion_workflow_completes(
     """Test workflow completion when last job finishes"""
     # Setup workflow with job1 completed and job2 running
     simple_workflow.status = WorkflowStatus.RUNNING
-    simple_workflow.current_jobs = ["job2"]
-    simple_workflow.completed_jobs = ["job1"]
+    simple_workflow.current_jobs = {"job2"}
+    simple_workflow.completed_jobs = {"job1"}
     simple_workflow.jobs[0].status = JobStatus.COMPLETED
     simple_workflow.jobs[1].status = JobStatus.RUNNING
 
@@ -236,7 +236,7 @@ async def test_handle_job_failure_retry(workflow_engine: WorkflowEngine,
     """Test job retry on failure"""
     # Setup
     simple_workflow.status = WorkflowStatus.RUNNING
-    simple_workflow.current_jobs = ["job1"]
+    simple_workflow.current_jobs = {"job1"}
     simple_workflow.jobs[0].status = JobStatus.RUNNING
     simple_workflow.jobs[0].max_retries = 3
     simple_workflow.jobs[0].retry_count = 0
@@ -270,7 +270,7 @@ async def test_handle_job_failure_max_retries(workflow_engine: WorkflowEngine,
     """Test job failure after max retries triggers failure path"""
     # Setup
     branching_workflow.status = WorkflowStatus.RUNNING
-    branching_workflow.current_jobs = ["job1"]
+    branching_workflow.current_jobs = {"job1"}
     branching_workflow.jobs[0].status = JobStatus.RUNNING
     branching_workflow.jobs[0].max_retries = 2
     branching_workflow.jobs[0].retry_count = 2  # Already at max
@@ -311,7 +311,7 @@ async def test_always_run_jobs_on_failure(workflow_engine: WorkflowEngine,
     """Test that always_run jobs execute even when workflow fails"""
     # Setup workflow with failed job
     branching_workflow.status = WorkflowStatus.RUNNING
-    branching_workflow.failed_jobs = ["job1"]
+    branching_workflow.failed_jobs = {"job1"}
     branching_workflow.jobs[0].status = JobStatus.FAILED
 
     await state_manager.add_workflow(branching_workflow)
@@ -345,7 +345,7 @@ async def test_cancel_workflow(workflow_engine: WorkflowEngine,
     """Test cancelling a running workflow"""
     # Setup running workflow
     simple_workflow.status = WorkflowStatus.RUNNING
-    simple_workflow.current_jobs = ["job1"]
+    simple_workflow.current_jobs = {"job1"}
     simple_workflow.jobs[0].status = JobStatus.RUNNING
 
     await state_manager.add_workflow(simple_workflow)
@@ -394,7 +394,7 @@ async def test_can_schedule_job(workflow_engine: WorkflowEngine,
     assert can_schedule is False
 
     # Mark job1 completed
-    simple_workflow.completed_jobs.append("job1")
+    simple_workflow.completed_jobs.add("job1")
 
     # Now job2 can be scheduled
     can_schedule = workflow_engine._can_schedule_job(simple_workflow, "job2")
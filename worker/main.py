@@ -26,6 +26,15 @@ log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=getattr(logging, log_level, logging.INFO))
 logger = logging.getLogger(__name__)
 
+# Job implementation for each job type. JobType is a StrEnum, so the raw type
+# strings received over the wire look up directly.
+_JOB_CLASSES = {
+    JobType.VALIDATION: validation.Validation,
+    JobType.PROCESSING: processing.Processing,
+    JobType.INTEGRATION: integration.Integration,
+    JobType.CLEANUP: cleanup.Cleanup,
+}
+
 
 class WorkerNode:
     """Worker node that executes jobs from the coordinator."""
@@ -92,22 +101,10 @@ class WorkerNode:
         await self.send_job_status(job_id, JobStatus.RUNNING.value)
 
         try:
-            result = None
-
-            if job_type == JobType.VALIDATION.value:
-                job = validation.Validation(parameters)
-                result = await job.execute()
-            elif job_type == JobType.PROCESSING.value:
-                job = processing.Processing(parameters)
-                result = await job.execute()
-            elif job_type == JobType.INTEGRATION.value:
-                job = integration.Integration(parameters)
-                result = await job.execute()
-            elif job_type == JobType.CLEANUP.value:
-                job = cleanup.Cleanup(parameters)
-                result = await job.execute()
-            else:
+            job_class = _JOB_CLASSES.get(job_type)
+            if job_class is None:
                 raise ValueError(f"Unknown job type: {job_type}")
+            result = await job_class(parameters).execute()
 
             # Send completion status
             await self.send_job_status(job_id, JobStatus.COMPLETED.value,